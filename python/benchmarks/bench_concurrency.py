@@ -0,0 +1,153 @@
+"""Benchmark of the adaptive concurrency limiter against an overloaded server.
+
+Starts an aiohttp server on localhost that simulates a backend with a fixed
+number of workers and a short admission queue: requests beyond
+``workers + queue`` are shed immediately with 503. A burst of concurrent GETs
+is sent through :class:`newnanmanager.NewNanManagerClient` with and without
+``ClientConfig.concurrency_limit``, and the number of shed requests, failed
+calls, wall time and the limiter's final limit are reported.
+
+Retries are disabled so every shed request is visible as a failed call.
+
+Usage::
+
+    python benchmarks/bench_concurrency.py [requests] [workers] [queue]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from newnanmanager import (  # noqa: E402
+    ClientConfig,
+    ConcurrencyLimitConfig,
+    NewNanManagerClient,
+)
+
+# 每个请求在服务端占用一个工作者的时间（秒）
+_SERVICE_TIME = 0.005
+
+
+class _OverloadedServer:
+    """固定工作者数量、排队超过上限时返回503的服务端."""
+
+    def __init__(self, workers: int, queue: int) -> None:
+        self.workers = asyncio.Semaphore(workers)
+        self.capacity = workers + queue
+        self.admitted = 0
+        self.served = 0
+        self.shed = 0
+
+    async def player(self, request: web.Request) -> web.Response:
+        if self.admitted >= self.capacity:
+            self.shed += 1
+            return web.json_response({"detail": "overloaded"}, status=503)
+        self.admitted += 1
+        try:
+            async with self.workers:
+                await asyncio.sleep(_SERVICE_TIME)
+        finally:
+            self.admitted -= 1
+        self.served += 1
+        player_id = int(request.match_info["id"])
+        return web.json_response(
+            {
+                "id": player_id,
+                "name": f"player{player_id}",
+                "in_qq_group": True,
+                "in_qq_guild": False,
+                "in_discord": False,
+                "ban_mode": 0,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+        )
+
+
+async def _start_server(server: _OverloadedServer) -> Tuple[web.AppRunner, int]:
+    app = web.Application()
+    app.router.add_get("/api/v1/players/{id}", server.player)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, port
+
+
+async def _measure(
+    requests: int,
+    workers: int,
+    queue: int,
+    concurrency_limit: Optional[ConcurrencyLimitConfig],
+) -> Dict[str, float]:
+    server = _OverloadedServer(workers, queue)
+    runner, port = await _start_server(server)
+    config = ClientConfig(
+        base_url=f"http://127.0.0.1:{port}",
+        token="bench",
+        max_retries=0,
+        coalesce_requests=False,
+        connection_pool_size=requests,
+        connection_pool_size_per_host=requests,
+        concurrency_limit=concurrency_limit,
+    )
+    failed = 0
+    try:
+        async with NewNanManagerClient.from_config(config) as client:
+
+            async def call(player_id: int) -> None:
+                nonlocal failed
+                try:
+                    await client.players.get_player(player_id)
+                except Exception:
+                    failed += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(call(i) for i in range(1, requests + 1)))
+            elapsed = time.perf_counter() - started
+            limiter = client.concurrency_limiter
+            limit = limiter.current_limit if limiter is not None else 0
+    finally:
+        await runner.cleanup()
+    return {
+        "shed": server.shed,
+        "failed": failed,
+        "elapsed": elapsed,
+        "limit": limit,
+    }
+
+
+async def _main(requests: int, workers: int, queue: int) -> None:
+    print(
+        f"{requests} concurrent GETs, server with {workers} workers "
+        f"and a queue of {queue} ({_SERVICE_TIME * 1000:.0f}ms per request)"
+    )
+    print(f"  {'variant':<20} {'503s':>6} {'failed':>7} {'time':>8} {'limit':>6}")
+    for label, concurrency_limit in (
+        ("no limiter", None),
+        ("adaptive limiter", ConcurrencyLimitConfig()),
+    ):
+        result = await _measure(requests, workers, queue, concurrency_limit)
+        limit = f"{result['limit']:.0f}" if concurrency_limit is not None else "-"
+        print(
+            f"  {label:<20} {result['shed']:>6.0f} {result['failed']:>7.0f} "
+            f"{result['elapsed']:>7.2f}s {limit:>6}"
+        )
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    queue = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    asyncio.run(_main(requests, workers, queue))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Microbenchmark for request-path logging in HttpClient.
+
+Compares the old eager f-string ``logger.debug`` against the guarded, lazy
+logging used by :class:`newnanmanager.http_client.HttpClient`, with DEBUG
+disabled and enabled, for small and large response bodies.
+
+Usage::
+
+    python benchmarks/bench_logging.py
+"""
+
+import json
+import logging
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from newnanmanager.config import ClientConfig  # noqa: E402
+from newnanmanager.http_client import HttpClient  # noqa: E402
+from newnanmanager.http_client import logger as http_logger  # noqa: E402
+
+
+class _FormattingHandler(logging.Handler):
+    """格式化日志记录后丢弃，模拟真实输出的格式化开销."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+def _body(players: int) -> bytes:
+    return json.dumps(
+        {
+            "items": [
+                {"id": i, "name": f"player{i}", "qq": str(10000 + i), "town_id": None}
+                for i in range(players)
+            ],
+            "total": players,
+        }
+    ).encode()
+
+
+def _run(label: str, stmt, number: int) -> None:
+    seconds = min(timeit.repeat(stmt, number=number, repeat=5)) / number
+    print(f"  {label:<28} {seconds * 1e9:>12.0f} ns/op")
+
+
+def _bench_body(
+    client: HttpClient, response: SimpleNamespace, raw: bytes, number: int
+) -> None:
+    print(f"response body: {len(raw)} bytes")
+
+    def eager() -> None:
+        http_logger.debug(f"Response status: {response.status}, body: {raw!r}")
+
+    def guarded() -> None:
+        if http_logger.isEnabledFor(logging.DEBUG):
+            client._log_response(response, raw, True)  # type: ignore[arg-type]
+
+    http_logger.setLevel(logging.INFO)
+    _run("no logging", lambda: None, number)
+    _run("eager f-string, disabled", eager, number)
+    _run("guarded, disabled", guarded, number)
+
+    http_logger.setLevel(logging.DEBUG)
+    _run("eager f-string, enabled", eager, number)
+    _run("guarded, enabled, capped", guarded, number)
+
+
+def main() -> None:
+    client = HttpClient(ClientConfig(base_url="http://localhost", token="bench"))
+    response = SimpleNamespace(
+        method="GET", url="http://localhost/api/v1/players", status=200
+    )
+    handler = _FormattingHandler()
+    http_logger.addHandler(handler)
+    http_logger.propagate = False
+
+    for players in (10, 10000):
+        _bench_body(client, response, _body(players), 200000 if players < 1000 else 200)
+
+
+if __name__ == "__main__":
+    main()
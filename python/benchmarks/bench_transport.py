@@ -0,0 +1,141 @@
+"""Benchmark of TransportConfig knobs against a local server.
+
+Starts an aiohttp server on localhost and measures request latency through
+:class:`newnanmanager.NewNanManagerClient` with different connector settings,
+both for sequential calls (connection reuse, DNS caching) and for concurrent
+bursts (pool growth, keep-alive expiry between bursts).
+
+Usage::
+
+    python benchmarks/bench_transport.py [requests]
+"""
+
+import asyncio
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from newnanmanager import (  # noqa: E402
+    ClientConfig,
+    NewNanManagerClient,
+    TransportConfig,
+)
+
+_PLAYER = {
+    "id": 1,
+    "name": "player1",
+    "in_qq_group": True,
+    "in_qq_guild": False,
+    "in_discord": False,
+    "ban_mode": 0,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+_VARIANTS: List[Tuple[str, TransportConfig]] = [
+    ("default", TransportConfig()),
+    ("force_close", TransportConfig(force_close=True)),
+    ("no dns cache", TransportConfig(use_dns_cache=False)),
+    ("dns cache forever", TransportConfig(ttl_dns_cache=None)),
+    ("ipv4 only", TransportConfig(ip_version=4)),
+    ("no happy eyeballs", TransportConfig(happy_eyeballs_delay=None)),
+    ("keepalive 0.05s", TransportConfig(keepalive_timeout=0.05)),
+    ("tcp keepalive", TransportConfig(tcp_keepalive=True)),
+    (
+        "small rcvbuf",
+        TransportConfig(socket_options=((socket.SOL_SOCKET, socket.SO_RCVBUF, 4096),)),
+    ),
+]
+
+
+async def _player(request: web.Request) -> web.Response:
+    return web.json_response(_PLAYER)
+
+
+async def _start_server() -> Tuple[web.AppRunner, int]:
+    app = web.Application()
+    app.router.add_get("/api/v1/players/{id}", _player)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, port
+
+
+async def _measure(
+    base_url: str, transport: TransportConfig, requests: int
+) -> Dict[str, float]:
+    config = ClientConfig(
+        base_url=base_url,
+        token="bench",
+        coalesce_requests=False,
+        transport=transport,
+    )
+    sequential: List[float] = []
+    burst: List[float] = []
+    async with NewNanManagerClient.from_config(config) as client:
+        await client.players.get_player(1)  # 排除首次建连
+
+        for _ in range(requests):
+            started = time.perf_counter()
+            await client.players.get_player(1)
+            sequential.append(time.perf_counter() - started)
+
+        async def timed() -> None:
+            started = time.perf_counter()
+            await client.players.get_player(1)
+            burst.append(time.perf_counter() - started)
+
+        # 突发之间的间隔长于短keep-alive超时，空闲连接会被回收
+        for _ in range(max(requests // 50, 1)):
+            await asyncio.gather(*(timed() for _ in range(50)))
+            await asyncio.sleep(0.1)
+
+    sequential.sort()
+    burst.sort()
+    return {
+        "seq_p50": statistics.median(sequential),
+        "seq_p99": sequential[int(len(sequential) * 0.99) - 1],
+        "burst_p50": statistics.median(burst),
+        "burst_p99": burst[int(len(burst) * 0.99) - 1],
+    }
+
+
+async def _main(requests: int) -> None:
+    runner, port = await _start_server()
+    # 使用 localhost 而不是 127.0.0.1，使DNS缓存相关的配置生效
+    base_url = f"http://localhost:{port}"
+    print(f"{requests} sequential requests, bursts of 50 concurrent requests")
+    print(
+        f"  {'variant':<20} {'seq p50':>10} {'seq p99':>10} "
+        f"{'burst p50':>10} {'burst p99':>10}"
+    )
+    try:
+        for label, transport in _VARIANTS:
+            result = await _measure(base_url, transport, requests)
+            print(
+                f"  {label:<20}"
+                + "".join(
+                    f" {result[key] * 1e6:>8.0f}us"
+                    for key in ("seq_p50", "seq_p99", "burst_p50", "burst_p99")
+                )
+            )
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    asyncio.run(_main(requests))
+
+
+if __name__ == "__main__":
+    main()
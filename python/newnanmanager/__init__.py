@@ -11,16 +11,42 @@ from ._version import (
     __url__,
     __version__,
 )
+from .balancer import LoadBalancer, Replica
+from .cache import CacheStats
+from .circuit import CircuitBreaker, CircuitBreakers, CircuitState
 from .client import NewNanManagerClient
-from .config import ClientConfig
+from .codec import DecodeMode, JsonCodec, register_codec
+from .concurrency import AdaptiveConcurrencyLimiter
+from .config import (
+    CacheConfig,
+    CachePolicy,
+    CircuitBreakerConfig,
+    ClientConfig,
+    ConcurrencyLimitConfig,
+    HedgeConfig,
+    LoadBalanceConfig,
+    RateLimitConfig,
+    RetryConfig,
+    TimeoutProfile,
+    TransportConfig,
+)
 from .exceptions import (
     ApiErrorException,
+    CircuitOpenException,
     ConnectionException,
     HttpException,
     NewNanManagerException,
     TimeoutException,
 )
+from .exporter import MetricsServer, render_metrics
+from .heartbeat import HeartbeatPayloadBuilder, HeartbeatScheduler
+from .hooks import HookEvent, Hooks, RequestInfo
 from .models import *
+from .pagination import PageSizeTuner, scan_all
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .slowlog import SlowRequestLog
+from .timeouts import deadline, timeout_profile
 
 __all__ = [
     # Version info
@@ -33,10 +59,45 @@ __all__ = [
     # Main classes
     "NewNanManagerClient",
     "ClientConfig",
+    "CacheConfig",
+    "CachePolicy",
+    "RateLimitConfig",
+    "RateLimiter",
+    "ConcurrencyLimitConfig",
+    "AdaptiveConcurrencyLimiter",
+    "RetryConfig",
+    "HedgeConfig",
+    "LoadBalanceConfig",
+    "LoadBalancer",
+    "Replica",
+    "CircuitBreakerConfig",
+    "CircuitBreakers",
+    "CircuitBreaker",
+    "CircuitState",
+    "RetryPolicy",
+    "TimeoutProfile",
+    "TransportConfig",
+    "deadline",
+    "timeout_profile",
+    "CacheStats",
+    "DecodeMode",
+    "JsonCodec",
+    "register_codec",
+    "scan_all",
+    "PageSizeTuner",
+    "HeartbeatScheduler",
+    "HeartbeatPayloadBuilder",
+    "render_metrics",
+    "MetricsServer",
+    "Hooks",
+    "HookEvent",
+    "RequestInfo",
+    "SlowRequestLog",
     # Exceptions
     "NewNanManagerException",
     "ApiErrorException",
     "HttpException",
     "ConnectionException",
     "TimeoutException",
+    "CircuitOpenException",
 ]
@@ -0,0 +1,227 @@
+"""Load balancing across API replicas for NewNanManager SDK."""
+
+import logging
+import math
+import random
+import time
+from typing import Collection, List, Optional
+from urllib.parse import urljoin
+
+from .config import LoadBalanceConfig
+
+logger = logging.getLogger(__name__)
+
+_STRATEGIES = ("least_outstanding", "ewma")
+# 健康评分（成功率的指数加权平均）每个样本的权重
+_HEALTH_ALPHA = 0.1
+# 计算代价时健康评分的下限，避免除以0
+_MIN_HEALTH = 0.01
+# 代价相差在该比例以内的副本视为相同，随机选择以分散负载
+_COST_TOLERANCE = 0.05
+
+
+class Replica:
+    """一个API副本及其被动健康状态."""
+
+    __slots__ = (
+        "base_url",
+        "_prefix",
+        "outstanding",
+        "latency",
+        "health",
+        "failures",
+        "ejections",
+        "ejected_until",
+        "_updated",
+        "_failed_at",
+    )
+
+    def __init__(self, base_url: str) -> None:
+        """初始化副本.
+
+        Args:
+            base_url: 副本的API基础URL
+        """
+        self.base_url = base_url
+        self._prefix = base_url.rstrip("/") + "/"
+        self.outstanding = 0  # 在途请求数
+        self.latency: Optional[float] = None  # 延迟的指数加权平均（秒）
+        self.health = 1.0  # 成功率的指数加权平均（0~1）
+        self.failures = 0  # 连续失败次数
+        self.ejections = 0  # 连续摘除次数，成功响应后清零
+        self.ejected_until = 0.0  # 摘除结束时间（time.monotonic）
+        self._updated = time.monotonic()
+        self._failed_at = 0.0
+
+    def url(self, path: str) -> str:
+        """构建该副本上的完整URL.
+
+        Args:
+            path: 带查询参数的API端点
+
+        Returns:
+            完整的URL
+        """
+        return urljoin(self._prefix, path.lstrip("/"))
+
+    def ejected(self, now: Optional[float] = None) -> bool:
+        """副本当前是否被摘除."""
+        return self.ejected_until > (time.monotonic() if now is None else now)
+
+    def __repr__(self) -> str:
+        latency = "n/a" if self.latency is None else f"{self.latency * 1000:.1f}ms"
+        return (
+            f"Replica({self.base_url!r}, outstanding={self.outstanding}, "
+            f"latency={latency}, health={self.health:.2f}, ejected={self.ejected()})"
+        )
+
+
+class LoadBalancer:
+    """在多个API副本之间分配请求.
+
+    - ``least_outstanding``：选择在途请求最少的副本
+    - ``ewma``：选择 ``延迟的指数加权平均 * (在途请求数 + 1)`` 最小的副本，
+      延迟升高时立即采用新值（peak EWMA），慢副本很快分不到请求
+
+    两种策略的代价都除以副本的健康评分（成功率的指数加权平均）。
+    连续 ``failure_threshold`` 次连接错误、超时或5xx的副本被摘除，
+    摘除时长从 ``ejection_time`` 开始每次连续摘除加倍；摘除结束后副本重新参与分配，
+    成功响应后摘除时长复位。同时被摘除的副本不超过 ``max_ejection_ratio``。
+    """
+
+    def __init__(self, base_urls: List[str], config: LoadBalanceConfig) -> None:
+        """初始化负载均衡器.
+
+        Args:
+            base_urls: 各副本的API基础URL
+            config: 负载均衡配置
+
+        Raises:
+            ValueError: 没有副本或未知的策略
+        """
+        if not base_urls:
+            raise ValueError("At least one base URL is required")
+        if config.strategy not in _STRATEGIES:
+            raise ValueError(
+                f"Unknown load balancing strategy '{config.strategy}', "
+                f"available: {list(_STRATEGIES)}"
+            )
+        self.config = config
+        self.replicas = [Replica(url) for url in dict.fromkeys(base_urls)]
+        self.ejected = 0  # 累计摘除次数
+
+    def health(self, replica: Replica, now: Optional[float] = None) -> float:
+        """副本当前的健康评分.
+
+        失败造成的扣分按 ``ewma_decay`` 随时间恢复，偶发失败的副本即使分不到请求也会逐渐恢复。
+
+        Args:
+            replica: 副本
+            now: 当前时间（time.monotonic），默认为现在
+
+        Returns:
+            健康评分（0~1）
+        """
+        if now is None:
+            now = time.monotonic()
+        recovery = math.exp(-(now - replica._failed_at) / self.config.ewma_decay)
+        return 1 - (1 - replica.health) * recovery
+
+    def _cost(self, replica: Replica, default_latency: float, now: float) -> float:
+        health = max(self.health(replica, now), _MIN_HEALTH)
+        if self.config.strategy == "ewma":
+            latency = (
+                replica.latency if replica.latency is not None else default_latency
+            )
+            return latency * (replica.outstanding + 1) / health
+        return (replica.outstanding + 1) / health
+
+    def pick(self, exclude: Collection[Replica] = ()) -> Replica:
+        """选择发送请求的副本.
+
+        Args:
+            exclude: 尽量避开的副本（如本次调用已经尝试过的副本）
+
+        Returns:
+            代价最小的可用副本；可用副本都在 ``exclude`` 中时从中选择，
+            全部被摘除时选择最早结束摘除的副本
+        """
+        now = time.monotonic()
+        available = [r for r in self.replicas if not r.ejected(now)]
+        if not available:
+            return min(self.replicas, key=lambda r: r.ejected_until)
+        candidates = [r for r in available if r not in exclude] or available
+        if len(candidates) == 1:
+            return candidates[0]
+        # 没有延迟样本的副本按已知的最低延迟计算，既能获得样本又仍受健康评分影响
+        default_latency = min(
+            (r.latency for r in self.replicas if r.latency is not None), default=1.0
+        )
+        costs = [self._cost(r, default_latency, now) for r in candidates]
+        best = min(costs) * (1 + _COST_TOLERANCE)
+        return random.choice([r for r, c in zip(candidates, costs) if c <= best])
+
+    def has_untried(self, tried: Collection[Replica]) -> bool:
+        """是否还有未尝试过且未被摘除的副本."""
+        now = time.monotonic()
+        return any(r not in tried and not r.ejected(now) for r in self.replicas)
+
+    def begin(self, replica: Replica) -> float:
+        """记录请求开始发往副本.
+
+        Returns:
+            开始时间（time.monotonic），结束时传给 :meth:`end`
+        """
+        replica.outstanding += 1
+        return time.monotonic()
+
+    def end(self, replica: Replica, started: float, failed: Optional[bool]) -> None:
+        """记录请求结束并更新副本的健康状态.
+
+        Args:
+            replica: 副本
+            started: :meth:`begin` 返回的时间
+            failed: 是否失败（连接错误、超时或5xx），None表示不作为样本（如请求被取消）
+        """
+        replica.outstanding -= 1
+        if failed is None:
+            return
+        now = time.monotonic()
+        replica.health = self.health(replica, now)
+        if failed:
+            replica.health *= 1 - _HEALTH_ALPHA
+            replica._failed_at = now
+            replica.failures += 1
+            if replica.failures >= self.config.failure_threshold:
+                self._eject(replica, now)
+            return
+
+        replica.health = replica.health * (1 - _HEALTH_ALPHA) + _HEALTH_ALPHA
+        replica.failures = 0
+        replica.ejections = 0
+        rtt = now - started
+        if replica.latency is None or rtt > replica.latency:
+            replica.latency = rtt
+        else:
+            weight = math.exp(-(now - replica._updated) / self.config.ewma_decay)
+            replica.latency = replica.latency * weight + rtt * (1 - weight)
+        replica._updated = now
+
+    def _eject(self, replica: Replica, now: float) -> None:
+        if replica.ejected(now):
+            return
+        ejected = sum(1 for r in self.replicas if r.ejected(now))
+        if ejected + 1 > len(self.replicas) * self.config.max_ejection_ratio:
+            return
+        duration = min(
+            self.config.ejection_time * (2**replica.ejections),
+            self.config.max_ejection_time,
+        )
+        logger.warning(
+            f"Ejecting replica {replica.base_url} for {duration:.1f}s "
+            f"after {replica.failures} consecutive failures"
+        )
+        replica.ejected_until = now + duration
+        replica.ejections += 1
+        replica.failures = 0
+        self.ejected += 1
@@ -0,0 +1,281 @@
+"""Micro-batching of concurrent calls for NewNanManager SDK."""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
+
+from .exceptions import (
+    ApiErrorException,
+    ConnectionException,
+    HttpException,
+    NewNanManagerException,
+    TimeoutException,
+)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+#: 批量发送函数：(批次键, 数据项列表) -> 与数据项一一对应的结果列表
+BatchSender = Callable[[K, List[T]], Awaitable[Sequence[R]]]
+
+
+class _Batch(Generic[T, R]):
+    """正在收集中的批次."""
+
+    __slots__ = ("items", "futures", "timer")
+
+    def __init__(self) -> None:
+        self.items: List[T] = []
+        self.futures: List["asyncio.Future[R]"] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher(Generic[K, T, R]):
+    """在短时间窗口内收集相同键的并发调用，合并为一次批量请求.
+
+    批次在窗口到期或数据项达到 ``max_batch`` 时发送，每个调用者拿到自己对应的结果。
+    批量请求失败时，该批次的所有调用者收到同一个异常。
+    """
+
+    def __init__(
+        self,
+        send: BatchSender[K, T, R],
+        window: float = 0.005,
+        max_batch: int = 100,
+    ) -> None:
+        """初始化批处理器.
+
+        Args:
+            send: 批量发送函数
+            window: 收集窗口（秒）
+            max_batch: 单个批次的最大数据项数
+        """
+        self._send = send
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[K, _Batch[T, R]] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.submitted = 0  # 提交的数据项数
+        self.batches = 0  # 实际发送的批次数
+
+    async def submit(self, key: K, item: T) -> R:
+        """提交一个数据项并等待其结果.
+
+        Args:
+            key: 批次键，相同键的数据项合并发送
+            item: 数据项
+
+        Returns:
+            该数据项的结果
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch()
+            batch.timer = loop.call_later(self.window, self._flush, key)
+
+        future: "asyncio.Future[R]" = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        self.submitted += 1
+
+        if len(batch.items) >= self.max_batch:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: K) -> None:
+        """发送键对应的批次."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        self.batches += 1
+        task = asyncio.ensure_future(self._run(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: K, batch: _Batch[T, R]) -> None:
+        try:
+            results = await self._send(key, batch.items)
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
+        for future in batch.futures[len(results) :]:
+            if not future.done():
+                future.set_exception(
+                    NewNanManagerException("Batch response is missing results")
+                )
+
+    async def flush(self) -> None:
+        """立即发送所有收集中的批次，并等待在途批次完成."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def __len__(self) -> int:
+        """收集中的数据项数."""
+        return sum(len(b.items) for b in self._pending.values())
+
+
+class CoalescingBuffer(Generic[K, T]):
+    """按键收集数据项并在后台批量发送的缓冲区.
+
+    与 :class:`MicroBatcher` 不同，调用方提交后不等待发送结果。缓冲区在数据项达到
+    ``max_items``、首个数据项等待超过 ``max_delay`` 或关闭时发送，相同键下的重复数据项
+    只发送一次。发送失败时按指数退避重试，``close()`` 会等待所有数据发送完成或重试耗尽。
+    """
+
+    def __init__(
+        self,
+        send: Callable[[K, List[T]], Awaitable[Any]],
+        max_items: int = 1000,
+        max_delay: float = 0.5,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """初始化缓冲区.
+
+        Args:
+            send: 批量发送函数
+            max_items: 单次发送的最大数据项数
+            max_delay: 数据项在缓冲区中的最长等待时间（秒）
+            max_retries: 发送失败时的最大重试次数
+            retry_delay: 首次重试延迟（秒），之后指数增长
+        """
+        self._send = send
+        self.max_items = max_items
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        # 使用dict作为有序集合，保持提交顺序并去重
+        self._pending: Dict[K, Dict[T, None]] = {}
+        self._timers: Dict[K, asyncio.TimerHandle] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.sent = 0  # 成功发送的批次数
+        self.dropped = 0  # 重试耗尽后丢弃的数据项数
+
+    def add(self, key: K, items: Iterable[T]) -> None:
+        """向缓冲区添加数据项.
+
+        Args:
+            key: 批次键，相同键的数据项合并发送
+            items: 数据项
+        """
+        pending = self._pending.setdefault(key, {})
+        pending.update(dict.fromkeys(items))
+        if len(pending) >= self.max_items:
+            self._flush(key)
+        elif pending and key not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[key] = loop.call_later(self.max_delay, self._flush, key)
+
+    def _flush(self, key: K) -> None:
+        """在后台发送键对应的数据项."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(key, None)
+        if not pending:
+            return
+
+        for chunk in chunked(list(pending), self.max_items):
+            task = asyncio.ensure_future(self._send_with_retry(key, list(chunk)))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_with_retry(self, key: K, items: List[T]) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._send(key, items)
+                self.sent += 1
+                return
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    self.dropped += len(items)
+                    logger.error(
+                        f"Failed to flush {len(items)} buffered item(s) for {key!r}: {e}"
+                    )
+                    return
+                delay = self.retry_delay * (2**attempt)
+                logger.warning(
+                    f"Buffered flush failed (attempt {attempt + 1}), retrying in {delay}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def flush(self) -> None:
+        """立即发送所有缓冲的数据项，并等待发送（含重试）完成."""
+        for key in list(self._pending):
+            self._flush(key)
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """发送剩余数据项并等待完成.
+
+        关闭后仍可继续添加数据项（如客户端关闭后被再次使用），照常在后台发送。
+        """
+        await self.flush()
+
+    def __len__(self) -> int:
+        """缓冲中（尚未发送）的数据项数."""
+        return sum(len(p) for p in self._pending.values())
+
+
+def _is_retryable(error: Exception) -> bool:
+    """判断发送失败是否值得重试（连接错误、超时、5xx和429）.
+
+    客户端重试循环已经放弃的错误、熔断器打开以及响应解析和校验错误不重试。
+    """
+    if isinstance(error, NewNanManagerException) and error.retries_exhausted:
+        return False
+    if isinstance(error, (HttpException, ApiErrorException)):
+        # ApiErrorException 的 error_code 为HTTP状态码
+        status = (
+            error.status_code if isinstance(error, HttpException) else error.error_code
+        )
+        return status is not None and (status >= 500 or status == 429)
+    return isinstance(
+        error, (ConnectionException, TimeoutException, OSError, asyncio.TimeoutError)
+    )
+
+
+def chunked(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    """将序列按固定大小切分.
+
+    Args:
+        items: 序列
+        size: 每块大小
+
+    Returns:
+        切分后的块列表
+    """
+    return [items[i : i + size] for i in range(0, len(items), size)]
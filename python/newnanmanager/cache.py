@@ -0,0 +1,288 @@
+"""In-memory response cache for NewNanManager SDK."""
+
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from .config import CacheConfig, CachePolicy
+from .utils import endpoint_template
+
+# 写操作除自身资源集合外还会影响的其他集合
+_RELATED_COLLECTIONS: Dict[str, Tuple[str, ...]] = {
+    # 城镇详情包含成员信息，在线玩家列表包含玩家名
+    "/api/v1/players": ("/api/v1/towns", "/api/v1/server-players"),
+    # 玩家的 town_id 随城镇删除而变化
+    "/api/v1/towns": ("/api/v1/players",),
+    # /api/v1/servers/players/offline 影响玩家服务器关系
+    "/api/v1/servers": ("/api/v1/server-players", "/api/v1/players"),
+    # 心跳携带 player_list，更新服务器状态和在线玩家
+    "/api/v1/monitor": ("/api/v1/servers", "/api/v1/server-players"),
+}
+
+
+class CacheState(str, Enum):
+    """缓存查找结果."""
+
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+
+@dataclass
+class CacheStats:
+    """缓存统计信息."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class _CacheEntry:
+    """缓存条目."""
+
+    __slots__ = ("value", "path", "fresh_until", "stale_until")
+
+    def __init__(
+        self, value: Any, path: str, fresh_until: float, stale_until: float
+    ) -> None:
+        self.value = value
+        self.path = path
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+def _collection_of(path: str) -> str:
+    """获取端点所属的资源集合，如 /api/v1/players/1/ban -> /api/v1/players."""
+    return "/".join(path.split("?", 1)[0].split("/")[:4])
+
+
+def _in_collection(path: str, collection: str) -> bool:
+    return path == collection or path.startswith(collection + "/")
+
+
+def affected_by_write(endpoint: str) -> Callable[[str], bool]:
+    """获取判断端点是否受写操作影响的函数.
+
+    Args:
+        endpoint: 写操作的API端点
+
+    Returns:
+        参数为（带查询参数的）端点的判断函数，覆盖写操作所在集合及其关联集合
+    """
+    collection = _collection_of(endpoint)
+    collections = (collection,) + _RELATED_COLLECTIONS.get(collection, ())
+    return lambda path: any(_in_collection(path, c) for c in collections)
+
+
+class ResponseCache:
+    """带TTL和容量上限的LRU响应缓存.
+
+    缓存值为解码后的模型对象，会被多个调用者共享，调用方应将其视为只读。
+    """
+
+    def __init__(self, config: CacheConfig) -> None:
+        """初始化缓存.
+
+        Args:
+            config: 缓存配置
+        """
+        self.config = config
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._stats = CacheStats()
+        # 每次失效时递增，用于丢弃失效前发出的请求结果
+        self.generation = 0
+
+    def policy_for(self, endpoint: str) -> Optional[CachePolicy]:
+        """获取端点的缓存策略.
+
+        Args:
+            endpoint: API端点
+
+        Returns:
+            缓存策略，None表示该端点不缓存
+        """
+        return self.config.policies.get(
+            endpoint_template(endpoint), self.config.default_policy
+        )
+
+    def lookup(self, key: Hashable) -> Tuple[CacheState, Any]:
+        """查找缓存.
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            (缓存状态, 缓存值)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.fresh_until:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return CacheState.FRESH, entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self._stats.stale_hits += 1
+                return CacheState.STALE, entry.value
+            del self._entries[key]
+
+        self._stats.misses += 1
+        return CacheState.MISS, None
+
+    def store(
+        self,
+        key: Hashable,
+        endpoint: str,
+        value: Any,
+        policy: CachePolicy,
+        generation: int,
+    ) -> None:
+        """写入缓存.
+
+        Args:
+            key: 缓存键
+            endpoint: API端点（用于写操作失效）
+            value: 缓存值
+            policy: 缓存策略
+            generation: 发起请求时的缓存代数，期间发生过失效则不写入
+        """
+        if generation != self.generation:
+            return
+
+        # 随机缩短TTL，使同时写入的条目不会同时过期
+        ttl = policy.ttl * (1.0 - self.config.ttl_jitter * random.random())
+        now = time.monotonic()
+        self._entries[key] = _CacheEntry(
+            value, endpoint.split("?", 1)[0], now + ttl, now + ttl + policy.stale_ttl
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate_for_write(self, endpoint: str) -> int:
+        """使写操作影响到的缓存条目失效.
+
+        Args:
+            endpoint: 写操作的API端点
+
+        Returns:
+            失效的条目数
+        """
+        return self._invalidate(affected_by_write(endpoint))
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """手动使缓存失效.
+
+        Args:
+            prefix: 端点前缀，None表示清空全部缓存
+
+        Returns:
+            失效的条目数
+        """
+        if prefix is None:
+            return self._invalidate(lambda path: True)
+        return self._invalidate(lambda path: path.startswith(prefix))
+
+    def _invalidate(self, predicate: Callable[[str], bool]) -> int:
+        self.generation += 1
+        keys = [key for key, entry in self._entries.items() if predicate(entry.path)]
+        for key in keys:
+            del self._entries[key]
+        self._stats.invalidations += len(keys)
+        return len(keys)
+
+    def stats(self) -> CacheStats:
+        """获取缓存统计信息快照."""
+        s = self._stats
+        return CacheStats(
+            hits=s.hits,
+            stale_hits=s.stale_hits,
+            misses=s.misses,
+            evictions=s.evictions,
+            invalidations=s.invalidations,
+            size=len(self._entries),
+        )
+
+
+class _Validator:
+    """条件请求校验信息及对应的已解码响应."""
+
+    __slots__ = ("etag", "last_modified", "value")
+
+    def __init__(
+        self, etag: Optional[str], last_modified: Optional[str], value: Any
+    ) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.value = value
+
+    def headers(self) -> Dict[str, str]:
+        """生成条件请求头."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    """按URL保存 ETag / Last-Modified 及已解码响应的LRU存储.
+
+    服务端返回304时直接复用之前解码的模型，不再读取和解析响应体。
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """初始化存储.
+
+        Args:
+            max_entries: 最大条目数
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _Validator]" = OrderedDict()
+        self.not_modified = 0  # 304命中次数
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[_Validator]:
+        """获取校验信息.
+
+        Args:
+            key: 存储键
+
+        Returns:
+            校验信息，不存在时返回None
+        """
+        validator = self._entries.get(key)
+        if validator is not None:
+            self._entries.move_to_end(key)
+        return validator
+
+    def remember(self, key: Hashable, headers: Mapping[str, str], value: Any) -> None:
+        """根据响应头保存校验信息.
+
+        Args:
+            key: 存储键
+            headers: 响应头
+            value: 已解码的响应
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = _Validator(etag, last_modified, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
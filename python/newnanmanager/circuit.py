@@ -0,0 +1,235 @@
+"""Per-endpoint-group circuit breakers for NewNanManager SDK."""
+
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, List, Optional
+
+from .config import CircuitBreakerConfig
+from .exceptions import CircuitOpenException
+from .utils import endpoint_template
+
+logger = logging.getLogger(__name__)
+
+# 统计窗口划分的桶数
+_BUCKETS = 10
+
+
+class CircuitState(str, Enum):
+    """熔断器状态."""
+
+    CLOSED = "closed"  # 正常放行
+    OPEN = "open"  # 快速失败
+    HALF_OPEN = "half_open"  # 放行少量探测调用
+
+
+#: 状态变化监听函数：(熔断器, 之前的状态)
+StateListener = Callable[["CircuitBreaker", CircuitState], None]
+
+
+class CircuitBreaker:
+    """一个端点组的熔断器.
+
+    - 关闭：统计窗口内调用数不少于 ``min_calls`` 且失败比例达到 ``failure_ratio`` 时打开
+    - 打开：调用立即抛出 :class:`CircuitOpenException`，``open_duration`` 后进入半开
+    - 半开：最多同时放行 ``half_open_probes`` 个探测调用，全部成功后关闭，任一失败重新打开
+
+    失败指连接错误、超时和5xx；其他错误（如4xx）说明服务可用，按成功统计。
+    """
+
+    def __init__(
+        self,
+        group: str,
+        config: CircuitBreakerConfig,
+        listeners: Optional[List[StateListener]] = None,
+    ) -> None:
+        """初始化熔断器.
+
+        Args:
+            group: 端点组名称
+            config: 熔断配置
+            listeners: 状态变化监听函数列表（与注册表共享）
+        """
+        self.group = group
+        self.config = config
+        self.state = CircuitState.CLOSED
+        self._listeners = listeners if listeners is not None else []
+        # 统计窗口：[桶开始时间, 调用数, 失败数]
+        self._buckets: Deque[List[float]] = deque()
+        self._bucket_size = config.window / _BUCKETS
+        self._opened_at = 0.0
+        self._generation = 0  # 每次进入半开状态加1，区分过期的探测结果
+        self._probes = 0  # 半开状态下在途的探测调用数
+        self._successes = 0  # 半开状态下成功的探测调用数
+        self.rejected = 0  # 被快速失败的调用数
+        self.opened = 0  # 打开的次数
+
+    def allow(self) -> Optional[int]:
+        """检查是否放行一次调用.
+
+        Returns:
+            探测调用返回半开状态的编号，普通调用返回None；结束时传给 :meth:`record`
+
+        Raises:
+            CircuitOpenException: 熔断器打开，或半开状态下探测名额已满
+        """
+        if self.state is CircuitState.CLOSED:
+            return None
+        now = time.monotonic()
+        if self.state is CircuitState.OPEN:
+            remaining = self._opened_at + self.config.open_duration - now
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenException(self.group, remaining)
+            self._generation += 1
+            self._probes = 0
+            self._successes = 0
+            self._transition(CircuitState.HALF_OPEN)
+        if self._probes >= self.config.half_open_probes:
+            self.rejected += 1
+            raise CircuitOpenException(self.group, 0.0)
+        self._probes += 1
+        return self._generation
+
+    def record(self, probe: Optional[int], failed: Optional[bool]) -> None:
+        """记录一次调用的结果.
+
+        Args:
+            probe: :meth:`allow` 的返回值
+            failed: 是否失败，None表示不作为样本（如调用被取消）
+        """
+        if probe is not None:
+            if self.state is not CircuitState.HALF_OPEN or probe != self._generation:
+                return  # 探测结果已过期
+            self._probes -= 1
+            if failed:
+                self._open(time.monotonic())
+            elif failed is not None:
+                self._successes += 1
+                if self._successes >= self.config.half_open_probes:
+                    self._buckets.clear()
+                    self._transition(CircuitState.CLOSED)
+            return
+
+        if failed is None or self.state is not CircuitState.CLOSED:
+            return
+        now = time.monotonic()
+        buckets = self._buckets
+        while buckets and buckets[0][0] <= now - self.config.window:
+            buckets.popleft()
+        if not buckets or buckets[-1][0] <= now - self._bucket_size:
+            buckets.append([now, 0, 0])
+        bucket = buckets[-1]
+        bucket[1] += 1
+        if not failed:
+            return
+        bucket[2] += 1
+        calls = sum(b[1] for b in buckets)
+        failures = sum(b[2] for b in buckets)
+        if (
+            calls >= self.config.min_calls
+            and failures >= calls * self.config.failure_ratio
+        ):
+            self._open(now)
+
+    @property
+    def is_open(self) -> bool:
+        """熔断器是否处于打开状态（且尚未到半开时间）."""
+        return (
+            self.state is CircuitState.OPEN
+            and time.monotonic() < self._opened_at + self.config.open_duration
+        )
+
+    def _open(self, now: float) -> None:
+        self._opened_at = now
+        self._buckets.clear()
+        self.opened += 1
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous = self.state
+        self.state = state
+        if state is CircuitState.OPEN:
+            logger.warning(
+                f"Circuit breaker '{self.group}' opened "
+                f"for {self.config.open_duration:.1f}s (was {previous.value})"
+            )
+        else:
+            logger.info(
+                f"Circuit breaker '{self.group}' {previous.value} -> {state.value}"
+            )
+        for listener in list(self._listeners):
+            try:
+                listener(self, previous)
+            except Exception as e:
+                logger.warning(f"Circuit state listener {listener!r} failed: {e}")
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker({self.group!r}, state={self.state.value})"
+
+
+class CircuitBreakers:
+    """按端点组管理熔断器."""
+
+    def __init__(self, config: CircuitBreakerConfig) -> None:
+        """初始化熔断器注册表.
+
+        Args:
+            config: 熔断配置
+        """
+        self.config = config
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._groups: Dict[str, str] = {}  # 端点模板 -> 端点组
+        self._listeners: List[StateListener] = []
+
+    def group_of(self, template: str) -> str:
+        """端点模板所属的端点组.
+
+        Args:
+            template: 端点模板
+
+        Returns:
+            ``groups`` 中最长匹配前缀对应的组名，没有匹配时为 /api/v1/ 后的第一段
+        """
+        group = self._groups.get(template)
+        if group is None:
+            matches = [p for p in self.config.groups if template.startswith(p)]
+            if matches:
+                group = self.config.groups[max(matches, key=len)]
+            else:
+                segments = [s for s in template.split("/") if s]
+                group = segments[2] if len(segments) > 2 else template
+            self._groups[template] = group
+        return group
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """获取端点所属组的熔断器.
+
+        Args:
+            endpoint: API端点
+
+        Returns:
+            熔断器
+        """
+        group = self.group_of(endpoint_template(endpoint))
+        breaker = self.breakers.get(group)
+        if breaker is None:
+            breaker = self.breakers[group] = CircuitBreaker(
+                group, self.config, self._listeners
+            )
+        return breaker
+
+    def on_state_change(self, listener: StateListener) -> StateListener:
+        """注册状态变化监听函数（可用作装饰器）.
+
+        监听函数在状态变化时同步调用，参数为熔断器和之前的状态；抛出的异常会被记录并忽略。
+
+        Args:
+            listener: 监听函数
+
+        Returns:
+            监听函数本身
+        """
+        self._listeners.append(listener)
+        return listener
@@ -1,9 +1,19 @@
 """Main client class for NewNanManager SDK."""
 
-from typing import Optional
+from typing import Dict, List, Optional
 
+from .balancer import LoadBalancer
+from .cache import CacheStats
+from .circuit import CircuitBreakers
+from .concurrency import AdaptiveConcurrencyLimiter
 from .config import ClientConfig
+from .heartbeat import HeartbeatScheduler
+from .hedging import Hedger
+from .hooks import Hooks
 from .http_client import HttpClient
+from .metrics import ClientMetrics
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .services import (
     IPService,
     MonitorService,
@@ -87,11 +97,126 @@ class NewNanManagerClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """异步上下文管理器出口."""
-        await self._http_client.__aexit__(exc_type, exc_val, exc_tb)
+        await self.close()
 
     async def close(self) -> None:
-        """关闭客户端连接."""
-        await self._http_client.close()
+        """关闭客户端连接.
+
+        即使某个服务关闭时抛出异常，其余服务和HTTP会话也会被关闭。
+        """
+        try:
+            await self.monitor.close()
+        finally:
+            try:
+                await self.players.close()
+            finally:
+                try:
+                    await self.player_servers.close()
+                finally:
+                    await self._http_client.close()
+
+    async def prewarm(self, connections: Optional[int] = None) -> int:
+        """预先建立keep-alive连接，避免首次调用承担DNS解析、建连和TLS握手的耗时.
+
+        Args:
+            connections: 每个副本的连接数，默认为 ``ClientConfig.prewarm_connections``
+
+        Returns:
+            成功预热的连接数
+        """
+        return await self._http_client.prewarm(connections)
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """获取响应缓存统计信息（未启用缓存时返回None）."""
+        return self._http_client.cache_stats()
+
+    def connection_stats(self) -> Dict[str, int]:
+        """获取连接池使用情况（会话未创建时返回空字典）."""
+        return self._http_client.connection_stats()
+
+    def coalesce_stats(self) -> Dict[str, int]:
+        """获取请求合并统计信息（calls、shared）."""
+        return self._http_client.coalesce_stats()
+
+    def conditional_stats(self) -> Optional[Dict[str, int]]:
+        """获取条件请求统计信息（未启用条件请求时返回None）."""
+        return self._http_client.conditional_stats()
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> int:
+        """手动使响应缓存失效.
+
+        Args:
+            prefix: 端点前缀，None表示清空全部缓存
+
+        Returns:
+            失效的条目数
+        """
+        return self._http_client.invalidate_cache(prefix)
+
+    @property
+    def hooks(self) -> Hooks:
+        """请求生命周期钩子注册表."""
+        return self._http_client.hooks
+
+    @property
+    def metrics(self) -> Optional[ClientMetrics]:
+        """按端点模板聚合的请求指标（未开启 ``ClientConfig.metrics`` 时为None）."""
+        return self._http_client.metrics
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """客户端限速器（未配置 ``ClientConfig.rate_limit`` 时为None）.
+
+        可以赋值为另一个客户端的限速器，使多个客户端共享令牌桶。
+        """
+        return self._http_client.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter: Optional[RateLimiter]) -> None:
+        self._http_client.rate_limiter = limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """重试策略，可以赋值为自定义的 :class:`RetryPolicy` 子类实例."""
+        return self._http_client.retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, policy: RetryPolicy) -> None:
+        self._http_client.retry_policy = policy
+
+    @property
+    def hedger(self) -> Optional[Hedger]:
+        """慢请求对冲器（未配置 ``ClientConfig.hedging`` 时为None）."""
+        return self._http_client.hedger
+
+    @property
+    def heartbeat_schedulers(self) -> List[HeartbeatScheduler]:
+        """正在运行的后台心跳调度器."""
+        return self.monitor.heartbeat_schedulers
+
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """自适应并发限制器（未配置 ``ClientConfig.concurrency_limit`` 时为None）.
+
+        ``concurrency_limiter.current_limit`` 为当前允许的最大在途请求数。
+        """
+        return self._http_client.concurrency_limiter
+
+    @property
+    def balancer(self) -> Optional[LoadBalancer]:
+        """多副本负载均衡器（未配置 ``ClientConfig.base_urls`` 时为None）.
+
+        ``balancer.replicas`` 为各副本的在途请求数、延迟、健康评分和摘除状态。
+        """
+        return self._http_client.balancer
+
+    @property
+    def circuit_breakers(self) -> Optional[CircuitBreakers]:
+        """按端点组的熔断器（未配置 ``ClientConfig.circuit_breaker`` 时为None）.
+
+        可以通过 ``circuit_breakers.on_state_change`` 注册状态变化监听函数。
+        """
+        return self._http_client.circuit_breakers
 
     @property
     def config(self) -> ClientConfig:
@@ -0,0 +1,305 @@
+"""JSON encoding and response decoding for NewNanManager SDK."""
+
+import json
+from abc import ABC, abstractmethod
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .exceptions import NewNanManagerException
+
+#: 请求体：请求模型、字典或预编码的JSON字节
+RequestBody = Union[Dict[str, Any], BaseModel, bytes]
+
+
+class DecodeMode(str, Enum):
+    """响应解码模式."""
+
+    STRICT = "strict"  # 完整的pydantic校验（默认）
+    TRUSTED = "trusted"  # 信任服务端数据，使用 model_construct 构建，不做校验和类型转换
+    RAW = "raw"  # 直接返回解析后的dict/list
+    LAZY = "lazy"  # 列表中的模型在访问时才校验
+
+
+class JsonCodec(ABC):
+    """JSON编解码器基类.
+
+    自定义编解码器继承本类并通过 :func:`register_codec` 注册后，
+    即可在 ``ClientConfig.json_codec`` 中按名称使用。
+    """
+
+    #: 为True时，带响应模型的响应体直接交给 pydantic 的 validate_json 解析校验
+    native_validation = False
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """将对象编码为JSON字节."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """将JSON字节解码为Python对象."""
+
+
+class PydanticJsonCodec(JsonCodec):
+    """基于 pydantic-core 的编解码器（默认）.
+
+    带模型的响应由 pydantic 直接从字节解析并校验，不构建中间的dict树。
+    """
+
+    native_validation = True
+
+    def dumps(self, obj: Any) -> bytes:
+        from pydantic_core import to_json
+
+        return to_json(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class StdlibJsonCodec(JsonCodec):
+    """基于标准库 json 的编解码器."""
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """基于 orjson 的编解码器（需要安装 ``newnanmanager-client[fast]``）."""
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "orjson is required for the 'orjson' codec: "
+                "pip install 'newnanmanager-client[fast]'"
+            ) from e
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+_CODEC_FACTORIES: Dict[str, Callable[[], JsonCodec]] = {
+    "pydantic": PydanticJsonCodec,
+    "json": StdlibJsonCodec,
+    "orjson": OrjsonCodec,
+}
+
+
+def register_codec(name: str, codec: JsonCodec) -> None:
+    """注册自定义JSON编解码器.
+
+    Args:
+        name: 编解码器名称（用于 ``ClientConfig.json_codec``）
+        codec: 编解码器实例
+    """
+    _CODEC_FACTORIES[name] = lambda: codec
+
+
+def get_codec(name: str) -> JsonCodec:
+    """按名称获取JSON编解码器.
+
+    Args:
+        name: 编解码器名称
+
+    Returns:
+        编解码器实例
+
+    Raises:
+        ValueError: 未知的编解码器名称
+    """
+    factory = _CODEC_FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(
+            f"Unknown JSON codec '{name}', available: {sorted(_CODEC_FACTORIES)}"
+        )
+    return factory()
+
+
+_TYPE_ADAPTERS: Dict[Any, TypeAdapter[Any]] = {}
+
+
+def type_adapter(model: Any) -> TypeAdapter[Any]:
+    """获取（并缓存）响应模型的 TypeAdapter."""
+    adapter = _TYPE_ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _TYPE_ADAPTERS[model] = TypeAdapter(model)
+    return adapter
+
+
+class LazyModelList(List[Any]):
+    """元素在按索引或迭代访问时才校验的模型列表.
+
+    其余list方法（如 ``sort``、``pop``）直接作用于尚未校验的原始数据。
+    """
+
+    def __init__(self, model: Type[BaseModel], items: List[Any]) -> None:
+        super().__init__(items)
+        self._model = model
+
+    def _validated(self, index: int) -> Any:
+        item = list.__getitem__(self, index)
+        if not isinstance(item, self._model):
+            item = self._model.model_validate(item)
+            list.__setitem__(self, index, item)
+        return item
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._validated(i) for i in range(*index.indices(len(self)))]
+        return self._validated(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self._validated(i)
+
+
+def _model_in(annotation: Any) -> Optional[Type[BaseModel]]:
+    """若注解为模型或 Optional[模型]，返回该模型类."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if get_origin(annotation) is Union:
+        for arg in get_args(annotation):
+            model = _model_in(arg)
+            if model is not None:
+                return model
+    return None
+
+
+def _list_model_in(annotation: Any) -> Optional[Type[BaseModel]]:
+    """若注解为 list[模型] 或 Optional[list[模型]]，返回元素模型类."""
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        return _model_in(args[0]) if args else None
+    if get_origin(annotation) is Union:
+        for arg in get_args(annotation):
+            model = _list_model_in(arg)
+            if model is not None:
+                return model
+    return None
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(model: Type[BaseModel]) -> Dict[str, Any]:
+    """获取模型中嵌套模型字段: 字段名 -> (元素模型, 是否为列表)."""
+    nested = {}
+    for name, field in model.model_fields.items():
+        item_model = _list_model_in(field.annotation)
+        if item_model is not None:
+            nested[name] = (item_model, True)
+            continue
+        sub_model = _model_in(field.annotation)
+        if sub_model is not None:
+            nested[name] = (sub_model, False)
+    return nested
+
+
+def construct_model(model: Type[BaseModel], data: Any, lazy: bool = False) -> Any:
+    """不经校验地递归构建模型.
+
+    Args:
+        model: 模型类
+        data: 解析后的JSON数据
+        lazy: 为True时列表字段中的模型在访问时才校验
+
+    Returns:
+        模型实例
+    """
+    if not isinstance(data, dict):
+        return data
+
+    values = dict(data)
+    for name, (sub_model, is_list) in _nested_fields(model).items():
+        value = values.get(name)
+        if value is None:
+            continue
+        if is_list:
+            values[name] = (
+                LazyModelList(sub_model, value)
+                if lazy
+                else [construct_model(sub_model, item) for item in value]
+            )
+        else:
+            values[name] = construct_model(sub_model, value)
+    return model.model_construct(**values)
+
+
+def encode_body(data: RequestBody, codec: JsonCodec) -> bytes:
+    """将请求体编码为JSON字节.
+
+    Args:
+        data: 请求模型、字典或预编码的JSON字节（原样发送）
+        codec: JSON编解码器
+
+    Returns:
+        JSON字节
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    if isinstance(data, BaseModel):
+        return data.model_dump_json(exclude_none=True, by_alias=True).encode()
+    return codec.dumps(data)
+
+
+def decode_body(
+    raw: bytes,
+    response_model: Optional[Type[Any]],
+    codec: JsonCodec,
+    mode: DecodeMode = DecodeMode.STRICT,
+) -> Any:
+    """从原始响应字节解码响应.
+
+    Args:
+        raw: 响应体字节
+        response_model: 响应模型类
+        codec: JSON编解码器
+        mode: 解码模式
+
+    Returns:
+        解码后的响应数据
+
+    Raises:
+        NewNanManagerException: 响应体不是合法JSON
+        ValidationError: 响应数据不符合模型
+    """
+    try:
+        if response_model is None or mode is DecodeMode.RAW:
+            return codec.loads(raw) if raw else {}
+
+        if mode is not DecodeMode.STRICT and issubclass(response_model, BaseModel):
+            data = codec.loads(raw) if raw else {}
+            return construct_model(response_model, data, lazy=mode is DecodeMode.LAZY)
+
+        adapter = type_adapter(response_model)
+        if not raw:
+            return adapter.validate_python({})
+        if codec.native_validation:
+            return adapter.validate_json(raw)
+        return adapter.validate_python(codec.loads(raw))
+    except ValidationError as e:
+        if e.errors()[0]["type"] == "json_invalid":
+            raise NewNanManagerException(f"Failed to parse JSON response: {e}") from e
+        raise
+    except ValueError as e:
+        raise NewNanManagerException(f"Failed to parse JSON response: {e}") from e
@@ -0,0 +1,129 @@
+"""Adaptive concurrency limiting for NewNanManager SDK."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from .config import ConcurrencyLimitConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """按延迟和错误自适应调整的并发上限（TCP Vegas / AIMD 风格）.
+
+    - 以观测到的最小往返时间作为无排队延迟，按 ``limit * (1 - min_rtt / rtt)``
+      估计服务端排队的请求数：低于 ``alpha`` 且上限已被用满时每个往返周期加1，
+      高于 ``beta`` 时每个往返周期减1
+    - 超时、连接错误、5xx和429视为过载，上限乘以 ``backoff_ratio``；
+      在上一次减小之前发出的请求不会再次触发减小
+    - 超过上限的请求按到达顺序排队等待
+    """
+
+    def __init__(self, config: ConcurrencyLimitConfig) -> None:
+        """初始化限制器.
+
+        Args:
+            config: 并发限制配置
+        """
+        self.config = config
+        self.limit = float(config.initial_limit)
+        self.in_flight = 0
+        self.min_rtt: Optional[float] = None
+        self._samples = 0
+        self._decreased_at = 0.0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self.dropped = 0  # 视为过载的请求数
+
+    @property
+    def current_limit(self) -> int:
+        """当前允许的最大在途请求数."""
+        return max(int(self.limit), self.config.min_limit)
+
+    async def acquire(self) -> float:
+        """等待一个并发名额.
+
+        Returns:
+            取得名额的时间（time.monotonic），释放时传给 :meth:`release`
+        """
+        if self.in_flight < self.current_limit and not self._waiters:
+            self.in_flight += 1
+            return time.monotonic()
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 名额已转交给本请求，取消时归还
+                self.in_flight -= 1
+                self._wake()
+            elif future in self._waiters:
+                # 已取消的等待者也可能已被 _wake 跳过并移出队列
+                self._waiters.remove(future)
+            raise
+        return time.monotonic()
+
+    def release(self, started: float, dropped: Optional[bool]) -> None:
+        """归还名额并根据结果调整上限.
+
+        Args:
+            started: :meth:`acquire` 返回的时间
+            dropped: 是否过载（超时、5xx、429等），None表示不作为样本（如请求被取消）
+        """
+        self.in_flight -= 1
+        now = time.monotonic()
+        if dropped:
+            self.dropped += 1
+            if started >= self._decreased_at:
+                self._decrease(self.limit * self.config.backoff_ratio)
+                self._decreased_at = now
+        elif dropped is not None:
+            self._on_sample(now - started, now)
+        self._wake()
+
+    def _on_sample(self, rtt: float, now: float) -> None:
+        self._samples += 1
+        if self._samples % self.config.rtt_reset_samples == 0:
+            # 周期性重新测量无排队延迟，适应服务端或网络的变化
+            self.min_rtt = rtt
+        elif self.min_rtt is None or rtt < self.min_rtt:
+            self.min_rtt = rtt
+
+        queue = self.limit * (1 - self.min_rtt / rtt) if rtt > 0 else 0.0
+        if queue > self.config.beta:
+            self._decrease(self.limit - 1 / self.limit)
+        elif (
+            queue < self.config.alpha
+            and self.in_flight + 1 >= self.current_limit / 2
+            and self.limit < self.config.max_limit
+        ):
+            # 每个样本增加 1/limit，即每个往返周期约增加1
+            self.limit = min(self.limit + 1 / self.limit, float(self.config.max_limit))
+
+    def _decrease(self, limit: float) -> None:
+        previous = self.current_limit
+        self.limit = max(limit, float(self.config.min_limit))
+        if self.current_limit < previous and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Concurrency limit decreased from %d to %d",
+                previous,
+                self.current_limit,
+            )
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.current_limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    def __repr__(self) -> str:
+        rtt = "n/a" if self.min_rtt is None else f"{self.min_rtt * 1000:.1f}ms"
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self.current_limit}, "
+            f"in_flight={self.in_flight}, waiting={len(self._waiters)}, min_rtt={rtt})"
+        )
@@ -1,8 +1,314 @@
 """Configuration classes for NewNanManager SDK."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ._version import USER_AGENT
+from .codec import DecodeMode
+
+
+class CachePolicy(BaseModel):
+    """单个端点的缓存策略."""
+
+    model_config = ConfigDict(frozen=True)
+
+    ttl: float = Field(description="缓存新鲜期（秒）")
+    stale_ttl: float = Field(
+        default=0.0, description="过期后仍返回旧值并在后台刷新的时长（秒）"
+    )
+
+
+def _default_cache_policies() -> Dict[str, CachePolicy]:
+    """默认只缓存单个资源的读取端点."""
+    return {
+        "/api/v1/players/{id}": CachePolicy(ttl=5.0, stale_ttl=30.0),
+        "/api/v1/servers/{id}": CachePolicy(ttl=5.0, stale_ttl=30.0),
+        "/api/v1/towns/{id}": CachePolicy(ttl=30.0, stale_ttl=120.0),
+        "/api/v1/ips/{ip}": CachePolicy(ttl=60.0, stale_ttl=300.0),
+    }
+
+
+class CacheConfig(BaseModel):
+    """响应缓存配置."""
+
+    model_config = ConfigDict(frozen=True)
+
+    max_entries: int = Field(default=1024, description="最大缓存条目数（LRU淘汰）")
+    policies: Dict[str, CachePolicy] = Field(
+        default_factory=_default_cache_policies,
+        description="按端点模板（如 /api/v1/players/{id}）配置的缓存策略",
+    )
+    default_policy: Optional[CachePolicy] = Field(
+        default=None, description="未在policies中列出的GET端点的策略（None表示不缓存）"
+    )
+    ttl_jitter: float = Field(
+        default=0.1, description="TTL随机缩短的最大比例，避免同时集中刷新"
+    )
+
+
+class RateLimitConfig(BaseModel):
+    """客户端限速配置."""
+
+    model_config = ConfigDict(frozen=True)
+
+    rate: Optional[float] = Field(
+        default=20.0, description="全局每秒请求数（None表示不限制）"
+    )
+    burst: float = Field(default=20.0, description="全局令牌桶容量")
+    per_token_rate: Optional[float] = Field(
+        default=None, description="每个API Token的每秒请求数（None表示不限制）"
+    )
+    per_token_burst: float = Field(default=10.0, description="每个Token的令牌桶容量")
+    endpoint_rates: Dict[str, float] = Field(
+        default_factory=dict,
+        description="按端点模板（如 /api/v1/players/validate）限制的每秒请求数",
+    )
+    min_rate: float = Field(default=0.5, description="收到429后自动降速的下限")
+    recovery: float = Field(
+        default=0.01, description="每次成功响应后恢复的速率（占配置速率的比例）"
+    )
+    default_retry_after: float = Field(
+        default=1.0, description="429响应未携带 Retry-After 时的等待时间（秒）"
+    )
+    max_throttle_retries: int = Field(
+        default=5, description="429响应排队后重发的最大次数（不计入 max_retries）"
+    )
+
+
+class ConcurrencyLimitConfig(BaseModel):
+    """自适应并发限制配置."""
+
+    model_config = ConfigDict(frozen=True)
+
+    initial_limit: int = Field(default=10, description="初始并发上限")
+    min_limit: int = Field(default=1, description="并发上限的最小值")
+    max_limit: int = Field(
+        default=100, description="并发上限的最大值（不宜超过连接池大小）"
+    )
+    backoff_ratio: float = Field(
+        default=0.9, description="超时、5xx或429时并发上限乘以的比例"
+    )
+    alpha: float = Field(
+        default=3.0, description="估计的排队请求数低于该值时增大并发上限"
+    )
+    beta: float = Field(
+        default=6.0, description="估计的排队请求数高于该值时减小并发上限"
+    )
+    rtt_reset_samples: int = Field(
+        default=1000, description="每隔多少个样本重新测量最小往返时间"
+    )
+
+
+def _default_idempotent_endpoints() -> FrozenSet[str]:
+    """重复执行没有副作用的POST端点."""
+    return frozenset(
+        {
+            "POST /api/v1/players/validate",
+            "POST /api/v1/monitor/{id}/heartbeat",
+            "POST /api/v1/servers/players/offline",
+        }
+    )
+
+
+class RetryConfig(BaseModel):
+    """重试策略配置.
+
+    重试次数和首次延迟见 ``ClientConfig.max_retries`` / ``retry_delay``。
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_delay: float = Field(default=30.0, description="单次重试延迟的上限（秒）")
+    jitter: bool = Field(
+        default=True,
+        description="使用全抖动退避（在0到指数退避值之间随机），避免重试同时到达",
+    )
+    retry_statuses: FrozenSet[int] = Field(
+        default=frozenset({502, 503, 504}),
+        description="对幂等请求重试的HTTP状态码",
+    )
+    idempotent_methods: FrozenSet[str] = Field(
+        default=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+        description="幂等的HTTP方法，超时、断连和 retry_statuses 时可以重试",
+    )
+    idempotent_endpoints: FrozenSet[str] = Field(
+        default_factory=_default_idempotent_endpoints,
+        description='额外视为幂等的端点，格式为 "方法 端点模板"',
+    )
+    budget_ratio: float = Field(
+        default=0.2, description="重试预算：每个请求积累的重试额度"
+    )
+    budget_min_per_second: float = Field(
+        default=5.0, description="重试预算：不依赖请求量、每秒恢复的重试额度"
+    )
+    budget_burst: float = Field(default=50.0, description="重试预算的最大积累额度")
+
+
+class TimeoutProfile(BaseModel):
+    """命名的超时配置档."""
+
+    model_config = ConfigDict(frozen=True)
+
+    total: Optional[float] = Field(
+        default=None,
+        description="单次尝试的总超时（秒），None表示使用 ClientConfig.timeout",
+    )
+    connect: Optional[float] = Field(
+        default=None, description="获取连接（含排队和建连）的超时（秒）"
+    )
+    read: Optional[float] = Field(
+        default=None, description="读取响应时两次收到数据之间的最大间隔（秒）"
+    )
+    deadline: Optional[float] = Field(
+        default=None, description="包括全部重试和退避的整体期限（秒）"
+    )
+
+
+def _default_timeout_profiles() -> Dict[str, TimeoutProfile]:
+    return {
+        # 登录校验、心跳等延迟敏感的调用：快速失败，由调用方降级处理
+        "fast": TimeoutProfile(total=3.0, connect=1.0, read=2.0, deadline=5.0),
+        # 导出、全量扫描等大响应调用
+        "bulk": TimeoutProfile(total=120.0, connect=10.0, read=60.0, deadline=600.0),
+    }
+
+
+def _default_endpoint_timeouts() -> Dict[str, str]:
+    return {
+        "POST /api/v1/players/validate": "fast",
+        "POST /api/v1/monitor/{id}/heartbeat": "fast",
+    }
+
+
+class HedgeConfig(BaseModel):
+    """GET请求对冲配置."""
+
+    model_config = ConfigDict(frozen=True)
+
+    percentile: float = Field(
+        default=0.95, description="超过最近耗时的该分位仍未返回时发出对冲请求"
+    )
+    min_delay: float = Field(default=0.01, description="发出对冲请求前的最短等待（秒）")
+    min_samples: int = Field(
+        default=20, description="端点至少有这么多成功样本后才开始对冲"
+    )
+    window_size: int = Field(
+        default=1000, description="耗时统计窗口的样本数，满后开始新窗口"
+    )
+    budget_ratio: float = Field(
+        default=0.05, description="对冲预算：每个请求积累的额度，即额外负载的上限比例"
+    )
+    budget_burst: float = Field(default=10.0, description="对冲预算的最大积累额度")
+    endpoints: Optional[FrozenSet[str]] = Field(
+        default=None, description="只对这些端点模板对冲，None表示所有GET请求"
+    )
+
+
+class CircuitBreakerConfig(BaseModel):
+    """按端点组熔断的配置."""
+
+    model_config = ConfigDict(frozen=True)
+
+    failure_ratio: float = Field(
+        default=0.5, description="统计窗口内失败调用的比例达到该值时打开熔断器"
+    )
+    min_calls: int = Field(
+        default=10, description="统计窗口内至少有这么多调用后才会打开熔断器"
+    )
+    window: float = Field(default=30.0, description="失败比例的统计窗口（秒）")
+    open_duration: float = Field(
+        default=10.0, description="熔断器打开后快速失败的时长（秒），之后进入半开状态"
+    )
+    half_open_probes: int = Field(
+        default=3,
+        description="半开状态下允许同时进行的探测调用数，全部成功后关闭熔断器",
+    )
+    groups: Dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "端点模板前缀到端点组名称的映射，"
+            "未匹配的端点按 /api/v1/ 后的第一段分组（如 players）"
+        ),
+    )
+
+
+class LoadBalanceConfig(BaseModel):
+    """多个API副本之间的负载均衡和故障摘除配置."""
+
+    model_config = ConfigDict(frozen=True)
+
+    strategy: str = Field(
+        default="least_outstanding",
+        description=(
+            "选择副本的策略：least_outstanding（在途请求最少）或 "
+            "ewma（在途请求数乘以延迟的指数加权平均）"
+        ),
+    )
+    ewma_decay: float = Field(
+        default=10.0, description="延迟指数加权平均的时间常数（秒），越小越快适应变化"
+    )
+    failure_threshold: int = Field(
+        default=5, description="连续失败（连接错误、超时或5xx）多少次后摘除副本"
+    )
+    ejection_time: float = Field(
+        default=5.0, description="首次摘除的时长（秒），之后每次连续摘除加倍"
+    )
+    max_ejection_time: float = Field(default=300.0, description="摘除时长的上限（秒）")
+    max_ejection_ratio: float = Field(
+        default=0.5, description="同时被摘除的副本的最大比例，避免全部副本被摘除"
+    )
+
+
+class TransportConfig(BaseModel):
+    """连接器（aiohttp.TCPConnector）的DNS缓存、keep-alive和套接字配置."""
+
+    model_config = ConfigDict(frozen=True)
+
+    use_dns_cache: bool = Field(default=True, description="是否缓存DNS解析结果")
+    ttl_dns_cache: Optional[int] = Field(
+        default=10, description="DNS缓存的有效期（秒），None表示永久缓存"
+    )
+    ip_version: Optional[int] = Field(
+        default=None, description="只使用IPv4（4）或IPv6（6）地址，None表示都可以"
+    )
+    happy_eyeballs_delay: Optional[float] = Field(
+        default=0.25,
+        description=(
+            "Happy Eyeballs（RFC 8305）并发尝试下一个地址前的等待（秒），"
+            "None表示依次尝试"
+        ),
+    )
+    interleave: Optional[int] = Field(
+        default=None, description="Happy Eyeballs 交替尝试的地址族数量，None表示默认"
+    )
+    keepalive_timeout: float = Field(
+        default=15.0, description="空闲连接在连接池中保留的时长（秒）"
+    )
+    force_close: bool = Field(
+        default=False, description="每个请求后关闭连接，不复用（仅用于排查问题）"
+    )
+    enable_cleanup_closed: bool = Field(
+        default=False,
+        description="强制回收未正常关闭的SSL连接（针对部分不规范的服务端）",
+    )
+    local_addr: Optional[Tuple[str, int]] = Field(
+        default=None, description="绑定的本地地址和端口，用于多网卡主机选择出口"
+    )
+    tcp_keepalive: bool = Field(
+        default=False,
+        description=(
+            "启用TCP keep-alive探测（SO_KEEPALIVE），"
+            "及早发现被中间设备丢弃的空闲连接"
+        ),
+    )
+    socket_options: Tuple[Tuple[int, int, int], ...] = Field(
+        default=(),
+        description=(
+            "额外的套接字选项，每项为 (level, option, value)，"
+            "如 (socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)"
+        ),
+    )
 
 
 class ClientConfig(BaseModel):
@@ -11,11 +317,130 @@ class ClientConfig(BaseModel):
     model_config = ConfigDict(frozen=True)  # 使配置不可变
 
     base_url: str = Field(description="API基础URL")
+    base_urls: List[str] = Field(
+        default_factory=list,
+        description=(
+            "其他API副本的基础URL，与 base_url 一起负载均衡" "（为空时只使用 base_url）"
+        ),
+    )
+    load_balancing: LoadBalanceConfig = Field(
+        default_factory=LoadBalanceConfig,
+        description="多个副本之间的负载均衡、健康评分和故障摘除配置",
+    )
     token: str = Field(description="API Token")
     timeout: float = Field(default=30.0, description="HTTP请求超时时间（秒）")
     user_agent: str = Field(default=USER_AGENT, description="用户代理字符串")
     max_retries: int = Field(default=3, description="最大重试次数")
     retry_delay: float = Field(default=1.0, description="重试延迟（秒）")
+    retry: RetryConfig = Field(
+        default_factory=RetryConfig,
+        description="重试策略：幂等性、状态码、全抖动退避和重试预算",
+    )
+    timeout_profiles: Dict[str, TimeoutProfile] = Field(
+        default_factory=_default_timeout_profiles,
+        description=(
+            "命名的超时配置档；"
+            "名为 default 的配置档用于未在 endpoint_timeouts 中列出的端点"
+        ),
+    )
+    endpoint_timeouts: Dict[str, str] = Field(
+        default_factory=_default_endpoint_timeouts,
+        description='端点使用的超时配置档，键为 "方法 端点模板" 或端点模板',
+    )
+    coalesce_requests: bool = Field(
+        default=True, description="合并并发的相同GET请求（共享同一响应对象）"
+    )
+
+    cache: Optional[CacheConfig] = Field(
+        default=None, description="响应缓存配置（None表示不启用缓存）"
+    )
+
+    rate_limit: Optional[RateLimitConfig] = Field(
+        default=None,
+        description="客户端限速配置（None表示不限速），429响应会排队重发而不是直接失败",
+    )
+
+    circuit_breaker: Optional[CircuitBreakerConfig] = Field(
+        default=None,
+        description=(
+            "按端点组熔断配置（None表示不熔断），"
+            "API不可用时调用立即抛出 CircuitOpenException"
+        ),
+    )
+    hedging: Optional[HedgeConfig] = Field(
+        default=None,
+        description="GET请求对冲配置（None表示不对冲），用于降低偶发连接卡顿造成的尾延迟",
+    )
+    concurrency_limit: Optional[ConcurrencyLimitConfig] = Field(
+        default=None,
+        description="自适应并发限制配置（None表示只受连接池大小限制）",
+    )
+
+    conditional_requests: bool = Field(
+        default=False,
+        description="GET请求携带 ETag/Last-Modified 条件头，304时复用已解码的响应",
+    )
+    validator_cache_size: int = Field(
+        default=256, description="条件请求校验信息的最大保存URL数"
+    )
+
+    json_codec: str = Field(
+        default="pydantic",
+        description=(
+            "JSON编解码器名称：pydantic、json、orjson 或"
+            "通过 register_codec 注册的名称"
+        ),
+    )
+
+    decode_mode: DecodeMode = Field(
+        default=DecodeMode.STRICT,
+        description="默认响应解码模式：strict、trusted、raw、lazy",
+    )
+
+    validate_batch_window: float = Field(
+        default=0.005, description="validate_player 合并并发验证的收集窗口（秒）"
+    )
+    validate_batch_size: int = Field(
+        default=100, description="单次玩家验证请求的最大玩家数（服务端上限为100）"
+    )
+
+    offline_batch_size: int = Field(
+        default=1000, description="单次玩家离线请求的最大玩家数（服务端上限为1000）"
+    )
+    offline_flush_interval: float = Field(
+        default=0.5, description="离线玩家缓冲区的最长等待时间（秒）"
+    )
+    offline_max_retries: int = Field(
+        default=3, description="离线玩家缓冲区发送失败时的最大重试次数"
+    )
+
+    metrics: bool = Field(
+        default=False,
+        description="按端点模板收集延迟直方图和分阶段耗时（DNS、建连、首字节、读取、解码）",
+    )
+
+    slow_request_threshold: Optional[float] = Field(
+        default=None,
+        description=(
+            "慢请求日志阈值（秒），超过阈值的请求连同调用位置记录到 "
+            "newnanmanager.slow 日志，None表示不记录"
+        ),
+    )
+    slow_request_sample_rate: float = Field(
+        default=1.0,
+        description=(
+            "慢请求日志采样的调用比例（0~1），只有被采样的调用捕获调用位置并检查耗时"
+        ),
+    )
+
+    log_body_max_bytes: int = Field(
+        default=1024,
+        description="DEBUG日志中请求/响应体的最大字节数，超出部分截断，0表示不记录请求/响应体",
+    )
+    log_body_sample_rate: float = Field(
+        default=1.0,
+        description="DEBUG日志记录请求/响应体的请求比例（0~1）",
+    )
 
     # 高级配置
     verify_ssl: bool = Field(default=True, description="是否验证SSL证书")
@@ -23,3 +448,39 @@ class ClientConfig(BaseModel):
     connection_pool_size_per_host: int = Field(
         default=30, description="每个主机的连接池大小"
     )
+    transport: TransportConfig = Field(
+        default_factory=TransportConfig,
+        description="DNS缓存、keep-alive、Happy Eyeballs和套接字选项等连接器调优配置",
+    )
+    prewarm_connections: int = Field(
+        default=0,
+        description=(
+            "进入 async with 时向每个副本预先建立的keep-alive连接数"
+            "（同时完成DNS解析和TLS握手），0表示不预热"
+        ),
+    )
+    keep_warm_interval: Optional[float] = Field(
+        default=None,
+        description="空闲时重新预热连接池的间隔（秒），应小于连接的keep-alive超时，None表示不保持",
+    )
+    warmup_path: str = Field(
+        default="/", description="预热连接时发送HEAD请求的路径（任何响应都能建立连接）"
+    )
+
+    @model_validator(mode="after")
+    def _check_timeout_profiles(self) -> "ClientConfig":
+        """检查 endpoint_timeouts 引用的超时配置档都已定义."""
+        missing = sorted(
+            {
+                name
+                for name in self.endpoint_timeouts.values()
+                if name not in self.timeout_profiles
+            }
+        )
+        if missing:
+            raise ValueError(
+                f"endpoint_timeouts refers to undefined timeout profile(s) {missing}, "
+                f"defined: {sorted(self.timeout_profiles)}; add them to "
+                "timeout_profiles or override endpoint_timeouts"
+            )
+        return self
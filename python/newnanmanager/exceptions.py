@@ -6,6 +6,9 @@ from typing import Optional
 class NewNanManagerException(Exception):
     """NewNanManager API异常基类."""
 
+    #: 客户端重试循环认为该错误可以重试，但已因重试次数、重试预算或整体期限放弃
+    retries_exhausted = False
+
     def __init__(
         self,
         message: str,
@@ -67,3 +70,14 @@ class ConnectionException(NewNanManagerException):
 
     def __init__(self, message: str = "Connection error") -> None:
         super().__init__(message)
+
+
+class CircuitOpenException(NewNanManagerException):
+    """熔断器打开时快速失败的异常."""
+
+    def __init__(self, group: str, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit breaker '{group}' is open, retry in {retry_after:.1f}s"
+        )
+        self.group = group  # 熔断器所属的端点组
+        self.retry_after = retry_after  # 距离允许探测请求的时间（秒）
@@ -0,0 +1,505 @@
+"""Prometheus text exposition of NewNanManager SDK client metrics."""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+from .circuit import CircuitState
+
+if TYPE_CHECKING:
+    from .client import NewNanManagerClient
+
+logger = logging.getLogger(__name__)
+
+#: Prometheus 文本格式的 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: 请求耗时直方图的默认桶边界（秒）
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+#: 分阶段耗时摘要输出的分位
+PHASE_QUANTILES = (0.5, 0.95, 0.99)
+
+Labels = Sequence[Tuple[str, object]]
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Registry:
+    """按指标族收集样本，保证同一族的样本连续输出."""
+
+    def __init__(self, namespace: str) -> None:
+        self.namespace = namespace
+        self._families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def add(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        value: float,
+        labels: Labels = (),
+        suffix: str = "",
+    ) -> None:
+        family = f"{self.namespace}_{name}"
+        entry = self._families.get(family)
+        if entry is None:
+            entry = self._families[family] = (kind, help_text, [])
+        label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+        sample = family + suffix + (f"{{{label_text}}}" if label_text else "")
+        entry[2].append(f"{sample} {_format_value(value)}")
+
+    def render(self) -> str:
+        lines = []
+        for family, (kind, help_text, samples) in self._families.items():
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def render_metrics(
+    client: "NewNanManagerClient",
+    namespace: str = "newnanmanager",
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> str:
+    """以 Prometheus 文本格式输出客户端指标.
+
+    包括按端点和状态码的请求数、耗时直方图、重试和超时次数、分阶段耗时分位数
+    （需要开启 ``ClientConfig.metrics``），以及连接池、请求合并、响应缓存、
+    条件请求、批处理器和心跳调度器的状态。
+
+    Args:
+        client: 客户端
+        namespace: 指标名前缀
+        buckets: 请求耗时直方图的桶边界（秒）
+
+    Returns:
+        文本格式的指标
+    """
+    registry = _Registry(namespace)
+
+    metrics = client.metrics
+    if metrics is not None:
+        for m in metrics:
+            base = (("method", m.method), ("endpoint", m.endpoint))
+            for status, count in sorted(m.statuses.items()):
+                registry.add(
+                    "requests_total",
+                    "counter",
+                    "Completed SDK calls by final HTTP status (0 = no response).",
+                    count,
+                    (*base, ("status", status)),
+                )
+            for status, count in sorted(m.attempt_statuses.items()):
+                registry.add(
+                    "request_attempts_total",
+                    "counter",
+                    "Request attempts including retries by HTTP status (0 = no response).",
+                    count,
+                    (*base, ("status", status)),
+                )
+            registry.add(
+                "request_errors_total",
+                "counter",
+                "SDK calls that ended with an exception.",
+                m.errors,
+                base,
+            )
+            registry.add(
+                "request_retries_total",
+                "counter",
+                "Retried request attempts.",
+                m.retries,
+                base,
+            )
+            registry.add(
+                "request_timeouts_total",
+                "counter",
+                "Request attempts that timed out.",
+                m.timeouts,
+                base,
+            )
+
+            hist = m.latency
+            for bound in buckets:
+                registry.add(
+                    "request_duration_seconds",
+                    "histogram",
+                    "SDK call latency including retries.",
+                    hist.count_le(bound),
+                    (*base, ("le", _format_value(bound))),
+                    "_bucket",
+                )
+            registry.add(
+                "request_duration_seconds",
+                "histogram",
+                "",
+                hist.count,
+                (*base, ("le", "+Inf")),
+                "_bucket",
+            )
+            registry.add(
+                "request_duration_seconds", "histogram", "", hist.sum, base, "_sum"
+            )
+            registry.add(
+                "request_duration_seconds", "histogram", "", hist.count, base, "_count"
+            )
+
+            for phase, phase_hist in m.phases.items():
+                if not phase_hist.count:
+                    continue
+                labels = (*base, ("phase", phase))
+                for q in PHASE_QUANTILES:
+                    registry.add(
+                        "request_phase_seconds",
+                        "summary",
+                        "Per-attempt time spent in dns, connect, ttfb, read and decode.",
+                        phase_hist.quantile(q),
+                        (*labels, ("quantile", q)),
+                    )
+                registry.add(
+                    "request_phase_seconds",
+                    "summary",
+                    "",
+                    phase_hist.sum,
+                    labels,
+                    "_sum",
+                )
+                registry.add(
+                    "request_phase_seconds",
+                    "summary",
+                    "",
+                    phase_hist.count,
+                    labels,
+                    "_count",
+                )
+
+    pool = client.connection_stats()
+    for key, help_text in (
+        ("in_use", "Connections currently acquired from the pool."),
+        ("idle", "Idle keep-alive connections in the pool."),
+        ("limit", "Connection pool size limit."),
+        ("limit_per_host", "Per-host connection limit."),
+    ):
+        if key in pool:
+            registry.add(f"pool_connections_{key}", "gauge", help_text, pool[key])
+
+    coalesce = client.coalesce_stats()
+    registry.add(
+        "coalesce_calls_total",
+        "counter",
+        "GET requests actually sent by the coalescer.",
+        coalesce["calls"],
+    )
+    registry.add(
+        "coalesce_shared_total",
+        "counter",
+        "GET calls served by joining an in-flight request.",
+        coalesce["shared"],
+    )
+
+    cache_stats = client.cache_stats()
+    if cache_stats is not None:
+        for field in ("hits", "stale_hits", "misses", "evictions", "invalidations"):
+            registry.add(
+                f"cache_{field}_total",
+                "counter",
+                f"Response cache {field.replace('_', ' ')}.",
+                getattr(cache_stats, field),
+            )
+        registry.add(
+            "cache_entries", "gauge", "Response cache entries.", cache_stats.size
+        )
+
+    conditional = client.conditional_stats()
+    if conditional is not None:
+        registry.add(
+            "conditional_not_modified_total",
+            "counter",
+            "Conditional GETs answered with 304 Not Modified.",
+            conditional["not_modified"],
+        )
+
+    budget = client.retry_policy.budget
+    registry.add(
+        "retry_budget_exhausted_total",
+        "counter",
+        "Retries skipped because the retry budget was exhausted.",
+        budget.exhausted,
+    )
+    registry.add(
+        "retry_budget_available",
+        "gauge",
+        "Retries currently available in the retry budget.",
+        budget.available,
+    )
+
+    hedger = client.hedger
+    if hedger is not None:
+        registry.add(
+            "hedged_requests_total",
+            "counter",
+            "Hedge requests sent for slow GETs.",
+            hedger.hedged,
+        )
+        registry.add(
+            "hedge_wins_total",
+            "counter",
+            "Hedge requests that returned before the original request.",
+            hedger.wins,
+        )
+
+    limiter = client.rate_limiter
+    if limiter is not None:
+        registry.add(
+            "rate_limited_total",
+            "counter",
+            "429 Too Many Requests responses received.",
+            limiter.throttled,
+        )
+        registry.add(
+            "rate_limit_delayed_total",
+            "counter",
+            "Requests queued by the client-side rate limiter.",
+            limiter.delayed,
+        )
+        registry.add(
+            "rate_limit_wait_seconds_total",
+            "counter",
+            "Time requests spent queued by the rate limiter.",
+            limiter.wait_time,
+        )
+        for bucket, rate in limiter.rates().items():
+            if rate != float("inf"):
+                registry.add(
+                    "rate_limit_rate",
+                    "gauge",
+                    "Current allowed requests per second of each token bucket.",
+                    rate,
+                    (("bucket", bucket),),
+                )
+
+    concurrency = client.concurrency_limiter
+    if concurrency is not None:
+        registry.add(
+            "concurrency_limit",
+            "gauge",
+            "Current adaptive limit of in-flight requests.",
+            concurrency.current_limit,
+        )
+        registry.add(
+            "concurrency_in_flight",
+            "gauge",
+            "Requests currently holding a concurrency slot.",
+            concurrency.in_flight,
+        )
+        registry.add(
+            "concurrency_dropped_total",
+            "counter",
+            "Requests that timed out or returned 5xx/429 and reduced the limit.",
+            concurrency.dropped,
+        )
+
+    balancer = client.balancer
+    if balancer is not None:
+        registry.add(
+            "replica_ejections_total",
+            "counter",
+            "Times a replica was ejected after consecutive failures.",
+            balancer.ejected,
+        )
+        for replica in balancer.replicas:
+            replica_labels: Labels = (("replica", replica.base_url),)
+            registry.add(
+                "replica_outstanding",
+                "gauge",
+                "Requests currently in flight to each replica.",
+                replica.outstanding,
+                replica_labels,
+            )
+            registry.add(
+                "replica_health",
+                "gauge",
+                "Exponentially weighted success rate of each replica.",
+                balancer.health(replica),
+                replica_labels,
+            )
+            if replica.latency is not None:
+                registry.add(
+                    "replica_latency_seconds",
+                    "gauge",
+                    "Exponentially weighted latency of each replica.",
+                    replica.latency,
+                    replica_labels,
+                )
+            registry.add(
+                "replica_ejected",
+                "gauge",
+                "Whether each replica is currently ejected (1) or not (0).",
+                int(replica.ejected()),
+                replica_labels,
+            )
+
+    breakers = client.circuit_breakers
+    if breakers is not None:
+        for group, breaker in breakers.breakers.items():
+            group_labels: Labels = (("group", group),)
+            for state in CircuitState:
+                registry.add(
+                    "circuit_state",
+                    "gauge",
+                    "Circuit breaker state of each endpoint group (1 for the current state).",
+                    int(breaker.state is state),
+                    (("group", group), ("state", state.value)),
+                )
+            registry.add(
+                "circuit_opened_total",
+                "counter",
+                "Times each circuit breaker opened.",
+                breaker.opened,
+                group_labels,
+            )
+            registry.add(
+                "circuit_rejected_total",
+                "counter",
+                "Calls failed fast by an open circuit breaker.",
+                breaker.rejected,
+                group_labels,
+            )
+
+    validate = client.players.validate_batch_stats()
+    registry.add(
+        "validate_batch_items_total",
+        "counter",
+        "Players submitted through validate_player.",
+        validate["submitted"],
+    )
+    registry.add(
+        "validate_batches_total",
+        "counter",
+        "Batched validate requests sent.",
+        validate["batches"],
+    )
+
+    offline = client.player_servers.offline_stats()
+    registry.add(
+        "offline_flushes_total",
+        "counter",
+        "Buffered set_players_offline requests sent.",
+        offline["sent"],
+    )
+    registry.add(
+        "offline_dropped_total",
+        "counter",
+        "Offline player ids dropped after retries were exhausted.",
+        offline["dropped"],
+    )
+    registry.add(
+        "offline_pending",
+        "gauge",
+        "Offline player ids waiting in the buffer.",
+        offline["pending"],
+    )
+
+    for scheduler in client.heartbeat_schedulers:
+        server = (("server_id", scheduler.server_id),)
+        registry.add(
+            "heartbeats_sent_total",
+            "counter",
+            "Heartbeats sent by the scheduler.",
+            scheduler.sent,
+            server,
+        )
+        registry.add(
+            "heartbeats_failed_total",
+            "counter",
+            "Heartbeats that failed.",
+            scheduler.failed,
+            server,
+        )
+        registry.add(
+            "heartbeats_skipped_total",
+            "counter",
+            "Heartbeat slots skipped because the previous beat overran.",
+            scheduler.skipped,
+            server,
+        )
+        if scheduler.last_rtt_ms is not None:
+            registry.add(
+                "heartbeat_rtt_milliseconds",
+                "gauge",
+                "Round trip of the last heartbeat.",
+                scheduler.last_rtt_ms,
+                server,
+            )
+
+    return registry.render()
+
+
+class MetricsServer:
+    """提供 ``/metrics`` 端点的最小HTTP服务."""
+
+    def __init__(
+        self,
+        client: "NewNanManagerClient",
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        path: str = "/metrics",
+        namespace: str = "newnanmanager",
+    ) -> None:
+        """初始化指标服务.
+
+        Args:
+            client: 客户端
+            host: 监听地址
+            port: 监听端口
+            path: 指标路径
+            namespace: 指标名前缀
+        """
+        self._client = client
+        self.host = host
+        self.port = port
+        self.path = path
+        self.namespace = namespace
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = render_metrics(self._client, self.namespace)
+        return web.Response(body=body.encode(), headers={"Content-Type": CONTENT_TYPE})
+
+    async def start(self) -> None:
+        """开始监听."""
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get(self.path, self._handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, self.host, self.port).start()
+        self._runner = runner
+        logger.info(f"Serving SDK metrics on http://{self.host}:{self.port}{self.path}")
+
+    async def stop(self) -> None:
+        """停止监听."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> "MetricsServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
@@ -0,0 +1,337 @@
+"""Background heartbeat scheduling for NewNanManager SDK."""
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .models import HeartbeatData, HeartbeatRequest, PlayerLoginInfo
+
+if TYPE_CHECKING:
+    from .services.monitor import MonitorService
+
+logger = logging.getLogger(__name__)
+
+#: 心跳请求：请求模型或增量构建器
+HeartbeatPayload = Union[HeartbeatRequest, "HeartbeatPayloadBuilder"]
+
+#: 心跳内容提供函数，每次心跳前调用，可以是同步或异步函数
+HeartbeatProvider = Callable[[], Union[HeartbeatPayload, Awaitable[HeartbeatPayload]]]
+
+#: HeartbeatPayloadBuilder.update 接受的标量字段
+_SCALAR_FIELDS = ("current_players", "max_players", "tps", "version", "motd")
+
+
+class HeartbeatPayloadBuilder:
+    """增量构建心跳请求体.
+
+    保存在线玩家集合及每个玩家预编码的JSON片段，玩家加入或离开时只编码变化的玩家，
+    每次心跳直接拼接出请求体字节，不再重建 ``PlayerLoginInfo`` 列表和 ``model_dump``。
+    生成的请求体与 ``HeartbeatRequest`` 的编码结果一致（省略为None的字段）。
+    """
+
+    def __init__(self) -> None:
+        """初始化构建器."""
+        # 玩家ID -> (玩家名, IP, 预编码片段)
+        self._players: Dict[int, Tuple[str, str, bytes]] = {}
+        self._player_list: Optional[bytes] = b"[]"
+        self._fields: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        """在线玩家数."""
+        return len(self._players)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._players
+
+    def add_player(self, player_id: int, name: str, ip: str) -> None:
+        """添加或更新在线玩家.
+
+        Args:
+            player_id: 玩家ID
+            name: 玩家名
+            ip: 登录IP
+        """
+        current = self._players.get(player_id)
+        if current is not None and current[0] == name and current[1] == ip:
+            return
+        fragment = PlayerLoginInfo(
+            player_id=player_id, name=name, ip=ip
+        ).model_dump_json()
+        self._players[player_id] = (name, ip, fragment.encode())
+        self._player_list = None
+
+    def remove_player(self, player_id: int) -> None:
+        """移除在线玩家.
+
+        Args:
+            player_id: 玩家ID
+        """
+        if self._players.pop(player_id, None) is not None:
+            self._player_list = None
+
+    def set_players(self, players: Iterable[PlayerLoginInfo]) -> None:
+        """将在线玩家同步为给定集合，只编码新增或变化的玩家.
+
+        Args:
+            players: 当前全部在线玩家
+        """
+        seen = set()
+        for player in players:
+            seen.add(player.player_id)
+            self.add_player(player.player_id, player.name, player.ip)
+        for player_id in [pid for pid in self._players if pid not in seen]:
+            self.remove_player(player_id)
+
+    def update(self, **fields: Any) -> None:
+        """更新心跳的标量字段（current_players、max_players、tps、version、motd）.
+
+        Args:
+            **fields: 字段值，None表示省略该字段
+
+        Raises:
+            ValueError: 未知字段
+        """
+        for name, value in fields.items():
+            if name not in _SCALAR_FIELDS:
+                raise ValueError(f"Unknown heartbeat field '{name}'")
+            if value is None:
+                self._fields.pop(name, None)
+            else:
+                self._fields[name] = value
+
+    def build(
+        self,
+        sequence_id: Optional[int] = None,
+        last_rtt_ms: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> bytes:
+        """生成心跳请求体.
+
+        未通过 :meth:`update` 设置 ``current_players`` 时使用在线玩家数。
+
+        Args:
+            sequence_id: 序列ID
+            last_rtt_ms: 最后RTT（毫秒）
+            timestamp: 时间戳
+
+        Returns:
+            JSON请求体字节
+        """
+        head: Dict[str, Any] = {}
+        if timestamp is not None:
+            head["timestamp"] = timestamp
+        if sequence_id is not None:
+            head["sequence_id"] = sequence_id
+        head.setdefault("current_players", len(self._players))
+        head.update(self._fields)
+        if last_rtt_ms is not None:
+            head["last_rtt_ms"] = last_rtt_ms
+
+        if self._player_list is None:
+            self._player_list = (
+                b"[" + b",".join(p[2] for p in self._players.values()) + b"]"
+            )
+        encoded = json.dumps(head, ensure_ascii=False, separators=(",", ":"))
+        return encoded[:-1].encode() + b',"player_list":' + self._player_list + b"}"
+
+
+class HeartbeatScheduler:
+    """后台心跳调度器.
+
+    - 按固定时间网格发送心跳，单次心跳的耗时不会累积为漂移
+    - 自动递增 ``sequence_id``，并用上一次测得的往返时间填充 ``last_rtt_ms``
+    - 根据 ``received_at`` / ``response_at`` 按NTP方式估计本地与服务端的时钟偏差
+    - 未指定 ``interval`` 时根据服务端返回的 ``expire_duration_ms`` 调整间隔
+    - API变慢时跳过错过的时间点并立即补发一次，而不是堆积心跳
+    """
+
+    #: 时钟偏差估计使用的最近样本数（取往返时间最短的样本）
+    CLOCK_SAMPLES = 8
+
+    def __init__(
+        self,
+        monitor: "MonitorService",
+        server_id: int,
+        provider: HeartbeatProvider,
+        *,
+        interval: Optional[float] = None,
+        expire_fraction: float = 1 / 3,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        initial_interval: float = 10.0,
+    ) -> None:
+        """初始化调度器.
+
+        Args:
+            monitor: 监控服务
+            server_id: 服务器ID
+            provider: 心跳内容提供函数，返回 HeartbeatRequest 或 HeartbeatPayloadBuilder
+            interval: 固定心跳间隔（秒），None表示根据 expire_duration_ms 自动调整
+            expire_fraction: 自动调整时心跳间隔占状态过期时间的比例
+            min_interval: 自动调整的最小间隔（秒）
+            max_interval: 自动调整的最大间隔（秒）
+            initial_interval: 收到首个心跳响应前使用的间隔（秒）
+        """
+        self._monitor = monitor
+        self.server_id = server_id
+        self._provider = provider
+        self._fixed_interval = interval
+        self.expire_fraction = expire_fraction
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = interval if interval is not None else initial_interval
+
+        self._task: Optional["asyncio.Task[None]"] = None
+        # (往返时间, 时钟偏差)，单位毫秒
+        self._clock_samples: Deque[Tuple[float, float]] = deque(
+            maxlen=self.CLOCK_SAMPLES
+        )
+
+        self.sequence_id = 0
+        self.last_rtt_ms: Optional[int] = None
+        self.clock_offset_ms: Optional[float] = None  # 服务端时间 - 本地时间
+        self.last_response: Optional[HeartbeatData] = None
+        self.last_error: Optional[Exception] = None
+        self.sent = 0  # 成功发送的心跳数
+        self.failed = 0  # 失败的心跳数
+        self.skipped = 0  # 因上一次心跳过慢而跳过的时间点数
+
+    @property
+    def running(self) -> bool:
+        """调度器是否正在运行."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """在后台启动调度（必须在事件循环中调用）."""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """停止调度并等待后台任务结束."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # 后台任务异常结束时只记录，不影响调用方关闭客户端
+            logger.error(f"Heartbeat task for server {self.server_id} failed: {e!r}")
+
+    def server_time_ms(self) -> int:
+        """按估计的时钟偏差换算的当前服务端时间（毫秒）."""
+        return int(time.time() * 1000 + (self.clock_offset_ms or 0.0))
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            delay = next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                await self.beat()
+            except Exception as e:
+                # beat 已处理发送错误；这里兜底，保证调度不会因意外异常停止
+                self.failed += 1
+                self.last_error = e
+                logger.error(f"Heartbeat failed for server {self.server_id}: {e!r}")
+
+            # 下一个时间点基于网格而不是本次完成时间，避免漂移
+            next_at += self.interval
+            now = loop.time()
+            if now > next_at:
+                # 心跳过慢：跳过已错过的时间点，只立即补发一次
+                missed = int((now - next_at) // self.interval)
+                if missed:
+                    self.skipped += missed
+                    next_at += missed * self.interval
+                    logger.warning(
+                        f"Heartbeat for server {self.server_id} is late, skipped {missed} beat(s)"
+                    )
+
+    async def beat(self) -> Optional[HeartbeatData]:
+        """立即发送一次心跳.
+
+        Returns:
+            心跳响应数据，发送失败时返回None
+        """
+        try:
+            request = self._provider()
+            if inspect.isawaitable(request):
+                request = await request
+        except Exception as e:
+            self.failed += 1
+            self.last_error = e
+            logger.error(f"Heartbeat provider failed for server {self.server_id}: {e}")
+            return None
+
+        self.sequence_id += 1
+        body: Union[HeartbeatRequest, bytes]
+        if isinstance(request, HeartbeatPayloadBuilder):
+            body = request.build(
+                sequence_id=self.sequence_id,
+                last_rtt_ms=self.last_rtt_ms,
+                timestamp=int(time.time()),
+            )
+        else:
+            update = {"sequence_id": self.sequence_id, "last_rtt_ms": self.last_rtt_ms}
+            if request.timestamp is None:
+                update["timestamp"] = int(time.time())
+            body = request.model_copy(update=update)
+
+        sent_at = time.time() * 1000
+        start = time.perf_counter()
+        try:
+            data = await self._monitor.heartbeat(self.server_id, body)
+        except Exception as e:
+            # 除SDK异常外还包括响应格式错误（pydantic ValidationError）等
+            self.failed += 1
+            self.last_error = e
+            logger.warning(f"Heartbeat failed for server {self.server_id}: {e}")
+            return None
+        rtt_ms = (time.perf_counter() - start) * 1000
+        received_at = time.time() * 1000
+
+        self.sent += 1
+        self.last_rtt_ms = round(rtt_ms)
+        self.last_response = data
+        self._update_clock(sent_at, data, received_at)
+        self._update_interval(data)
+        return data
+
+    def _update_clock(
+        self, sent_at: float, data: HeartbeatData, received_at: float
+    ) -> None:
+        """按NTP算法更新时钟偏差估计."""
+        server_time = data.response_at - data.received_at
+        delay = (received_at - sent_at) - server_time
+        offset = ((data.received_at - sent_at) + (data.response_at - received_at)) / 2
+        self._clock_samples.append((delay, offset))
+        # 往返时间最短的样本受网络排队影响最小，偏差估计最准确
+        self.clock_offset_ms = min(self._clock_samples)[1]
+
+    def _update_interval(self, data: HeartbeatData) -> None:
+        """根据状态过期时间调整心跳间隔."""
+        if self._fixed_interval is not None or data.expire_duration_ms <= 0:
+            return
+        interval = data.expire_duration_ms / 1000 * self.expire_fraction
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
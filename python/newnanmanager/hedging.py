@@ -0,0 +1,61 @@
+"""Hedged GET requests for NewNanManager SDK."""
+
+from typing import Dict, Optional, Tuple
+
+from .config import HedgeConfig
+from .metrics import LatencyHistogram
+from .retry import RetryBudget
+
+
+class Hedger:
+    """决定是否以及何时对GET请求发出对冲请求.
+
+    按端点模板统计最近的成功耗时，请求在 ``percentile`` 分位耗时内没有完成时，
+    在另一个池化连接上再发一次相同请求，先返回的结果胜出，另一个被取消。
+    对冲请求消耗预算额度（每个请求积累 ``budget_ratio`` 个），额外负载因此有上限。
+    """
+
+    def __init__(self, config: HedgeConfig) -> None:
+        """初始化对冲器.
+
+        Args:
+            config: 对冲配置
+        """
+        self.config = config
+        # 端点模板 -> (当前窗口, 上一个窗口)，窗口满 window_size 个样本后轮换
+        self._latency: Dict[str, Tuple[LatencyHistogram, LatencyHistogram]] = {}
+        self.budget = RetryBudget(config.budget_ratio, 0.0, config.budget_burst)
+        self.hedged = 0  # 发出的对冲请求数
+        self.wins = 0  # 对冲请求先于原请求返回的次数
+
+    def applies(self, template: str) -> bool:
+        """端点是否启用对冲."""
+        endpoints = self.config.endpoints
+        return endpoints is None or template in endpoints
+
+    def delay(self, template: str) -> Optional[float]:
+        """发出对冲请求前的等待时间（秒），样本不足时返回None."""
+        windows = self._latency.get(template)
+        if windows is None:
+            return None
+        for histogram in windows:
+            if histogram.count >= self.config.min_samples:
+                delay = histogram.quantile(self.config.percentile)
+                return max(delay, self.config.min_delay)
+        return None
+
+    def record(self, template: str, elapsed: float) -> None:
+        """记录一次成功请求的耗时.
+
+        Args:
+            template: 端点模板
+            elapsed: 耗时（秒）
+        """
+        windows = self._latency.get(template)
+        if windows is None:
+            windows = self._latency[template] = (LatencyHistogram(), LatencyHistogram())
+        current = windows[0]
+        if current.count >= self.config.window_size:
+            current = LatencyHistogram()
+            self._latency[template] = (current, windows[0])
+        current.record(elapsed)
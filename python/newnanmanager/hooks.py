@@ -0,0 +1,199 @@
+"""Request lifecycle hooks for NewNanManager SDK."""
+
+import asyncio
+import inspect
+import logging
+import os
+import sys
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from .metrics import RequestTiming
+
+logger = logging.getLogger(__name__)
+
+#: 调用栈帧：(文件名, 行号, 函数名)
+CallSite = List[Tuple[str, int, str]]
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+# 事件循环和任务调度的帧对定位调用方没有帮助
+_ASYNCIO_DIR = os.path.dirname(os.path.abspath(asyncio.__file__)) + os.sep
+
+
+def capture_call_site(depth: int) -> CallSite:
+    """捕获SDK和asyncio外部的调用栈（由近及远）.
+
+    Args:
+        depth: 最多保留的帧数
+
+    Returns:
+        调用栈帧列表
+    """
+    frames: CallSite = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < depth:
+        code = frame.f_code
+        filename = code.co_filename
+        if not filename.startswith(_PACKAGE_DIR) and not filename.startswith(
+            _ASYNCIO_DIR
+        ):
+            frames.append((filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back  # type: ignore[assignment]
+    return frames
+
+
+class HookEvent(str, Enum):
+    """请求生命周期事件."""
+
+    BEFORE_REQUEST = "before_request"  # 每次尝试发送前
+    AFTER_RESPONSE = "after_response"  # 每次尝试收到响应后（含错误状态码）
+    ON_RETRY = "on_retry"  # 尝试失败、等待重试前
+    ON_ERROR = "on_error"  # 调用最终以异常结束
+
+
+class RequestInfo:
+    """传给钩子的请求信息.
+
+    同一次尝试的 before_request、after_response、on_retry 收到的是同一个对象，
+    字段随请求进展逐步填充。
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "template",
+        "url",
+        "attempt",
+        "request_bytes",
+        "timing",
+        "error",
+        "retry_delay",
+        "call_site",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        url: str,
+        attempt: int,
+        request_bytes: int,
+        timing: RequestTiming,
+        call_site: Optional[CallSite] = None,
+    ) -> None:
+        self.method = method
+        self.endpoint = endpoint  # 实际端点路径
+        self.template = template  # 端点模板，如 /api/v1/players/{id}
+        self.url = url
+        self.attempt = attempt  # 尝试序号，从1开始
+        self.request_bytes = request_bytes
+        self.timing = timing  # 本次尝试的分阶段耗时
+        self.error: Optional[BaseException] = None
+        self.retry_delay: Optional[float] = None  # on_retry 时的等待时间（秒）
+        # 发起调用处的调用栈（Hooks.call_site_depth 大于0时捕获）
+        self.call_site = call_site
+
+    @property
+    def status(self) -> int:
+        """响应状态码，0表示尚未收到响应."""
+        return self.timing.status
+
+    @property
+    def response_bytes(self) -> Optional[int]:
+        """响应体字节数."""
+        return self.timing.response_bytes
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """本次尝试的耗时（秒）."""
+        return self.timing.elapsed
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestInfo({self.method} {self.template}, attempt={self.attempt}, "
+            f"status={self.status}, elapsed={self.elapsed})"
+        )
+
+
+#: 钩子函数，可以是同步或异步函数
+Hook = Callable[[RequestInfo], Union[None, Awaitable[None]]]
+
+
+class Hooks:
+    """请求生命周期钩子注册表.
+
+    未注册任何钩子时HTTP客户端不创建 :class:`RequestInfo`，请求路径上没有额外开销。
+    钩子抛出的异常会被记录并忽略，不影响请求本身。
+    """
+
+    def __init__(self) -> None:
+        """初始化注册表."""
+        self._hooks: Dict[HookEvent, List[Hook]] = {event: [] for event in HookEvent}
+        self._count = 0
+        #: 大于0时在调用处捕获最多这么多帧调用栈，填入 RequestInfo.call_site
+        self.call_site_depth = 0
+        #: 捕获调用栈的调用比例（0~1），未被采样的调用 call_site 为None
+        self.call_site_sample_rate = 1.0
+
+    def __bool__(self) -> bool:
+        """是否注册了任何钩子."""
+        return self._count > 0
+
+    def register(self, event: Union[HookEvent, str], hook: Hook) -> Hook:
+        """注册钩子.
+
+        Args:
+            event: 事件
+            hook: 钩子函数
+
+        Returns:
+            钩子函数本身（便于用作装饰器）
+        """
+        self._hooks[HookEvent(event)].append(hook)
+        self._count += 1
+        return hook
+
+    def unregister(self, event: Union[HookEvent, str], hook: Hook) -> None:
+        """注销钩子.
+
+        Args:
+            event: 事件
+            hook: 钩子函数
+
+        Raises:
+            ValueError: 钩子未注册
+        """
+        self._hooks[HookEvent(event)].remove(hook)
+        self._count -= 1
+
+    def before_request(self, hook: Hook) -> Hook:
+        """注册 before_request 钩子（可用作装饰器）."""
+        return self.register(HookEvent.BEFORE_REQUEST, hook)
+
+    def after_response(self, hook: Hook) -> Hook:
+        """注册 after_response 钩子（可用作装饰器）."""
+        return self.register(HookEvent.AFTER_RESPONSE, hook)
+
+    def on_retry(self, hook: Hook) -> Hook:
+        """注册 on_retry 钩子（可用作装饰器）."""
+        return self.register(HookEvent.ON_RETRY, hook)
+
+    def on_error(self, hook: Hook) -> Hook:
+        """注册 on_error 钩子（可用作装饰器）."""
+        return self.register(HookEvent.ON_ERROR, hook)
+
+    async def emit(self, event: HookEvent, info: RequestInfo) -> None:
+        """依次调用事件的全部钩子.
+
+        Args:
+            event: 事件
+            info: 请求信息
+        """
+        for hook in list(self._hooks[event]):
+            try:
+                result: Any = hook(info)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"{event.value} hook {hook!r} failed: {e}")
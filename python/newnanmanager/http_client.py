@@ -3,13 +3,40 @@
 import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional, Type, TypeVar, Union, overload
+import random
+import time
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 from urllib.parse import urlencode, urljoin
 
 import aiohttp
 from pydantic import BaseModel
 
-from .config import ClientConfig
+from .balancer import LoadBalancer, Replica
+from .cache import (
+    CacheState,
+    CacheStats,
+    ResponseCache,
+    ValidatorStore,
+    affected_by_write,
+)
+from .circuit import CircuitBreakers
+from .codec import DecodeMode, RequestBody, decode_body, encode_body, get_codec
+from .concurrency import AdaptiveConcurrencyLimiter
+from .config import CachePolicy, ClientConfig, TimeoutProfile
 from .exceptions import (
     ApiErrorException,
     ConnectionException,
@@ -17,6 +44,17 @@ from .exceptions import (
     NewNanManagerException,
     TimeoutException,
 )
+from .hedging import Hedger
+from .hooks import CallSite, HookEvent, Hooks, RequestInfo, capture_call_site
+from .metrics import ClientMetrics, RequestTiming
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .slowlog import SlowRequestLog
+from .timeouts import attempt_timeout, current_deadline, resolve_profile
+from .transport import build_connector
+from .utils import endpoint_template
+
 # 移除不再使用的统一响应格式导入
 # from .models.common import ApiResponse, ErrorResponse
 
@@ -24,6 +62,128 @@ T = TypeVar("T", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+#: 当前上下文中读取到的响应体字节数记录（由分页调优等调用方设置）
+response_sizes: ContextVar[Optional[List[int]]] = ContextVar(
+    "newnanmanager_response_sizes", default=None
+)
+
+
+class _PreparedRequest:
+    """已完成URL构建和请求体编码的请求."""
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "path",
+        "full_url",
+        "body",
+        "response_model",
+        "decode_mode",
+        "call_site",
+        "log_body",
+        "deadline",
+        "timeout_profile",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        query_string: str,
+        full_url: str,
+        body: Optional[bytes],
+        response_model: Optional[Type[Any]],
+        decode_mode: DecodeMode,
+    ) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.path = endpoint + query_string  # 带查询参数的端点
+        self.full_url = full_url
+        self.body = body
+        self.response_model = response_model
+        self.decode_mode = decode_mode
+        self.call_site: Optional[CallSite] = None
+        self.log_body = False  # DEBUG日志是否记录本次请求的请求/响应体
+        # 调用方的整体期限（time.monotonic）和超时配置档；合并的请求不使用调用方期限
+        self.deadline: Optional[float] = None
+        self.timeout_profile: Optional[TimeoutProfile] = None
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        """缓存和条件请求使用的键."""
+        return (self.method, self.full_url, self.response_model, self.decode_mode)
+
+    @property
+    def coalesce_key(self) -> Tuple[Any, ...]:
+        """请求合并使用的键，超时配置档不同的调用不合并."""
+        return self.key + (self.timeout_profile,)
+
+
+def _error_status(error: BaseException) -> Optional[int]:
+    """HTTP错误的状态码（ApiErrorException 的 error_code 为HTTP状态码）."""
+    if isinstance(error, HttpException):
+        return error.status_code
+    if isinstance(error, ApiErrorException):
+        return error.error_code
+    return None
+
+
+def _is_outage(error: BaseException) -> bool:
+    """调用最终失败的原因是否说明服务不可用（连接错误、超时或5xx）."""
+    if isinstance(
+        error,
+        (
+            ConnectionException,
+            TimeoutException,
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+        ),
+    ):
+        return True
+    status = _error_status(error)
+    return status is not None and status >= 500
+
+
+async def _within_deadline(
+    awaitable: Awaitable[Any], deadline_at: Optional[float], message: str
+) -> Any:
+    """等待 ``awaitable``，超过整体期限时抛出 TimeoutException.
+
+    Args:
+        awaitable: 等待的对象（如限速器或并发限制器的 acquire）
+        deadline_at: 整体期限（time.monotonic），None表示不限制
+        message: 超过期限时的异常信息
+
+    Returns:
+        ``awaitable`` 的结果
+    """
+    if deadline_at is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, deadline_at - time.monotonic())
+    except asyncio.TimeoutError:
+        error = TimeoutException(message)
+        error.retries_exhausted = True
+        raise error from None
+
+
+def _final_error(error: BaseException, attempts: int) -> BaseException:
+    """将最终失败的网络错误转换为SDK异常，其他异常原样返回."""
+    if isinstance(error, asyncio.TimeoutError):
+        return TimeoutException(f"Request timeout after {attempts} attempt(s)")
+    if isinstance(error, aiohttp.ClientError):
+        return ConnectionException(f"Connection error: {error}")
+    return error
+
+
+def _format_body(body: bytes, limit: int) -> str:
+    """格式化请求/响应体用于日志，超过 ``limit`` 字节的部分截断."""
+    if not body:
+        return ""
+    if len(body) <= limit:
+        return f", body: {body!r}"
+    return f", body: {body[:limit]!r}... ({len(body) - limit} more bytes)"
+
 
 class HttpClient:
     """HTTP客户端基础类."""
@@ -36,6 +196,49 @@ class HttpClient:
         """
         self.config = config
         self._session: Optional[aiohttp.ClientSession] = None
+        # 在首次使用时创建，避免在事件循环之外创建 asyncio.Lock
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._keep_warm_task: Optional["asyncio.Future[None]"] = None
+        self._last_used = 0.0  # 最近一次发送请求的时间（time.perf_counter）
+        self._inflight: SingleFlight[Any] = SingleFlight()
+        self._codec = get_codec(config.json_codec)
+        self._cache = ResponseCache(config.cache) if config.cache else None
+        self._refresh_tasks: Set["asyncio.Future[Any]"] = set()
+        self._validators = (
+            ValidatorStore(config.validator_cache_size)
+            if config.conditional_requests
+            else None
+        )
+        self.metrics = ClientMetrics() if config.metrics else None
+        self.hooks = Hooks()
+        self.rate_limiter = (
+            RateLimiter(config.rate_limit) if config.rate_limit else None
+        )
+        self.retry_policy = RetryPolicy(
+            config.retry, config.max_retries, config.retry_delay
+        )
+        self.hedger = Hedger(config.hedging) if config.hedging else None
+        self.balancer = (
+            LoadBalancer([config.base_url, *config.base_urls], config.load_balancing)
+            if config.base_urls
+            else None
+        )
+        self.circuit_breakers = (
+            CircuitBreakers(config.circuit_breaker) if config.circuit_breaker else None
+        )
+        self.concurrency_limiter = (
+            AdaptiveConcurrencyLimiter(config.concurrency_limit)
+            if config.concurrency_limit
+            else None
+        )
+        self.slow_log = (
+            SlowRequestLog(
+                config.slow_request_threshold,
+                sample_rate=config.slow_request_sample_rate,
+            ).install(self.hooks)
+            if config.slow_request_threshold is not None
+            else None
+        )
 
         # 设置默认请求头
         self._headers = {
@@ -47,8 +250,10 @@ class HttpClient:
         }
 
     async def __aenter__(self) -> "HttpClient":
-        """异步上下文管理器入口."""
+        """异步上下文管理器入口，配置了 ``prewarm_connections`` 时预热连接池."""
         await self._ensure_session()
+        if self.config.prewarm_connections > 0:
+            await self.prewarm()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -56,36 +261,116 @@ class HttpClient:
         await self.close()
 
     async def _ensure_session(self) -> None:
-        """确保会话已创建."""
-        if self._session is None or self._session.closed:
+        """确保会话已创建.
+
+        并发的首次调用只会创建一个会话；配置了 ``keep_warm_interval`` 时同时启动保温任务。
+        """
+        session = self._session
+        if session is not None and not session.closed:
+            return
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        async with self._session_lock:
+            if self._session is not None and not self._session.closed:
+                return  # 等待锁期间已由其他调用创建
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            connector = aiohttp.TCPConnector(
-                limit=self.config.connection_pool_size,
-                limit_per_host=self.config.connection_pool_size_per_host,
-                verify_ssl=self.config.verify_ssl,
-            )
+            connector = build_connector(self.config)
             self._session = aiohttp.ClientSession(
                 headers=self._headers,
                 timeout=timeout,
                 connector=connector,
+                trace_configs=(
+                    [self.metrics.trace_config()] if self.metrics is not None else None
+                ),
+            )
+            interval = self.config.keep_warm_interval
+            if interval and self._keep_warm_task is None:
+                self._keep_warm_task = asyncio.ensure_future(self._keep_warm(interval))
+
+    async def prewarm(self, connections: Optional[int] = None) -> int:
+        """预先建立keep-alive连接，同时完成DNS解析和TLS握手.
+
+        向每个副本并发发送 ``connections`` 个 ``HEAD warmup_path`` 请求，
+        连接池中因此至少有这么多空闲连接。预热失败只记录日志，不抛出异常。
+
+        Args:
+            connections: 每个副本的连接数，默认为 ``prewarm_connections`` （至少1个）
+
+        Returns:
+            成功预热的连接数
+        """
+        await self._ensure_session()
+        count = (
+            connections if connections is not None else self.config.prewarm_connections
+        )
+        count = min(max(count, 1), self.config.connection_pool_size_per_host)
+        base_urls = (
+            [replica.base_url for replica in self.balancer.replicas]
+            if self.balancer is not None
+            else [self.config.base_url]
+        )
+        results = await asyncio.gather(
+            *(
+                self._warm_connection(
+                    self._build_url(self.config.warmup_path, base_url)
+                )
+                for base_url in base_urls
+                for _ in range(count)
+            ),
+            return_exceptions=True,
+        )
+        warmed = sum(1 for result in results if not isinstance(result, BaseException))
+        if warmed < len(results):
+            error = next(r for r in results if isinstance(r, BaseException))
+            logger.warning(
+                f"Pre-warmed {warmed}/{len(results)} connections, last error: {error!r}"
             )
+        else:
+            logger.debug("Pre-warmed %d connections", warmed)
+        return warmed
+
+    async def _warm_connection(self, url: str) -> None:
+        """发送一个HEAD请求，使连接留在连接池中."""
+        if self._session is None:
+            raise ConnectionException("HTTP session is not initialized")
+        async with self._session.head(url, allow_redirects=False) as response:
+            await response.read()
+
+    async def _keep_warm(self, interval: float) -> None:
+        """空闲超过 ``interval`` 秒时重新预热，避免连接因keep-alive超时被关闭."""
+        while True:
+            await asyncio.sleep(interval)
+            if time.perf_counter() - self._last_used < interval:
+                continue  # 有请求在使用连接池
+            await self.prewarm()
 
     async def close(self) -> None:
-        """关闭HTTP会话."""
+        """等待后台缓存刷新完成并关闭HTTP会话."""
+        keep_warm = self._keep_warm_task
+        if keep_warm is not None:
+            self._keep_warm_task = None
+            keep_warm.cancel()
+            await asyncio.gather(keep_warm, return_exceptions=True)
+        # 等待后台缓存刷新完成后再关闭会话；刷新经由请求合并执行，取消外层任务
+        # 并不会停止实际的请求，它会在已关闭的会话上失败并重试
+        while self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
 
-    def _build_url(self, endpoint: str) -> str:
+    def _build_url(self, endpoint: str, base_url: Optional[str] = None) -> str:
         """构建完整的URL.
 
         Args:
             endpoint: API端点
+            base_url: 基础URL，默认为 ``config.base_url``
 
         Returns:
             完整的URL
         """
-        return urljoin(self.config.base_url.rstrip("/") + "/", endpoint.lstrip("/"))
+        base_url = base_url or self.config.base_url
+        return urljoin(base_url.rstrip("/") + "/", endpoint.lstrip("/"))
 
     def _build_query_params(self, params: Optional[Dict[str, Any]]) -> str:
         """构建查询参数字符串.
@@ -111,8 +396,9 @@ class HttpClient:
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        json_data: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        json_data: Optional[RequestBody] = None,
         response_model: Optional[Type[T]] = None,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> Union[T, Dict[str, Any]]:
         """发送HTTP请求.
 
@@ -120,8 +406,9 @@ class HttpClient:
             method: HTTP方法
             endpoint: API端点
             params: 查询参数
-            json_data: JSON数据
+            json_data: JSON数据（模型、字典或预编码的JSON字节）
             response_model: 响应模型类
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             响应数据
@@ -135,67 +422,669 @@ class HttpClient:
         query_string = self._build_query_params(params)
         full_url = url + query_string
 
-        # 准备请求数据
-        request_json = None
-        if json_data is not None:
-            if isinstance(json_data, BaseModel):
-                request_json = json_data.model_dump(exclude_none=True, by_alias=True)
-            else:
-                request_json = json_data  # type: ignore
+        # 准备请求数据：模型直接序列化为JSON字节，不经过中间dict
+        body = encode_body(json_data, self._codec) if json_data is not None else None
 
-        logger.debug(f"Making {method} request to {full_url}")
-        if request_json:
-            logger.debug(f"Request data: {request_json}")
+        request = _PreparedRequest(
+            method,
+            endpoint,
+            query_string,
+            full_url,
+            body,
+            response_model,
+            decode_mode or self.config.decode_mode,
+        )
+        request.deadline = current_deadline()
+        request.timeout_profile = resolve_profile(
+            self.config, method, endpoint_template(endpoint)
+        )
+        hooks = self.hooks
+        if hooks.call_site_depth and (
+            hooks.call_site_sample_rate >= 1.0
+            or random.random() < hooks.call_site_sample_rate
+        ):
+            # 在调用方的任务中捕获，合并请求的后台任务中已没有调用方的栈帧
+            request.call_site = capture_call_site(hooks.call_site_depth)
+        # 关闭DEBUG日志时不格式化任何内容，尤其是请求/响应体
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_request(request)
+        result: Union[T, Dict[str, Any]] = await self._dispatch(request)
+        return result
+
+    async def _dispatch(self, request: _PreparedRequest) -> Any:
+        """按请求类型选择缓存、请求合并或直接发送.
+
+        Args:
+            request: 请求
+
+        Returns:
+            响应数据
+        """
+        if request.method == "GET":
+            if self._cache is not None:
+                policy = self._cache.policy_for(request.endpoint)
+                if policy is not None:
+                    return await self._cached_get(self._cache, request, policy)
+
+            # 合并并发的相同GET请求，共享一次往返和一个解码后的模型
+            if self.config.coalesce_requests:
+                return await self._coalesced(
+                    request, lambda: self._send_with_retry(request)
+                )
+
+            return await self._send_with_retry(request)
+
+        try:
+            return await self._send_with_retry(request)
+        finally:
+            # 写操作（无论成功与否）都可能改变服务端状态：之后的GET不再加入
+            # 写入前发出的合并请求，也不再命中缓存
+            self._inflight.forget(affected_by_write(request.endpoint))
+            if self._cache is not None:
+                self._cache.invalidate_for_write(request.endpoint)
+
+    async def _coalesced(
+        self, request: _PreparedRequest, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """经由请求合并执行 ``func``.
+
+        共享的请求不受任何一个调用方期限的约束（期限只影响等待），
+        每个调用方按自己的期限等待结果，超过期限时抛出 TimeoutException。
+
+        Args:
+            request: 请求
+            func: 实际发送请求的协程工厂
+
+        Returns:
+            响应数据
+        """
+        deadline_at = request.deadline
+        request.deadline = None
+        return await _within_deadline(
+            self._inflight.do(request.coalesce_key, func, request.path),
+            deadline_at,
+            "Deadline exceeded while waiting for a coalesced request",
+        )
+
+    async def _cached_get(
+        self,
+        cache: ResponseCache,
+        request: _PreparedRequest,
+        policy: CachePolicy,
+    ) -> Any:
+        """通过响应缓存发送GET请求.
+
+        新鲜命中直接返回；过期但仍在stale_ttl内时返回旧值并在后台刷新；
+        未命中时请求并写入缓存。同一键的刷新和填充经由请求合并只发出一次。
 
+        Args:
+            cache: 响应缓存
+            request: 请求
+            policy: 缓存策略
+
+        Returns:
+            响应数据
+        """
+        key = (request.path, request.response_model, request.decode_mode)
+
+        async def fetch() -> Any:
+            generation = cache.generation
+            result = await self._send_with_retry(request)
+            cache.store(key, request.path, result, policy, generation)
+            return result
+
+        state, value = cache.lookup(key)
+        if state is CacheState.FRESH:
+            return value
+        if state is CacheState.STALE:
+            # 后台刷新不受调用方期限的约束
+            request.deadline = None
+            task = asyncio.ensure_future(
+                self._inflight.do(request.coalesce_key, fetch, request.path)
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._on_refresh_done)
+            return value
+        return await self._coalesced(request, fetch)
+
+    def _on_refresh_done(self, task: "asyncio.Future[Any]") -> None:
+        """后台刷新完成回调."""
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """获取响应缓存统计信息.
+
+        Returns:
+            缓存统计信息，未启用缓存时返回None
+        """
+        return self._cache.stats() if self._cache is not None else None
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> int:
+        """手动使响应缓存失效.
+
+        Args:
+            prefix: 端点前缀，None表示清空全部缓存
+
+        Returns:
+            失效的条目数
+        """
+        return self._cache.invalidate(prefix) if self._cache is not None else 0
+
+    def coalesce_stats(self) -> Dict[str, int]:
+        """获取请求合并统计信息.
+
+        Returns:
+            实际发出的请求数（calls）和加入在途请求的调用数（shared）
+        """
+        return {"calls": self._inflight.calls, "shared": self._inflight.shared}
+
+    def conditional_stats(self) -> Optional[Dict[str, int]]:
+        """获取条件请求统计信息.
+
+        Returns:
+            服务端返回304的次数（not_modified），未启用条件请求时返回None
+        """
+        validators = self._validators
+        if validators is None:
+            return None
+        return {"not_modified": validators.not_modified}
+
+    def connection_stats(self) -> Dict[str, int]:
+        """获取连接池使用情况.
+
+        Returns:
+            连接上限、每主机上限、使用中和空闲连接数，会话未创建时返回空字典
+        """
+        connector = self._session.connector if self._session is not None else None
+        if connector is None:
+            return {}
+        # aiohttp 未公开连接数，读取 BaseConnector 的内部状态
+        idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        return {
+            "limit": connector.limit,
+            "limit_per_host": connector.limit_per_host,
+            "in_use": len(getattr(connector, "_acquired", ())),
+            "idle": idle,
+        }
+
+    async def _send_with_retry(self, request: _PreparedRequest) -> Any:
+        """经过端点组的熔断器发送请求并在连接错误时重试.
+
+        Args:
+            request: 请求
+
+        Returns:
+            响应数据
+
+        Raises:
+            CircuitOpenException: 熔断器打开
+            NewNanManagerException: 各种API异常
+        """
+        breakers = self.circuit_breakers
+        if breakers is None:
+            return await self._send_observed(request)
+
+        breaker = breakers.get(request.endpoint)
+        probe = breaker.allow()
+        failed: Optional[bool] = None
+        try:
+            result = await self._send_observed(request)
+            failed = False
+            return result
+        except Exception as e:
+            failed = _is_outage(e)
+            raise
+        finally:
+            breaker.record(probe, failed)
+
+    async def _send_observed(self, request: _PreparedRequest) -> Any:
+        """发送请求并重试，同时记录指标和调用钩子.
+
+        Args:
+            request: 请求
+
+        Returns:
+            响应数据
+        """
+        metrics = self.metrics
+        hooks = self.hooks if self.hooks else None
+        if metrics is None and hooks is None:
+            # 未收集指标且没有钩子时不创建任何逐次尝试的记录
+            return await self._retry_loop(request, None, None)
+
+        attempts: List[RequestInfo] = []
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await self._retry_loop(request, attempts, hooks)
+            failed = False
+            return result
+        except Exception as e:
+            if hooks is not None and attempts:
+                info = attempts[-1]
+                info.error = e
+                await hooks.emit(HookEvent.ON_ERROR, info)
+            raise
+        finally:
+            if metrics is not None:
+                metrics.record_request(
+                    request.method,
+                    request.endpoint,
+                    time.perf_counter() - started,
+                    len(attempts),
+                    attempts[-1].status if attempts else 0,
+                    failed,
+                )
+
+    async def _retry_loop(
+        self,
+        request: _PreparedRequest,
+        attempts: Optional[List[RequestInfo]],
+        hooks: Optional[Hooks],
+    ) -> Any:
+        """按重试策略发送请求.
+
+        Args:
+            request: 请求
+            attempts: 收集指标或调用钩子时，每次尝试的请求信息追加到此列表
+            hooks: 生命周期钩子
+
+        Returns:
+            响应数据
+        """
         # 重试逻辑
-        last_exception = None
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                if self._session is None:
-                    raise ConnectionException("HTTP session is not initialized")
-
-                async with self._session.request(
-                    method,
-                    full_url,
-                    json=request_json,
-                ) as response:
-                    result = await self._handle_response(response, response_model)
-                    logger.debug(
-                        f"Request completed successfully in {attempt + 1} attempt(s)"
-                    )
-                    return result
-
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                last_exception = e
-                if attempt < self.config.max_retries:
-                    delay = self.config.retry_delay * (2**attempt)  # 指数退避
-                    logger.warning(
-                        f"Request failed (attempt {attempt + 1}), retrying in {delay}s: {e}"
+        limiter = self.rate_limiter
+        policy = self.retry_policy
+        balancer = self.balancer
+        breaker = (
+            self.circuit_breakers.get(request.endpoint)
+            if self.circuit_breakers is not None
+            else None
+        )
+        tried: List[Replica] = []  # 本次调用已尝试的副本，重试时优先换到其他副本
+        template = endpoint_template(request.endpoint)
+        profile = request.timeout_profile
+        deadline_at = request.deadline
+        if profile is not None and profile.deadline is not None:
+            profile_deadline = time.monotonic() + profile.deadline
+            if deadline_at is None or profile_deadline < deadline_at:
+                deadline_at = profile_deadline
+            # 发送过程中（如等待并发名额）也按包含配置档期限的整体期限计算
+            request.deadline = deadline_at
+
+        policy.budget.deposit()
+        attempt = 0  # 已消耗的重试次数
+        throttled = 0  # 因429排队后重发的次数，不计入重试次数
+        while True:
+            if limiter is not None:
+                await _within_deadline(
+                    limiter.acquire(self.config.token, template),
+                    deadline_at,
+                    f"Deadline exceeded after {attempt + throttled} attempt(s) "
+                    "while waiting for the rate limiter",
+                )
+            remaining = None
+            if deadline_at is not None:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    expired = TimeoutException(
+                        f"Deadline exceeded after {attempt + throttled} attempt(s)"
                     )
-                    await asyncio.sleep(delay)
+                    expired.retries_exhausted = True
+                    raise expired
+            replica = None
+            url = request.full_url
+            if balancer is not None:
+                replica = balancer.pick(tried)
+                tried.append(replica)
+                url = replica.url(request.path)
+            info = None
+            if attempts is not None:
+                info = RequestInfo(
+                    request.method,
+                    request.endpoint,
+                    template,
+                    url,
+                    attempt + throttled + 1,
+                    len(request.body) if request.body else 0,
+                    RequestTiming(),
+                    request.call_site,
+                )
+                attempts.append(info)
+                if hooks is not None:
+                    await hooks.emit(HookEvent.BEFORE_REQUEST, info)
+
+            attempt_started = time.perf_counter()
+            try:
+                result = await self._send_hedged(
+                    request,
+                    info.timing if info is not None else None,
+                    attempt_timeout(self.config, profile, remaining),
+                    replica,
+                )
+            except Exception as e:
+                if info is not None:
+                    info.error = e
+                    info.timing.timed_out = isinstance(e, asyncio.TimeoutError)
+                    await self._finish_attempt(request, info, attempt_started, hooks)
+                if (
+                    limiter is not None
+                    and throttled < limiter.config.max_throttle_retries
+                    and _error_status(e) == 429
+                ):
+                    # 限速器已按 Retry-After 暂停令牌桶，重新排队即可
+                    throttled += 1
+                    if hooks is not None and info is not None:
+                        info.retry_delay = 0.0
+                        await hooks.emit(HookEvent.ON_RETRY, info)
                     continue
-                break
 
-        # 处理最终失败
-        if isinstance(last_exception, asyncio.TimeoutError):
-            raise TimeoutException(
-                f"Request timeout after {self.config.max_retries + 1} attempts"
+                delay = policy.next_delay(request.method, template, e, attempt)
+                if (
+                    delay is not None
+                    and deadline_at is not None
+                    and time.monotonic() + delay >= deadline_at
+                ):
+                    delay = None  # 退避结束时已超过整体期限
+                if delay is not None and breaker is not None and breaker.is_open:
+                    delay = None  # 熔断器已经打开，不再重试
+                if (
+                    delay is not None
+                    and balancer is not None
+                    and balancer.has_untried(tried)
+                ):
+                    delay = 0.0  # 换到尚未尝试的副本，不必等待退避
+                if delay is None:
+                    error = _final_error(e, attempt + throttled + 1)
+                    if isinstance(error, NewNanManagerException):
+                        # 调用方（如离线玩家缓冲区）据此避免在已放弃的重试之上再次重试
+                        error.retries_exhausted = policy.is_retryable(
+                            request.method, template, e
+                        )
+                    if error is e:
+                        raise
+                    raise error from e
+
+                logger.warning(
+                    f"Request failed (attempt {attempt + throttled + 1}), "
+                    f"retrying in {delay:.2f}s: {e!r}"
+                )
+                if hooks is not None and info is not None:
+                    info.retry_delay = delay
+                    await hooks.emit(HookEvent.ON_RETRY, info)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if info is not None:
+                await self._finish_attempt(request, info, attempt_started, hooks)
+            logger.debug(
+                "Request completed successfully in %d attempt(s)",
+                attempt + throttled + 1,
             )
-        elif isinstance(last_exception, aiohttp.ClientError):
-            raise ConnectionException(f"Connection error: {last_exception}")
-        else:
-            raise NewNanManagerException(f"Unexpected error: {last_exception}")
+            return result
+
+    async def _finish_attempt(
+        self,
+        request: _PreparedRequest,
+        info: RequestInfo,
+        started: float,
+        hooks: Optional[Hooks],
+    ) -> None:
+        """记录一次尝试的耗时，并在收到响应时调用 after_response 钩子."""
+        info.timing.elapsed = time.perf_counter() - started
+        if self.metrics is not None:
+            self.metrics.record_attempt(request.method, request.endpoint, info.timing)
+        if hooks is not None and info.status:
+            await hooks.emit(HookEvent.AFTER_RESPONSE, info)
+
+    async def _send_hedged(
+        self,
+        request: _PreparedRequest,
+        timing: Optional[RequestTiming] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        replica: Optional[Replica] = None,
+    ) -> Any:
+        """发送单次请求，GET请求超过近期耗时分位仍未返回时发出对冲请求.
+
+        先成功返回的请求胜出，另一个被取消；两者都失败时抛出原请求的异常。
+        配置了多个副本时对冲请求发往另一个副本。
+        """
+        hedger = self.hedger
+        if hedger is None or request.method != "GET":
+            return await self._send_balanced(request, timing, timeout, replica)
+        template = endpoint_template(request.endpoint)
+        if not hedger.applies(template):
+            return await self._send_balanced(request, timing, timeout, replica)
+
+        hedger.budget.deposit()
+        delay = hedger.delay(template)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(
+            self._send_balanced(request, timing, timeout, replica)
+        )
+        hedge: "Optional[asyncio.Future[Any]]" = None
+        try:
+            if delay is not None:
+                await asyncio.wait((primary,), timeout=delay)
+            limiter = self.rate_limiter
+            if (
+                primary.done()
+                or delay is None
+                or not hedger.budget.withdraw()
+                # 对冲请求同样受限速约束，但不排队等待：没有可用令牌时不对冲
+                or (
+                    limiter is not None
+                    and not limiter.try_acquire(self.config.token, template)
+                )
+            ):
+                result = await primary
+                hedger.record(template, time.perf_counter() - started)
+                return result
+
+            hedger.hedged += 1
+            hedge_started = time.perf_counter()
+            hedge_timing = RequestTiming() if timing is not None else None
+            hedge_replica = (
+                self.balancer.pick((replica,))
+                if self.balancer is not None and replica is not None
+                else None
+            )
+            hedge = asyncio.ensure_future(
+                self._send_balanced(request, hedge_timing, timeout, hedge_replica)
+            )
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # 取出每个完成任务的异常，避免未读取异常的警告
+                succeeded = [t for t in done if t.exception() is None]
+                winner = succeeded[0] if succeeded else None
+                if winner is not None:
+                    if winner is hedge:
+                        hedger.wins += 1
+                        if timing is not None and hedge_timing is not None:
+                            for slot in RequestTiming.__slots__:
+                                setattr(timing, slot, getattr(hedge_timing, slot))
+                        # 记录对冲请求自身的耗时，卡住的原请求不计入耗时统计
+                        hedger.record(template, time.perf_counter() - hedge_started)
+                    else:
+                        hedger.record(template, time.perf_counter() - started)
+                    return winner.result()
+            # 两个请求都失败
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _send_balanced(
+        self,
+        request: _PreparedRequest,
+        timing: Optional[RequestTiming] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        replica: Optional[Replica] = None,
+    ) -> Any:
+        """向选定的副本发送单次请求，并根据结果更新副本的健康状态."""
+        balancer = self.balancer
+        if balancer is None or replica is None:
+            return await self._send_limited(request, timing, timeout)
+
+        started = balancer.begin(replica)
+        failed: Optional[bool] = None
+        try:
+            result = await self._send_limited(
+                request, timing, timeout, replica.url(request.path)
+            )
+            failed = False
+            return result
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            failed = True
+            raise
+        except Exception as e:
+            status = _error_status(e)
+            failed = status is not None and status >= 500
+            raise
+        finally:
+            balancer.end(replica, started, failed)
+
+    async def _send_limited(
+        self,
+        request: _PreparedRequest,
+        timing: Optional[RequestTiming] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        url: Optional[str] = None,
+    ) -> Any:
+        """在自适应并发限制下发送单次请求."""
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return await self._send_once(request, timing, timeout, url)
+
+        started = await _within_deadline(
+            limiter.acquire(),
+            request.deadline,
+            "Deadline exceeded while waiting for a concurrency slot",
+        )
+        if request.deadline is not None and timeout is not None:
+            # 排队等待名额的时间从本次尝试的超时中扣除
+            remaining = request.deadline - time.monotonic()
+            if timeout.total is None or remaining < timeout.total:
+                timeout = aiohttp.ClientTimeout(
+                    total=remaining,
+                    connect=timeout.connect,
+                    sock_read=timeout.sock_read,
+                    sock_connect=timeout.sock_connect,
+                )
+        dropped: Optional[bool] = None
+        try:
+            result = await self._send_once(request, timing, timeout, url)
+            dropped = False
+            return result
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            dropped = True
+            raise
+        except Exception as e:
+            status = _error_status(e)
+            dropped = status is not None and (status >= 500 or status == 429)
+            raise
+        finally:
+            limiter.release(started, dropped)
+
+    async def _send_once(
+        self,
+        request: _PreparedRequest,
+        timing: Optional[RequestTiming] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        url: Optional[str] = None,
+    ) -> Any:
+        """发送单次请求.
+
+        启用条件请求时，GET请求会携带之前保存的 ETag / Last-Modified，
+        服务端返回304时直接复用之前解码的响应。
+
+        Args:
+            request: 请求
+            timing: 分阶段耗时记录（DNS解析和建连耗时由 aiohttp trace 回调填充）
+            timeout: 本次尝试的超时，None表示使用会话的默认超时
+            url: 请求的完整URL（发往其他副本时），None表示 ``request.full_url``
+
+        Returns:
+            响应数据
+        """
+        if self._session is None:
+            raise ConnectionException("HTTP session is not initialized")
+
+        validators = self._validators if request.method == "GET" else None
+        validator = None
+        headers = None
+        if validators is not None:
+            validator = validators.get(request.key)
+            if validator is not None:
+                headers = validator.headers()
+
+        started = self._last_used = time.perf_counter()
+        async with self._session.request(
+            request.method,
+            url or request.full_url,
+            data=request.body,
+            headers=headers,
+            timeout=timeout or self._session.timeout,
+            trace_request_ctx=timing,
+        ) as response:
+            if timing is not None:
+                timing.ttfb = time.perf_counter() - started
+                timing.status = response.status
+            if self.rate_limiter is not None:
+                self.rate_limiter.observe(
+                    self.config.token,
+                    endpoint_template(request.endpoint),
+                    response.status,
+                    response.headers,
+                )
+            if response.status == 304:
+                if validators is None or validator is None:
+                    # 没有发送条件请求头（如中间代理自行返回304），没有可复用的响应
+                    raise HttpException(
+                        f"Unexpected 304 Not Modified for {request.method} "
+                        f"{request.path} without a conditional request",
+                        304,
+                    )
+                validators.not_modified += 1
+                logger.debug(
+                    "Not modified, reusing decoded response: %s", request.full_url
+                )
+                return validator.value
+
+            result = await self._handle_response(
+                response,
+                request.response_model,
+                request.decode_mode,
+                timing,
+                request.log_body,
+            )
+            if validators is not None:
+                validators.remember(request.key, response.headers, result)
+            return result
 
     async def _handle_response(
         self,
         response: aiohttp.ClientResponse,
         response_model: Optional[Type[T]] = None,
+        decode_mode: DecodeMode = DecodeMode.STRICT,
+        timing: Optional[RequestTiming] = None,
+        log_body: bool = False,
     ) -> Union[T, Dict[str, Any]]:
         """处理HTTP响应.
 
         Args:
             response: HTTP响应
             response_model: 响应模型类
+            decode_mode: 响应解码模式
+            timing: 分阶段耗时记录
+            log_body: DEBUG日志是否记录响应体
 
         Returns:
             解析后的响应数据
@@ -205,37 +1094,85 @@ class HttpClient:
             ApiErrorException: API错误
         """
         try:
-            response_text = await response.text()
-            logger.debug(f"Response status: {response.status}, body: {response_text}")
+            read_started = time.perf_counter()
+            raw = await response.read()
+            if timing is not None:
+                timing.read = time.perf_counter() - read_started
+                timing.response_bytes = len(raw)
+            sizes = response_sizes.get()
+            if sizes is not None:
+                sizes.append(len(raw))
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_response(response, raw, log_body)
         except Exception as e:
-            raise NewNanManagerException(f"Failed to read response: {e}")
+            raise NewNanManagerException(f"Failed to read response: {e}") from e
 
         # 处理HTTP错误状态码
         if not response.ok:
-            await self._handle_http_error(response, response_text)
+            await self._handle_http_error(response, raw)
 
-        # 解析JSON响应
+        # 新的响应格式：成功时直接返回数据，不再有统一包装
+        # 直接从字节解析并校验，不经过 str 和中间 dict
+        if timing is None:
+            return decode_body(  # type: ignore[no-any-return]
+                raw, response_model, self._codec, decode_mode
+            )
+        decode_started = time.perf_counter()
         try:
-            response_data = json.loads(response_text) if response_text else {}
-        except json.JSONDecodeError as e:
-            raise NewNanManagerException(f"Failed to parse JSON response: {e}")
+            return decode_body(  # type: ignore[no-any-return]
+                raw, response_model, self._codec, decode_mode
+            )
+        finally:
+            timing.decode = time.perf_counter() - decode_started
 
-        # 新的响应格式：成功时直接返回数据，不再有统一包装
-        # 直接返回响应数据
-        if response_model:
-            return response_model.model_validate(response_data)
-        return response_data
+    def _log_request(self, request: _PreparedRequest) -> None:
+        """输出请求的DEBUG日志，并按采样比例决定是否记录请求/响应体."""
+        config = self.config
+        request.log_body = config.log_body_max_bytes > 0 and (
+            config.log_body_sample_rate >= 1.0
+            or random.random() < config.log_body_sample_rate
+        )
+        body = request.body or b""
+        logger.debug(
+            "Making %s request to %s (%d bytes)%s",
+            request.method,
+            request.full_url,
+            len(body),
+            _format_body(body, config.log_body_max_bytes) if request.log_body else "",
+            extra={
+                "http_method": request.method,
+                "http_url": request.full_url,
+                "http_request_bytes": len(body),
+            },
+        )
+
+    def _log_response(
+        self, response: aiohttp.ClientResponse, raw: bytes, log_body: bool
+    ) -> None:
+        """输出响应的DEBUG日志."""
+        logger.debug(
+            "Response status: %d (%d bytes)%s",
+            response.status,
+            len(raw),
+            _format_body(raw, self.config.log_body_max_bytes) if log_body else "",
+            extra={
+                "http_method": response.method,
+                "http_url": str(response.url),
+                "http_status": response.status,
+                "http_response_bytes": len(raw),
+            },
+        )
 
     async def _handle_http_error(
         self,
         response: aiohttp.ClientResponse,
-        response_text: str,
+        raw: bytes,
     ) -> None:
         """处理HTTP错误.
 
         Args:
             response: HTTP响应
-            response_text: 响应文本
+            raw: 响应体字节
 
         Raises:
             HttpException: HTTP错误
@@ -245,7 +1182,7 @@ class HttpClient:
 
         # 尝试解析新的错误响应格式 {"detail": "..."}
         try:
-            error_data = json.loads(response_text) if response_text else {}
+            error_data = json.loads(raw) if raw else {}
             if isinstance(error_data, dict) and "detail" in error_data:
                 # 新的错误响应格式
                 raise ApiErrorException(
@@ -281,6 +1218,8 @@ class HttpClient:
         endpoint: str,
         params: Optional[Dict[str, Any]],
         response_model: Type[T],
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> T: ...
 
     @overload
@@ -289,6 +1228,8 @@ class HttpClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         response_model: None = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> Dict[str, Any]: ...
 
     async def get(
@@ -296,64 +1237,90 @@ class HttpClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         response_model: Optional[Type[T]] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> Union[T, Dict[str, Any]]:
         """发送GET请求."""
         return await self._make_request(
-            "GET", endpoint, params=params, response_model=response_model
+            "GET",
+            endpoint,
+            params=params,
+            response_model=response_model,
+            decode_mode=decode_mode,
         )
 
     @overload
     async def post(
         self,
         endpoint: str,
-        json_data: Optional[Union[Dict[str, Any], BaseModel]],
+        json_data: Optional[RequestBody],
         response_model: Type[T],
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> T: ...
 
     @overload
     async def post(
         self,
         endpoint: str,
-        json_data: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        json_data: Optional[RequestBody] = None,
         response_model: None = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> Dict[str, Any]: ...
 
     async def post(
         self,
         endpoint: str,
-        json_data: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        json_data: Optional[RequestBody] = None,
         response_model: Optional[Type[T]] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> Union[T, Dict[str, Any]]:
         """发送POST请求."""
         return await self._make_request(
-            "POST", endpoint, json_data=json_data, response_model=response_model
+            "POST",
+            endpoint,
+            json_data=json_data,
+            response_model=response_model,
+            decode_mode=decode_mode,
         )
 
     @overload
     async def put(
         self,
         endpoint: str,
-        json_data: Optional[Union[Dict[str, Any], BaseModel]],
+        json_data: Optional[RequestBody],
         response_model: Type[T],
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> T: ...
 
     @overload
     async def put(
         self,
         endpoint: str,
-        json_data: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        json_data: Optional[RequestBody] = None,
         response_model: None = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> Dict[str, Any]: ...
 
     async def put(
         self,
         endpoint: str,
-        json_data: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        json_data: Optional[RequestBody] = None,
         response_model: Optional[Type[T]] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> Union[T, Dict[str, Any]]:
         """发送PUT请求."""
         return await self._make_request(
-            "PUT", endpoint, json_data=json_data, response_model=response_model
+            "PUT",
+            endpoint,
+            json_data=json_data,
+            response_model=response_model,
+            decode_mode=decode_mode,
         )
 
     async def delete(
@@ -0,0 +1,311 @@
+"""Client-side request metrics for NewNanManager SDK."""
+
+import math
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import aiohttp
+
+from .utils import endpoint_template
+
+#: 分阶段耗时名称
+PHASES = ("dns", "connect", "ttfb", "read", "decode")
+
+
+class LatencyHistogram:
+    """对数分桶的流式延迟直方图（HDR风格）.
+
+    每个2倍区间均分为 ``SUB_BUCKETS`` 个对数桶，分位数的相对误差约为4.4%，
+    内存只与出现过的数量级有关，与记录次数无关。数值单位为秒。
+    """
+
+    SUB_BUCKETS = 16
+    MIN_VALUE = 1e-6  # 1微秒，更小的值计入第一个桶
+
+    __slots__ = ("_counts", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        """初始化直方图."""
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """记录一个观测值.
+
+        Args:
+            value: 观测值（秒）
+        """
+        if value > self.MIN_VALUE:
+            index = int(math.log2(value / self.MIN_VALUE) * self.SUB_BUCKETS)
+        else:
+            index = 0
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @classmethod
+    def upper_bound(cls, index: int) -> float:
+        """桶的上边界."""
+        return cls.MIN_VALUE * 2 ** ((index + 1) / cls.SUB_BUCKETS)
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        """按上边界升序遍历非空桶.
+
+        Yields:
+            (桶上边界, 该桶计数)
+        """
+        for index in sorted(self._counts):
+            yield self.upper_bound(index), self._counts[index]
+
+    def quantile(self, q: float) -> float:
+        """估计分位数.
+
+        Args:
+            q: 分位（0~1）
+
+        Returns:
+            分位数估计值，无观测时返回0
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def count_le(self, bound: float) -> int:
+        """不大于给定值的观测数（按桶上边界近似）.
+
+        Args:
+            bound: 上界（秒）
+
+        Returns:
+            观测数
+        """
+        return sum(count for upper, count in self.buckets() if upper <= bound)
+
+    def summary(self) -> Dict[str, float]:
+        """计数、均值、p50/p95/p99和最大值."""
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class RequestTiming:
+    """单次请求尝试的分阶段耗时（秒），作为 aiohttp 的 trace_request_ctx 传递."""
+
+    __slots__ = (
+        "dns_started",
+        "connect_started",
+        "dns",
+        "connect",
+        "ttfb",
+        "read",
+        "decode",
+        "elapsed",
+        "status",
+        "response_bytes",
+        "timed_out",
+    )
+
+    def __init__(self) -> None:
+        self.dns_started = 0.0
+        self.connect_started = 0.0
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None  # 新建连接耗时（含DNS解析和TLS握手）
+        self.ttfb: Optional[float] = None  # 请求开始到收到响应头
+        self.read: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.elapsed: Optional[float] = None  # 本次尝试的总耗时
+        self.status = 0
+        self.response_bytes: Optional[int] = None
+        self.timed_out = False
+
+
+class EndpointMetrics:
+    """单个端点模板的请求指标."""
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        """初始化端点指标.
+
+        Args:
+            method: HTTP方法
+            endpoint: 端点模板，如 /api/v1/players/{id}
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.requests = 0  # 完成的调用数（含失败）
+        self.errors = 0  # 以异常结束的调用数
+        self.retries = 0  # 重试次数
+        self.timeouts = 0  # 超时的尝试次数
+        self.attempts = 0  # 尝试次数（含重试）
+        self.attempt_statuses: Dict[int, int] = {}  # 每次尝试的状态码 -> 次数
+        self.statuses: Dict[int, int] = {}  # 最终状态码 -> 次数，0表示没有响应
+        self.latency = LatencyHistogram()  # 含重试的调用总耗时
+        self.phases = {phase: LatencyHistogram() for phase in PHASES}
+
+    def summary(self) -> Dict[str, Any]:
+        """指标摘要."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "attempts": self.attempts,
+            "statuses": dict(self.statuses),
+            "attempt_statuses": dict(self.attempt_statuses),
+            "latency": self.latency.summary(),
+            **{
+                phase: hist.summary()
+                for phase, hist in self.phases.items()
+                if hist.count
+            },
+        }
+
+
+class ClientMetrics:
+    """按端点模板聚合的客户端请求指标.
+
+    DNS解析和建连耗时通过 aiohttp 的 TraceConfig 采集，
+    首字节、响应体读取和解码耗时由HTTP客户端直接记录。
+    """
+
+    def __init__(self) -> None:
+        """初始化指标."""
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+
+    def endpoint(self, method: str, endpoint: str) -> EndpointMetrics:
+        """获取端点（按模板归并）的指标.
+
+        Args:
+            method: HTTP方法
+            endpoint: API端点
+
+        Returns:
+            端点指标
+        """
+        template = endpoint_template(endpoint)
+        key = (method, template)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints[key] = EndpointMetrics(method, template)
+        return metrics
+
+    def __iter__(self) -> Iterator[EndpointMetrics]:
+        return iter(list(self._endpoints.values()))
+
+    def record_attempt(self, method: str, endpoint: str, timing: RequestTiming) -> None:
+        """记录一次请求尝试的分阶段耗时.
+
+        Args:
+            method: HTTP方法
+            endpoint: API端点
+            timing: 分阶段耗时
+        """
+        metrics = self.endpoint(method, endpoint)
+        metrics.attempts += 1
+        status = timing.status
+        metrics.attempt_statuses[status] = metrics.attempt_statuses.get(status, 0) + 1
+        if timing.timed_out:
+            metrics.timeouts += 1
+        for phase in PHASES:
+            value = getattr(timing, phase)
+            if value is not None:
+                metrics.phases[phase].record(value)
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        elapsed: float,
+        attempts: int,
+        status: int,
+        failed: bool,
+    ) -> None:
+        """记录一次调用（含全部重试）的结果.
+
+        Args:
+            method: HTTP方法
+            endpoint: API端点
+            elapsed: 总耗时（秒）
+            attempts: 尝试次数
+            status: 最终状态码，0表示没有响应
+            failed: 是否以异常结束
+        """
+        metrics = self.endpoint(method, endpoint)
+        metrics.requests += 1
+        metrics.retries += max(attempts - 1, 0)
+        if failed:
+            metrics.errors += 1
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        metrics.latency.record(elapsed)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """全部端点的指标摘要，键为 "方法 端点模板"."""
+        return {f"{m.method} {m.endpoint}": m.summary() for m in self}
+
+    def reset(self) -> None:
+        """清空全部指标."""
+        self._endpoints.clear()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """创建采集DNS解析和建连耗时的 aiohttp TraceConfig."""
+        trace = aiohttp.TraceConfig()
+        trace.on_dns_resolvehost_start.append(_on_dns_start)
+        trace.on_dns_resolvehost_end.append(_on_dns_end)
+        trace.on_connection_create_start.append(_on_connect_start)
+        trace.on_connection_create_end.append(_on_connect_end)
+        return trace
+
+
+def _timing(ctx: SimpleNamespace) -> Optional[RequestTiming]:
+    timing = ctx.trace_request_ctx
+    return timing if isinstance(timing, RequestTiming) else None
+
+
+async def _on_dns_start(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing.dns_started = time.perf_counter()
+
+
+async def _on_dns_end(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+) -> None:
+    timing = _timing(ctx)
+    if timing is not None and timing.dns_started:
+        timing.dns = time.perf_counter() - timing.dns_started
+
+
+async def _on_connect_start(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing.connect_started = time.perf_counter()
+
+
+async def _on_connect_end(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+) -> None:
+    timing = _timing(ctx)
+    if timing is not None and timing.connect_started:
+        timing.connect = time.perf_counter() - timing.connect_started
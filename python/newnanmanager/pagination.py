@@ -0,0 +1,479 @@
+"""Pagination helpers for NewNanManager SDK list endpoints."""
+
+import asyncio
+import inspect
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import BaseModel
+
+from .codec import _model_in
+from .http_client import response_sizes
+
+#: 页面获取函数：(页码, 每页大小) -> 列表响应
+PageFetcher = Callable[[int, int], Awaitable[Any]]
+
+#: 去重键：字段名或字段名元组
+ItemKey = Union[str, Sequence[str]]
+
+
+@lru_cache(maxsize=None)
+def _items_field(model: type[BaseModel]) -> str:
+    """获取列表响应模型中承载数据的列表字段名（如 players、servers）."""
+    for name, field in model.model_fields.items():
+        if name != "items" and get_origin(field.annotation) is list:
+            return name
+    return "items"
+
+
+def page_items(page: Any) -> list[Any]:
+    """获取一页列表响应中的数据项.
+
+    Args:
+        page: 列表响应（模型或raw模式下的dict）
+
+    Returns:
+        数据项列表
+    """
+    if isinstance(page, BaseModel):
+        items: list[Any] = getattr(page, _items_field(type(page))) or []
+        return items
+    if isinstance(page, dict):
+        for value in page.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+def page_total(page: Any) -> Optional[int]:
+    """获取列表响应中的总数量，没有该字段时返回None."""
+    if isinstance(page, dict):
+        return page.get("total")
+    return getattr(page, "total", None)
+
+
+def page_size_of(page: Any, requested: int) -> int:
+    """获取服务端实际使用的每页大小（服务端可能截断请求的page_size）."""
+    size = (
+        page.get("page_size")
+        if isinstance(page, dict)
+        else getattr(page, "page_size", None)
+    )
+    return size if isinstance(size, int) and size > 0 else requested
+
+
+def item_key(item: Any, key: ItemKey) -> Any:
+    """获取数据项的去重键.
+
+    Args:
+        item: 数据项（模型或dict）
+        key: 字段名或字段名元组
+
+    Returns:
+        去重键
+    """
+    fields = (key,) if isinstance(key, str) else tuple(key)
+    if isinstance(item, dict):
+        values = tuple(item.get(f) for f in fields)
+    else:
+        values = tuple(getattr(item, f, None) for f in fields)
+    return values[0] if len(values) == 1 else values
+
+
+@dataclass
+class PageTiming:
+    """单页请求的耗时记录."""
+
+    page: int
+    page_size: int
+    latency: float  # 秒
+    body_bytes: int
+    item_count: int
+
+
+class PageSizeTuner:
+    """根据观测到的响应延迟和响应体大小自动调整每页大小.
+
+    每页大小始终为2的幂，使调整后新的页边界与已获取的数据偏移对齐。
+    延迟低于目标一半且响应体足够小时翻倍，延迟超过目标或响应体过大时减半。
+    服务端截断page_size时，会将上限收紧到服务端实际允许的大小。
+    """
+
+    def __init__(
+        self,
+        initial: int = 64,
+        min_size: int = 16,
+        max_size: int = 512,
+        target_latency: float = 0.5,
+        max_body_bytes: int = 2 * 1024 * 1024,
+        history_size: int = 1000,
+    ) -> None:
+        """初始化调优器.
+
+        Args:
+            initial: 初始每页大小
+            min_size: 最小每页大小
+            max_size: 最大每页大小
+            target_latency: 单页目标延迟（秒）
+            max_body_bytes: 单页响应体大小上限（字节）
+            history_size: 保留的单页耗时记录数
+        """
+        self.min_size = _floor_pow2(min_size)
+        self.max_size = max(_floor_pow2(max_size), self.min_size)
+        self.target_latency = target_latency
+        self.max_body_bytes = max_body_bytes
+        self._page_size = min(max(_floor_pow2(initial), self.min_size), self.max_size)
+        self.history: Deque[PageTiming] = deque(maxlen=history_size)
+
+    @property
+    def page_size(self) -> int:
+        """当前选择的每页大小."""
+        return self._page_size
+
+    def limit(self, server_max: int) -> None:
+        """收紧每页大小上限（服务端截断了请求的page_size时调用）.
+
+        Args:
+            server_max: 服务端实际返回的每页大小
+        """
+        self.max_size = max(_floor_pow2(server_max), 1)
+        self.min_size = min(self.min_size, self.max_size)
+        self._page_size = min(self._page_size, self.max_size)
+
+    def observe(self, timing: PageTiming) -> None:
+        """记录一页的耗时并调整每页大小.
+
+        Args:
+            timing: 单页耗时记录
+        """
+        self.history.append(timing)
+        if timing.page_size != self._page_size:
+            # 调整前发出的请求，不再据此调整
+            return
+
+        too_slow = timing.latency > self.target_latency
+        too_big = timing.body_bytes > self.max_body_bytes
+        if too_slow or too_big:
+            self._page_size = max(self._page_size // 2, self.min_size)
+        elif (
+            timing.latency < self.target_latency / 2
+            and timing.body_bytes * 2 <= self.max_body_bytes
+        ):
+            self._page_size = min(self._page_size * 2, self.max_size)
+
+
+def _floor_pow2(n: int) -> int:
+    """不大于n的最大2的幂."""
+    return 1 << (max(n, 1).bit_length() - 1)
+
+
+async def _fetch_timed(
+    fetch_page: PageFetcher,
+    page: int,
+    size: int,
+    tuner: Optional[PageSizeTuner],
+) -> Any:
+    """获取一页，并在提供调优器时记录耗时和响应体大小."""
+    if tuner is None:
+        return await fetch_page(page, size)
+
+    sizes: List[int] = []
+    token = response_sizes.set(sizes)
+    start = time.perf_counter()
+    try:
+        result = await fetch_page(page, size)
+    finally:
+        response_sizes.reset(token)
+    tuner.observe(
+        PageTiming(
+            page=page,
+            page_size=size,
+            latency=time.perf_counter() - start,
+            body_bytes=sum(sizes),
+            item_count=len(page_items(result)),
+        )
+    )
+    return result
+
+
+async def scan_pages(
+    fetch_page: PageFetcher,
+    *,
+    page_size: int = 100,
+    concurrency: int = 8,
+    ordered: bool = True,
+    start_page: int = 1,
+    tuner: Optional[PageSizeTuner] = None,
+) -> AsyncIterator[Any]:
+    """在并发限制内获取列表端点的全部页面.
+
+    获取第一页后根据 ``total`` 确定剩余范围，始终保持最多 ``concurrency``
+    个页面请求在途；没有 ``total`` 的端点在某页数据项不足每页大小时结束。
+    提供 ``tuner`` 时每页大小随观测到的延迟和响应体大小自动调整，
+    请求按数据偏移而不是固定页码调度，调整后不会遗漏或重复数据。
+
+    Args:
+        fetch_page: 页面获取函数
+        page_size: 每页大小（提供tuner时忽略）
+        concurrency: 最大在途请求数（0表示消费完当前页后才请求下一页）
+        ordered: True按页面顺序返回，False按到达顺序返回
+        start_page: 起始页码
+        tuner: 每页大小调优器
+
+    Yields:
+        每一页的列表响应
+    """
+    size = tuner.page_size if tuner is not None else page_size
+    offset = (start_page - 1) * size
+    first = await _fetch_timed(fetch_page, start_page, size, tuner)
+
+    actual = page_size_of(first, size)
+    if actual < size:
+        # 服务端截断了page_size，按实际大小计算偏移
+        size = actual
+        if tuner is not None:
+            tuner.limit(actual)
+    yield first
+
+    total = page_total(first)
+    if len(page_items(first)) < size and total is None:
+        return
+
+    next_offset = offset + size
+    exhausted = False
+    # 在途请求：(任务, 数据偏移, 每页大小)
+    in_flight: Deque[Tuple["asyncio.Future[Any]", int, int]] = deque()
+
+    def aligned(at: int, s: int, end: Optional[int] = None) -> int:
+        # 每页大小必须整除数据偏移，页码才能与已获取的数据对齐
+        while s > 1 and (at % s or (end is not None and at + s > end)):
+            s //= 2
+        return s
+
+    def start(at: int, s: int) -> Tuple["asyncio.Future[Any]", int, int]:
+        task = asyncio.ensure_future(_fetch_timed(fetch_page, at // s + 1, s, tuner))
+        return task, at, s
+
+    def schedule(limit: int) -> None:
+        nonlocal next_offset
+        while (
+            len(in_flight) < limit
+            and not exhausted
+            and (total is None or next_offset < total)
+        ):
+            s = aligned(next_offset, tuner.page_size if tuner is not None else size)
+            in_flight.append(start(next_offset, s))
+            next_offset += s
+
+    try:
+        schedule(concurrency)
+        while True:
+            if not in_flight:
+                schedule(1)
+                if not in_flight:
+                    return
+
+            if ordered:
+                entry = in_flight.popleft()
+                page = await entry[0]
+            else:
+                done, _ = await asyncio.wait(
+                    [e[0] for e in in_flight], return_when=asyncio.FIRST_COMPLETED
+                )
+                task = done.pop()
+                entry = next(e for e in in_flight if e[0] is task)
+                in_flight.remove(entry)
+                page = task.result()
+            _, at, s = entry
+
+            actual = page_size_of(page, s)
+            if actual < s:
+                # 服务端截断了page_size：该页的数据不在预期偏移上，丢弃后按实际上限重取
+                size = actual
+                if tuner is not None:
+                    tuner.limit(actual)
+                retry = []
+                while at < entry[1] + s:
+                    n = aligned(at, _floor_pow2(actual), entry[1] + s)
+                    retry.append(start(at, n))
+                    at += n
+                if ordered:
+                    in_flight.extendleft(reversed(retry))
+                else:
+                    in_flight.extend(retry)
+                continue
+
+            items = page_items(page)
+            if len(items) < s and total is None:
+                # 末页：之后的请求都已越界
+                exhausted = True
+            if items:
+                schedule(concurrency)
+                yield page
+            elif ordered:
+                # 数据在遍历过程中减少，提前结束
+                return
+    finally:
+        for task, _, _ in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*(e[0] for e in in_flight), return_exceptions=True)
+
+
+def iterate_pages(
+    fetch_page: PageFetcher,
+    *,
+    page_size: int = 100,
+    start_page: int = 1,
+    prefetch: int = 2,
+    tuner: Optional[PageSizeTuner] = None,
+) -> AsyncIterator[Any]:
+    """逐页遍历列表端点，并在消费当前页时预取后续页.
+
+    Args:
+        fetch_page: 页面获取函数
+        page_size: 每页大小（提供tuner时忽略）
+        start_page: 起始页码
+        prefetch: 预取的页数（0表示不预取）
+        tuner: 每页大小调优器
+
+    Returns:
+        按页码顺序产出每一页的异步迭代器
+    """
+    return scan_pages(
+        fetch_page,
+        page_size=page_size,
+        concurrency=prefetch,
+        ordered=True,
+        start_page=start_page,
+        tuner=tuner,
+    )
+
+
+async def iterate_items(
+    fetch_page: PageFetcher,
+    *,
+    key: Optional[ItemKey] = None,
+    page_size: int = 100,
+    prefetch: int = 2,
+    tuner: Optional[PageSizeTuner] = None,
+) -> AsyncIterator[Any]:
+    """逐项遍历列表端点的全部数据.
+
+    遍历期间有数据插入时同一行可能出现在相邻两页，指定 ``key`` 时按键去重。
+
+    Args:
+        fetch_page: 页面获取函数
+        key: 去重字段名或字段名元组，None表示不去重
+        page_size: 每页大小（提供tuner时忽略）
+        prefetch: 预取的页数
+        tuner: 每页大小调优器
+
+    Yields:
+        数据项
+    """
+    seen: Set[Any] = set()
+    async for page in iterate_pages(
+        fetch_page, page_size=page_size, prefetch=prefetch, tuner=tuner
+    ):
+        for item in page_items(page):
+            if key is not None:
+                k = item_key(item, key)
+                if k in seen:
+                    continue
+                seen.add(k)
+            yield item
+
+
+def page_fetcher(
+    list_method: Callable[..., Awaitable[Any]], **filters: Any
+) -> PageFetcher:
+    """将服务的列表方法适配为页面获取函数.
+
+    支持 ``page``/``page_size`` 参数形式（如 ``list_players``）和
+    ``request`` 请求模型形式（如 ``list_ips``）的列表方法。
+
+    Args:
+        list_method: 服务的列表方法
+        **filters: 传给列表方法的其他参数（如 search、decode_mode、request）
+
+    Returns:
+        页面获取函数
+    """
+    if "request" not in inspect.signature(list_method).parameters:
+        return lambda page, size: list_method(page=page, page_size=size, **filters)
+
+    base = filters.pop("request", None)
+    if base is None:
+        request_model = _model_in(get_type_hints(list_method).get("request"))
+        if request_model is None:
+            raise TypeError(f"Cannot infer request model of {list_method!r}")
+        base = request_model()
+    return lambda page, size: list_method(
+        base.model_copy(update={"page": page, "page_size": size}), **filters
+    )
+
+
+async def scan_all(
+    list_method: Callable[..., Awaitable[Any]],
+    *,
+    page_size: Optional[int] = None,
+    concurrency: int = 8,
+    ordered: bool = True,
+    key: Optional[ItemKey] = None,
+    tuner: Optional[PageSizeTuner] = None,
+    **filters: Any,
+) -> List[Any]:
+    """并发获取任意列表方法的全部数据.
+
+    未指定 ``page_size`` 时使用 :class:`PageSizeTuner` 根据响应延迟和大小
+    自动选择每页大小；传入自己的 ``tuner`` 可在扫描后查看选择的大小和每页耗时。
+
+    Args:
+        list_method: 服务的列表方法，如 ``client.players.list_players``
+        page_size: 固定的每页大小，None表示自动调整
+        concurrency: 最大并发请求数
+        ordered: True按页码顺序排列，False按页面到达顺序排列
+        key: 去重字段名或字段名元组，None表示不去重
+        tuner: 每页大小调优器
+        **filters: 传给列表方法的其他参数（如 search、decode_mode、request）
+
+    Returns:
+        全部数据项
+    """
+    if page_size is None and tuner is None:
+        tuner = PageSizeTuner()
+    items: List[Any] = []
+    seen: Set[Any] = set()
+    async for page in scan_pages(
+        page_fetcher(list_method, **filters),
+        page_size=page_size or 100,
+        concurrency=concurrency,
+        ordered=ordered,
+        tuner=tuner,
+    ):
+        for item in page_items(page):
+            if key is not None:
+                k = item_key(item, key)
+                if k in seen:
+                    continue
+                seen.add(k)
+            items.append(item)
+    return items
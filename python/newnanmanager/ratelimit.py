@@ -0,0 +1,329 @@
+"""Client-side rate limiting for NewNanManager SDK."""
+
+import asyncio
+import email.utils
+import logging
+import math
+import time
+from typing import Dict, List, Mapping, Optional
+
+from .config import RateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+# 超过该值的 Reset 头视为Unix时间戳而不是秒数
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class TokenBucket:
+    """令牌桶.
+
+    等待令牌的请求按到达顺序排队，只有队首请求按当前速率计算等待时间，
+    因此排队中途降低速率或暂停会立即对后续请求生效，请求排队而不是失败。
+    """
+
+    __slots__ = (
+        "rate",
+        "max_rate",
+        "burst",
+        "_tokens",
+        "_updated",
+        "_paused_until",
+        "_throttled_until",
+        "_lock",
+        "_lock_loop",
+    )
+
+    def __init__(self, rate: float, burst: float) -> None:
+        """初始化令牌桶.
+
+        Args:
+            rate: 每秒生成的令牌数，``math.inf`` 表示不限速（仍可暂停）
+            burst: 桶容量
+        """
+        self.rate = rate
+        self.max_rate = rate  # 配置的速率，自动降速后恢复的上限
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._throttled_until = 0.0
+        # asyncio.Lock 按先来先得唤醒，保证排队顺序；在排队时于当前事件循环中创建，
+        # 避免在事件循环之外创建（Python 3.9 会绑定到错误的事件循环）
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _wait_time(self, now: float) -> float:
+        """获得下一个令牌还需等待的时间（秒）."""
+        wait = self._paused_until - now
+        if not math.isinf(self.rate):
+            self._refill(now)
+            if self._tokens < 1:
+                wait = max(wait, (1 - self._tokens) / self.rate)
+        return wait
+
+    def ready(self, now: float) -> bool:
+        """是否可以不等待地取得令牌（令牌充足且没有排队的请求）.
+
+        Args:
+            now: 当前时间（time.monotonic）
+        """
+        lock = self._lock
+        return self._wait_time(now) <= 0 and (lock is None or not lock.locked())
+
+    def take(self) -> None:
+        """取走一个令牌，调用前应先用 :meth:`ready` 确认."""
+        self._tokens -= 1
+
+    async def acquire(self) -> float:
+        """等待并取得一个令牌.
+
+        Returns:
+            实际等待的时间（秒）
+        """
+        started = time.monotonic()
+        if self.ready(started):
+            self.take()
+            return 0.0
+        lock = self._lock
+        loop = asyncio.get_running_loop()
+        if lock is None or self._lock_loop is not loop:
+            lock = self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with lock:
+            while True:
+                now = time.monotonic()
+                wait = self._wait_time(now)
+                if wait <= 0:
+                    self._tokens -= 1
+                    return now - started
+                await asyncio.sleep(wait)
+
+    def pause(self, delay: float, now: float) -> None:
+        """在 ``delay`` 秒内不再发放令牌，暂停结束后从空桶开始按速率发放.
+
+        Args:
+            delay: 暂停时长（秒）
+            now: 当前时间（time.monotonic）
+        """
+        until = now + delay
+        if until > self._paused_until:
+            self._paused_until = until
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = until
+
+    def throttle(self, min_rate: float, now: float, cooldown: float) -> None:
+        """收到429时将速率减半.
+
+        并发请求往往同时收到429，``cooldown`` 内的后续429只算同一次拥塞，不再减速。
+
+        Args:
+            min_rate: 速率下限
+            now: 当前时间（time.monotonic）
+            cooldown: 减速后忽略后续429的时长（秒）
+        """
+        if math.isinf(self.rate) or now < self._throttled_until:
+            return
+        self.rate = max(self.rate / 2, min_rate)
+        self._throttled_until = now + cooldown
+
+    def recover(self, fraction: float) -> None:
+        """成功响应后按配置速率的比例恢复速率.
+
+        Args:
+            fraction: 恢复比例
+        """
+        if self.rate < self.max_rate:
+            self.rate = min(self.rate + self.max_rate * fraction, self.max_rate)
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """解析 Retry-After 头（秒数或HTTP日期）.
+
+    Args:
+        value: 头的值
+        now: 当前Unix时间，默认为 time.time()
+
+    Returns:
+        需要等待的秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - (time.time() if now is None else now), 0.0)
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    return headers.get(f"X-RateLimit-{name}") or headers.get(f"RateLimit-{name}")
+
+
+class RateLimiter:
+    """客户端限速器.
+
+    每个请求依次经过全局令牌桶、所属API Token的令牌桶和端点模板的令牌桶，
+    令牌不足时排队等待。根据响应自动调整：
+
+    - 429：按 ``Retry-After`` （缺省时为 ``default_retry_after``）暂停最具体的令牌桶，
+      并将其速率减半，之后每次成功响应逐步恢复
+    - ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` （或不带 ``X-`` 前缀的同名头）：
+      剩余额度为0时暂停到重置时刻
+
+    同一个限速器可以通过 ``client.rate_limiter = limiter`` 在多个客户端之间共享，
+    使全局令牌桶覆盖所有客户端、Token令牌桶覆盖使用同一Token的客户端。
+    """
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        """初始化限速器.
+
+        Args:
+            config: 限速配置
+        """
+        self.config = config
+        self._global = (
+            TokenBucket(config.rate, config.burst) if config.rate is not None else None
+        )
+        self._tokens: Dict[str, TokenBucket] = {}
+        self._endpoints: Dict[str, TokenBucket] = {}
+        self.throttled = 0  # 收到的429响应数
+        self.delayed = 0  # 需要排队等待的请求数
+        self.wait_time = 0.0  # 累计排队等待时间（秒）
+
+    def _token_bucket(self, token: str) -> TokenBucket:
+        bucket = self._tokens.get(token)
+        if bucket is None:
+            rate = self.config.per_token_rate
+            bucket = self._tokens[token] = (
+                TokenBucket(rate, self.config.per_token_burst)
+                if rate is not None
+                else TokenBucket(math.inf, 1)
+            )
+        return bucket
+
+    def _endpoint_bucket(self, template: str) -> Optional[TokenBucket]:
+        bucket = self._endpoints.get(template)
+        if bucket is None:
+            rate = self.config.endpoint_rates.get(template)
+            if rate is None:
+                return None
+            bucket = self._endpoints[template] = TokenBucket(rate, max(rate, 1.0))
+        return bucket
+
+    def _buckets(self, token: str, template: str) -> List[TokenBucket]:
+        buckets = [self._token_bucket(token)]
+        if self._global is not None:
+            buckets.append(self._global)
+        endpoint = self._endpoint_bucket(template)
+        if endpoint is not None:
+            buckets.append(endpoint)
+        return buckets
+
+    def _target(self, token: str, template: str) -> TokenBucket:
+        """429和限速头作用的令牌桶：端点 > 限速的Token > 全局 > 不限速的Token."""
+        endpoint = self._endpoint_bucket(template)
+        if endpoint is not None:
+            return endpoint
+        bucket = self._token_bucket(token)
+        if math.isinf(bucket.max_rate) and self._global is not None:
+            return self._global
+        return bucket
+
+    async def acquire(self, token: str, template: str) -> None:
+        """等待发送一个请求的许可.
+
+        Args:
+            token: API Token
+            template: 端点模板
+        """
+        wait = 0.0
+        for bucket in self._buckets(token, template):
+            wait += await bucket.acquire()
+        if wait > 0:
+            self.delayed += 1
+            self.wait_time += wait
+
+    def try_acquire(self, token: str, template: str) -> bool:
+        """不等待地取得发送一个请求的许可（如对冲请求）.
+
+        Args:
+            token: API Token
+            template: 端点模板
+
+        Returns:
+            所有令牌桶都可以立即取得令牌时取走令牌并返回True，否则不消耗令牌并返回False
+        """
+        buckets = self._buckets(token, template)
+        now = time.monotonic()
+        if not all(bucket.ready(now) for bucket in buckets):
+            return False
+        for bucket in buckets:
+            bucket.take()
+        return True
+
+    def observe(
+        self, token: str, template: str, status: int, headers: Mapping[str, str]
+    ) -> None:
+        """根据响应状态码和限速相关的头调整令牌桶.
+
+        Args:
+            token: API Token
+            template: 端点模板
+            status: 响应状态码
+            headers: 响应头
+        """
+        bucket = self._target(token, template)
+        now = time.monotonic()
+        if status == 429:
+            self.throttled += 1
+            delay = parse_retry_after(headers.get("Retry-After"))
+            if delay is None:
+                delay = self.config.default_retry_after
+            bucket.throttle(self.config.min_rate, now, max(delay, 1.0))
+            bucket.pause(delay, now)
+            logger.warning(
+                f"Rate limited on {template}, pausing {delay:.2f}s "
+                f"(rate now {bucket.rate:.2f}/s)"
+            )
+            return
+
+        remaining = _header(headers, "Remaining")
+        if remaining is not None and remaining.strip() == "0":
+            reset = _header(headers, "Reset")
+            try:
+                delay = float(reset) if reset is not None else None
+            except ValueError:
+                delay = None
+            if delay is not None:
+                if delay > _EPOCH_THRESHOLD:
+                    delay -= time.time()
+                bucket.pause(max(delay, 0.0), now)
+            return
+
+        if status < 500:
+            bucket.recover(self.config.recovery)
+
+    def rates(self) -> Dict[str, float]:
+        """各令牌桶的当前速率（每秒请求数），键为 global、token:<序号> 或端点模板."""
+        rates: Dict[str, float] = {}
+        if self._global is not None:
+            rates["global"] = self._global.rate
+        for index, bucket in enumerate(self._tokens.values()):
+            rates[f"token:{index}"] = bucket.rate
+        for template, bucket in self._endpoints.items():
+            rates[template] = bucket.rate
+        return rates
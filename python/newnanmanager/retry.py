@@ -0,0 +1,169 @@
+"""Retry policy for NewNanManager SDK."""
+
+import asyncio
+import random
+import time
+from typing import Optional
+
+import aiohttp
+
+from .config import RetryConfig
+from .exceptions import ApiErrorException, HttpException
+
+# 请求肯定没有发到服务端的错误：任何方法都可以安全重试
+_NOT_SENT_ERRORS = tuple(
+    error
+    for error in (
+        aiohttp.ClientConnectorError,
+        getattr(aiohttp, "ConnectionTimeoutError", None),
+    )
+    if error is not None
+)
+
+
+class RetryBudget:
+    """重试预算（令牌桶）.
+
+    每个请求存入 ``ratio`` 个额度，另外每秒恢复 ``min_per_second`` 个，每次重试消耗1个。
+    服务端整体故障时重试量被限制在请求量的一定比例内，不会把负载成倍放大。
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, burst: float) -> None:
+        """初始化重试预算.
+
+        Args:
+            ratio: 每个请求存入的额度
+            min_per_second: 每秒恢复的额度
+            burst: 最大积累额度
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self.exhausted = 0  # 因预算耗尽而放弃的重试数
+
+    def deposit(self) -> None:
+        """为一个新请求存入额度."""
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """尝试取出一次重试的额度.
+
+        Returns:
+            是否允许重试
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.min_per_second
+        )
+        self._updated = now
+        if self._tokens < 1:
+            self.exhausted += 1
+            return False
+        self._tokens -= 1
+        return True
+
+    @property
+    def available(self) -> float:
+        """当前可用的重试额度."""
+        return self._tokens
+
+
+class RetryPolicy:
+    """按幂等性、错误类型和重试预算决定是否重试及重试延迟.
+
+    - 连接未建立（请求肯定没有发出）时任何方法都可以重试
+    - 超时、断连以及 ``retry_statuses`` 中的状态码只对幂等请求重试
+      （``idempotent_methods`` 或 ``idempotent_endpoints``）
+    - 延迟为全抖动指数退避：``uniform(0, min(max_delay, base_delay * 2 ** attempt))``
+    - 每次重试消耗 :class:`RetryBudget` 的额度，额度耗尽时不再重试
+
+    可以继承并覆盖 :meth:`is_retryable` 或 :meth:`backoff`，
+    再赋值给 ``client.retry_policy`` 以自定义策略。
+    """
+
+    def __init__(
+        self, config: RetryConfig, max_retries: int = 3, base_delay: float = 1.0
+    ) -> None:
+        """初始化重试策略.
+
+        Args:
+            config: 重试配置
+            max_retries: 最大重试次数
+            base_delay: 首次重试的退避基数（秒）
+        """
+        self.config = config
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.budget = RetryBudget(
+            config.budget_ratio, config.budget_min_per_second, config.budget_burst
+        )
+
+    def is_idempotent(self, method: str, template: str) -> bool:
+        """请求是否可以安全地重复执行.
+
+        Args:
+            method: HTTP方法
+            template: 端点模板
+
+        Returns:
+            是否幂等
+        """
+        return (
+            method in self.config.idempotent_methods
+            or f"{method} {template}" in self.config.idempotent_endpoints
+        )
+
+    def is_retryable(self, method: str, template: str, error: BaseException) -> bool:
+        """错误是否值得重试（不考虑次数和预算）.
+
+        Args:
+            method: HTTP方法
+            template: 端点模板
+            error: 本次尝试的异常
+
+        Returns:
+            是否重试
+        """
+        if isinstance(error, _NOT_SENT_ERRORS):
+            return True
+        if isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError)):
+            return self.is_idempotent(method, template)
+        if isinstance(error, HttpException):
+            status: Optional[int] = error.status_code
+        elif isinstance(error, ApiErrorException):
+            # ApiErrorException 的 error_code 为HTTP状态码
+            status = error.error_code
+        else:
+            return False
+        return status in self.config.retry_statuses and self.is_idempotent(
+            method, template
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """第 ``attempt`` 次重试（从0开始）前的等待时间（秒）."""
+        delay = min(self.config.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, delay) if self.config.jitter else delay
+
+    def next_delay(
+        self, method: str, template: str, error: BaseException, attempt: int
+    ) -> Optional[float]:
+        """决定是否重试.
+
+        Args:
+            method: HTTP方法
+            template: 端点模板
+            error: 本次尝试的异常
+            attempt: 已重试次数
+
+        Returns:
+            重试前的等待时间（秒），None表示不再重试
+        """
+        if attempt >= self.max_retries:
+            return None
+        if not self.is_retryable(method, template, error):
+            return None
+        if not self.budget.withdraw():
+            return None
+        return self.backoff(attempt)
@@ -1,7 +1,8 @@
 """IP management service."""
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from ..codec import DecodeMode
 from ..http_client import HttpClient
 from ..models import (
     BanIPRequest,
@@ -11,6 +12,7 @@ from ..models import (
     IPStatistics,
     ListIPsRequest,
 )
+from ..pagination import iterate_items
 
 
 class IPService:
@@ -53,66 +55,156 @@ class IPService:
         """
         await self._http_client.post("/api/v1/ips/unban", json_data=request)
 
-    async def list_ips(self, request: Optional[ListIPsRequest] = None) -> IPsListData:
+    async def list_ips(
+        self,
+        request: Optional[ListIPsRequest] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> IPsListData:
         """获取IP列表.
 
         Args:
             request: 列表请求参数
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             IP列表数据
         """
         params = request.model_dump(exclude_none=True) if request else {}
         return await self._http_client.get(
-            "/api/v1/ips", params=params, response_model=IPsListData
+            "/api/v1/ips",
+            params=params,
+            response_model=IPsListData,
+            decode_mode=decode_mode,
+        )
+
+    def iter_ips(
+        self,
+        request: Optional[ListIPsRequest] = None,
+        *,
+        page_size: int = 100,
+        prefetch: int = 2,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> AsyncIterator[IPInfo]:
+        """遍历全部IP（自动翻页并预取后续页，按IP去重）.
+
+        Args:
+            request: 列表过滤参数（其中的page和page_size会被忽略）
+            page_size: 每页大小
+            prefetch: 预取的页数
+            decode_mode: 响应解码模式，None表示使用客户端配置
+
+        Returns:
+            IP信息异步迭代器
+        """
+        base = request or ListIPsRequest()
+        return iterate_items(
+            lambda page, size: self.list_ips(
+                base.model_copy(update={"page": page, "page_size": size}),
+                decode_mode=decode_mode,
+            ),
+            key="ip",
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def get_banned_ips(
-        self, request: Optional[ListIPsRequest] = None
+        self,
+        request: Optional[ListIPsRequest] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> IPsListData:
         """获取被封禁的IP列表.
 
         Args:
             request: 列表请求参数
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             被封禁IP列表数据
         """
         params = request.model_dump(exclude_none=True) if request else {}
         return await self._http_client.get(
-            "/api/v1/ips/banned", params=params, response_model=IPsListData
+            "/api/v1/ips/banned",
+            params=params,
+            response_model=IPsListData,
+            decode_mode=decode_mode,
+        )
+
+    def iter_banned_ips(
+        self,
+        request: Optional[ListIPsRequest] = None,
+        *,
+        page_size: int = 100,
+        prefetch: int = 2,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> AsyncIterator[IPInfo]:
+        """遍历全部被封禁的IP（自动翻页并预取后续页，按IP去重）.
+
+        Args:
+            request: 列表过滤参数（其中的page和page_size会被忽略）
+            page_size: 每页大小
+            prefetch: 预取的页数
+            decode_mode: 响应解码模式，None表示使用客户端配置
+
+        Returns:
+            IP信息异步迭代器
+        """
+        base = request or ListIPsRequest()
+        return iterate_items(
+            lambda page, size: self.get_banned_ips(
+                base.model_copy(update={"page": page, "page_size": size}),
+                decode_mode=decode_mode,
+            ),
+            key="ip",
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def get_suspicious_ips(
-        self, request: Optional[ListIPsRequest] = None
+        self,
+        request: Optional[ListIPsRequest] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> IPsListData:
         """获取可疑IP列表.
 
         Args:
             request: 列表请求参数
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             可疑IP列表数据
         """
         params = request.model_dump(exclude_none=True) if request else {}
         return await self._http_client.get(
-            "/api/v1/ips/suspicious", params=params, response_model=IPsListData
+            "/api/v1/ips/suspicious",
+            params=params,
+            response_model=IPsListData,
+            decode_mode=decode_mode,
         )
 
     async def get_high_risk_ips(
-        self, request: Optional[ListIPsRequest] = None
+        self,
+        request: Optional[ListIPsRequest] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> IPsListData:
         """获取高风险IP列表.
 
         Args:
             request: 列表请求参数
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             高风险IP列表数据
         """
         params = request.model_dump(exclude_none=True) if request else {}
         return await self._http_client.get(
-            "/api/v1/ips/high-risk", params=params, response_model=IPsListData
+            "/api/v1/ips/high-risk",
+            params=params,
+            response_model=IPsListData,
+            decode_mode=decode_mode,
         )
 
     async def get_ip_statistics(self) -> IPStatistics:
@@ -1,7 +1,12 @@
 """Monitoring service."""
 
-from typing import Optional
+from typing import Any, List, Optional, Union
 
+from ..heartbeat import (
+    HeartbeatPayloadBuilder,
+    HeartbeatProvider,
+    HeartbeatScheduler,
+)
 from ..http_client import HttpClient
 from ..models import (
     HeartbeatData,
@@ -20,27 +25,67 @@ class MonitorService:
             http_client: HTTP客户端
         """
         self._http = http_client
+        self._schedulers: List[HeartbeatScheduler] = []
 
     async def heartbeat(
         self,
         server_id: int,
-        request: HeartbeatRequest,
+        request: Union[HeartbeatRequest, HeartbeatPayloadBuilder, bytes],
     ) -> HeartbeatData:
         """发送服务器心跳.
 
         Args:
             server_id: 服务器ID
-            request: 心跳请求
+            request: 心跳请求、心跳请求体构建器，或构建器生成的请求体字节
 
         Returns:
             心跳响应数据
         """
+        body = (
+            request.build() if isinstance(request, HeartbeatPayloadBuilder) else request
+        )
         return await self._http.post(
             f"/api/v1/monitor/{server_id}/heartbeat",
-            json_data=request,
+            json_data=body,
             response_model=HeartbeatData,
         )
 
+    @property
+    def heartbeat_schedulers(self) -> List[HeartbeatScheduler]:
+        """通过 :meth:`start_heartbeat` 启动且尚未关闭的心跳调度器."""
+        return list(self._schedulers)
+
+    def start_heartbeat(
+        self,
+        server_id: int,
+        provider: HeartbeatProvider,
+        **options: Any,
+    ) -> HeartbeatScheduler:
+        """启动后台心跳调度.
+
+        调度器自动填充 ``sequence_id``、``last_rtt_ms`` 和 ``timestamp``，
+        客户端关闭时自动停止。
+
+        Args:
+            server_id: 服务器ID
+            provider: 心跳内容提供函数，每次心跳前调用，
+                返回 HeartbeatRequest 或 HeartbeatPayloadBuilder
+            **options: 传给 :class:`HeartbeatScheduler` 的其他参数（如 interval）
+
+        Returns:
+            已启动的心跳调度器
+        """
+        scheduler = HeartbeatScheduler(self, server_id, provider, **options)
+        scheduler.start()
+        self._schedulers.append(scheduler)
+        return scheduler
+
+    async def close(self) -> None:
+        """停止所有后台心跳调度."""
+        schedulers, self._schedulers = self._schedulers, []
+        for scheduler in schedulers:
+            await scheduler.stop()
+
     async def get_monitor_stats(
         self,
         server_id: int,
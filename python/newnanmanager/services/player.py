@@ -1,7 +1,11 @@
 """Player management service."""
 
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
+from ..batching import MicroBatcher, chunked
+from ..codec import DecodeMode
+from ..exceptions import NewNanManagerException
 from ..http_client import HttpClient
 from ..models import (
     BanMode,
@@ -9,10 +13,13 @@ from ..models import (
     CreatePlayerRequest,
     Player,
     PlayersListData,
+    PlayerValidateInfo,
+    PlayerValidateResult,
     UpdatePlayerRequest,
     ValidateData,
     ValidateRequest,
 )
+from ..pagination import iterate_items
 
 
 class PlayerService:
@@ -25,6 +32,14 @@ class PlayerService:
             http_client: HTTP客户端
         """
         self._http = http_client
+        config = http_client.config
+        self._validate_batcher: MicroBatcher[
+            Tuple[int, bool], PlayerValidateInfo, PlayerValidateResult
+        ] = MicroBatcher(
+            self._send_validate_batch,
+            window=config.validate_batch_window,
+            max_batch=config.validate_batch_size,
+        )
 
     async def list_players(
         self,
@@ -37,6 +52,8 @@ class PlayerService:
         qq: Optional[str] = None,
         qqguild: Optional[str] = None,
         discord: Optional[str] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> PlayersListData:
         """获取玩家列表.
 
@@ -50,6 +67,7 @@ class PlayerService:
             qq: QQ号过滤
             qqguild: QQ频道ID过滤
             discord: Discord ID过滤
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             玩家列表数据
@@ -70,6 +88,56 @@ class PlayerService:
             "/api/v1/players",
             params=params,
             response_model=PlayersListData,
+            decode_mode=decode_mode,
+        )
+
+    def iter_players(
+        self,
+        search: Optional[str] = None,
+        town_id: Optional[int] = None,
+        ban_mode: Optional[BanMode] = None,
+        name: Optional[str] = None,
+        qq: Optional[str] = None,
+        qqguild: Optional[str] = None,
+        discord: Optional[str] = None,
+        *,
+        page_size: int = 100,
+        prefetch: int = 2,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> AsyncIterator[Player]:
+        """遍历全部玩家（自动翻页并预取后续页，按ID去重）.
+
+        Args:
+            search: 搜索关键词（模糊搜索游戏名）
+            town_id: 城镇ID
+            ban_mode: 封禁模式
+            name: 精确游戏名过滤
+            qq: QQ号过滤
+            qqguild: QQ频道ID过滤
+            discord: Discord ID过滤
+            page_size: 每页大小
+            prefetch: 预取的页数
+            decode_mode: 响应解码模式，None表示使用客户端配置
+
+        Returns:
+            玩家异步迭代器
+        """
+        return iterate_items(
+            lambda page, size: self.list_players(
+                page=page,
+                page_size=size,
+                search=search,
+                town_id=town_id,
+                ban_mode=ban_mode,
+                name=name,
+                qq=qq,
+                qqguild=qqguild,
+                discord=discord,
+                decode_mode=decode_mode,
+            ),
+            key="id",
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def create_player(
@@ -96,16 +164,97 @@ class PlayerService:
     ) -> ValidateData:
         """玩家验证（支持批处理）.
 
+        玩家数超过单次请求上限时自动拆分为多个请求并行发送，结果按原顺序合并。
+
         Args:
             request: 验证请求
 
         Returns:
             验证结果
         """
-        return await self._http.post(
-            "/api/v1/players/validate", json_data=request, response_model=ValidateData
+        batch_size = self._http.config.validate_batch_size
+        if len(request.players) <= batch_size:
+            return await self._http.post(
+                "/api/v1/players/validate",
+                json_data=request,
+                response_model=ValidateData,
+            )
+
+        parts = await asyncio.gather(
+            *(
+                self.validate(
+                    ValidateRequest(
+                        players=list(chunk),
+                        server_id=request.server_id,
+                        login=request.login,
+                    )
+                )
+                for chunk in chunked(request.players, batch_size)
+            )
+        )
+        return ValidateData(
+            results=[result for part in parts for result in part.results],
+            processed_at=max(part.processed_at for part in parts),
+        )
+
+    async def validate_player(
+        self,
+        server_id: int,
+        player: PlayerValidateInfo,
+        login: bool = True,
+    ) -> PlayerValidateResult:
+        """验证单个玩家.
+
+        短时间窗口内对同一服务器、同一验证类型的并发调用会合并为一次批量验证请求，
+        适合代理端在玩家加入时逐个调用。
+
+        Args:
+            server_id: 服务器ID
+            player: 玩家验证信息
+            login: 是否为登录验证
+
+        Returns:
+            该玩家的验证结果
+        """
+        return await self._validate_batcher.submit((server_id, login), player)
+
+    async def _send_validate_batch(
+        self, key: Tuple[int, bool], players: List[PlayerValidateInfo]
+    ) -> Sequence[PlayerValidateResult]:
+        """发送合并后的验证请求，并按调用顺序返回结果."""
+        server_id, login = key
+        data = await self.validate(
+            ValidateRequest(players=players, server_id=server_id, login=login)
         )
 
+        results = data.results
+        if len(results) == len(players) and all(
+            r.player_name == p.player_name for r, p in zip(results, players)
+        ):
+            return results
+
+        # 服务端未按请求顺序返回时按玩家名对应
+        by_name = {r.player_name: r for r in results}
+        try:
+            return [by_name[p.player_name] for p in players]
+        except KeyError as e:
+            raise NewNanManagerException(
+                f"Validate response is missing result for player {e.args[0]}"
+            ) from e
+
+    def validate_batch_stats(self) -> Dict[str, int]:
+        """获取玩家验证批处理统计信息.
+
+        Returns:
+            通过 validate_player 提交的玩家数（submitted）和实际发送的批次数（batches）
+        """
+        batcher = self._validate_batcher
+        return {"submitted": batcher.submitted, "batches": batcher.batches}
+
+    async def close(self) -> None:
+        """发送所有收集中的验证请求并等待其完成."""
+        await self._validate_batcher.flush()
+
     async def get_player(self, player_id: int) -> Player:
         """获取玩家详情.
 
@@ -1,12 +1,16 @@
 """Player-server relationship management service."""
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
+from ..batching import CoalescingBuffer
+from ..codec import DecodeMode
 from ..http_client import HttpClient
 from ..models import (
+    OnlinePlayer,
     PlayerServersData,
     ServerPlayersData,
 )
+from ..pagination import iterate_items
 
 
 class PlayerServerService:
@@ -19,6 +23,14 @@ class PlayerServerService:
             http_client: HTTP客户端实例
         """
         self._http_client = http_client
+        config = http_client.config
+        self._offline_buffer: CoalescingBuffer[int, int] = CoalescingBuffer(
+            self._send_players_offline,
+            max_items=config.offline_batch_size,
+            max_delay=config.offline_flush_interval,
+            max_retries=config.offline_max_retries,
+            retry_delay=config.retry_delay,
+        )
 
     async def get_player_servers(
         self, player_id: int, online_only: bool = False
@@ -47,6 +59,8 @@ class PlayerServerService:
         search: Optional[str] = None,
         server_id: Optional[int] = None,
         online_only: bool = False,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> ServerPlayersData:
         """获取全局在线玩家.
 
@@ -56,6 +70,7 @@ class PlayerServerService:
             search: 搜索玩家名
             server_id: 服务器ID过滤
             online_only: 仅显示在线玩家
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             服务器玩家数据
@@ -69,10 +84,50 @@ class PlayerServerService:
             params["online_only"] = online_only
 
         result = await self._http_client.get(
-            "/api/v1/server-players", params=params, response_model=ServerPlayersData
+            "/api/v1/server-players",
+            params=params,
+            response_model=ServerPlayersData,
+            decode_mode=decode_mode,
         )
         return result  # type: ignore
 
+    def iter_server_players(
+        self,
+        search: Optional[str] = None,
+        server_id: Optional[int] = None,
+        online_only: bool = False,
+        *,
+        page_size: int = 100,
+        prefetch: int = 2,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> AsyncIterator[OnlinePlayer]:
+        """遍历全部服务器玩家（自动翻页并预取后续页，按玩家和服务器去重）.
+
+        Args:
+            search: 搜索玩家名
+            server_id: 服务器ID过滤
+            online_only: 仅显示在线玩家
+            page_size: 每页大小
+            prefetch: 预取的页数
+            decode_mode: 响应解码模式，None表示使用客户端配置
+
+        Returns:
+            服务器玩家异步迭代器
+        """
+        return iterate_items(
+            lambda page, size: self.get_server_players(
+                page=page,
+                page_size=size,
+                search=search,
+                server_id=server_id,
+                online_only=online_only,
+                decode_mode=decode_mode,
+            ),
+            key=("player_id", "server_id"),
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
     async def set_players_offline(
         self, server_id: int, player_ids: list[int]
     ) -> dict[str, Any]:
@@ -89,3 +144,39 @@ class PlayerServerService:
             "/api/v1/servers/players/offline",
             json_data={"server_id": server_id, "player_ids": player_ids},
         )
+
+    def queue_players_offline(self, server_id: int, player_ids: Iterable[int]) -> None:
+        """将玩家加入离线缓冲区，合并后批量设置离线状态.
+
+        同一服务器的离线玩家在缓冲区中合并，缓冲达到 ``offline_batch_size``、
+        等待超过 ``offline_flush_interval`` 或客户端关闭时发送，失败时自动重试。
+        适合在玩家退出事件中逐个调用。
+
+        Args:
+            server_id: 服务器ID
+            player_ids: 玩家ID列表
+        """
+        self._offline_buffer.add(server_id, player_ids)
+
+    async def flush_offline(self) -> None:
+        """立即发送离线缓冲区中的全部玩家，并等待发送完成."""
+        await self._offline_buffer.flush()
+
+    async def _send_players_offline(
+        self, server_id: int, player_ids: List[int]
+    ) -> None:
+        await self.set_players_offline(server_id, player_ids)
+
+    def offline_stats(self) -> Dict[str, int]:
+        """获取离线缓冲区统计信息.
+
+        Returns:
+            成功发送的批次数（sent）、重试耗尽后丢弃的玩家数（dropped）
+            和缓冲中的玩家数（pending）
+        """
+        buffer = self._offline_buffer
+        return {"sent": buffer.sent, "dropped": buffer.dropped, "pending": len(buffer)}
+
+    async def close(self) -> None:
+        """发送离线缓冲区中的剩余玩家并等待完成."""
+        await self._offline_buffer.close()
@@ -1,7 +1,8 @@
 """Server management service."""
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from ..codec import DecodeMode
 from ..http_client import HttpClient
 from ..models import (
     CreateServerRequest,
@@ -10,6 +11,7 @@ from ..models import (
     ServersListData,
     UpdateServerRequest,
 )
+from ..pagination import iterate_items
 
 
 class ServerService:
@@ -29,6 +31,8 @@ class ServerService:
         page_size: Optional[int] = None,
         search: Optional[str] = None,
         online_only: Optional[bool] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> ServersListData:
         """获取服务器列表.
 
@@ -37,6 +41,7 @@ class ServerService:
             page_size: 每页大小
             search: 搜索关键词
             online_only: 仅显示在线服务器
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             服务器列表数据
@@ -52,6 +57,41 @@ class ServerService:
             "/api/v1/servers",
             params=params,
             response_model=ServersListData,
+            decode_mode=decode_mode,
+        )
+
+    def iter_servers(
+        self,
+        search: Optional[str] = None,
+        online_only: Optional[bool] = None,
+        *,
+        page_size: int = 100,
+        prefetch: int = 2,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> AsyncIterator[ServerRegistry]:
+        """遍历全部服务器（自动翻页并预取后续页，按ID去重）.
+
+        Args:
+            search: 搜索关键词
+            online_only: 仅显示在线服务器
+            page_size: 每页大小
+            prefetch: 预取的页数
+            decode_mode: 响应解码模式，None表示使用客户端配置
+
+        Returns:
+            服务器异步迭代器
+        """
+        return iterate_items(
+            lambda page, size: self.list_servers(
+                page=page,
+                page_size=size,
+                search=search,
+                online_only=online_only,
+                decode_mode=decode_mode,
+            ),
+            key="id",
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def create_server(
@@ -1,5 +1,8 @@
 """Token management service."""
 
+from typing import AsyncIterator, Optional
+
+from ..codec import DecodeMode
 from ..http_client import HttpClient
 from ..models import (
     ApiToken,
@@ -8,6 +11,7 @@ from ..models import (
     ListApiTokensData,
     UpdateApiTokenRequest,
 )
+from ..pagination import iterate_items
 
 
 class TokenService:
@@ -22,13 +26,18 @@ class TokenService:
         self._http = http_client
 
     async def list_api_tokens(
-        self, page: int = 1, page_size: int = 20
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> ListApiTokensData:
         """获取API Token列表.
 
         Args:
             page: 页码
             page_size: 每页数量
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             Token列表数据
@@ -38,6 +47,35 @@ class TokenService:
             "/api/v1/tokens",
             params=params,
             response_model=ListApiTokensData,
+            decode_mode=decode_mode,
+        )
+
+    def iter_api_tokens(
+        self,
+        *,
+        page_size: int = 100,
+        prefetch: int = 2,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> AsyncIterator[ApiToken]:
+        """遍历全部API Token（自动翻页并预取后续页，按ID去重）.
+
+        Token列表响应不包含总数，某页数量不足 ``page_size`` 时结束。
+
+        Args:
+            page_size: 每页大小
+            prefetch: 预取的页数
+            decode_mode: 响应解码模式，None表示使用客户端配置
+
+        Returns:
+            Token异步迭代器
+        """
+        return iterate_items(
+            lambda page, size: self.list_api_tokens(
+                page=page, page_size=size, decode_mode=decode_mode
+            ),
+            key="id",
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def create_api_token(
@@ -1,7 +1,8 @@
 """Town management service."""
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from ..codec import DecodeMode
 from ..http_client import HttpClient
 from ..models import (
     CreateTownRequest,
@@ -10,6 +11,7 @@ from ..models import (
     TownDetailResponse,
     UpdateTownRequest,
 )
+from ..pagination import iterate_items
 
 
 class TownService:
@@ -30,6 +32,8 @@ class TownService:
         search: Optional[str] = None,
         min_level: Optional[int] = None,
         max_level: Optional[int] = None,
+        *,
+        decode_mode: Optional[DecodeMode] = None,
     ) -> TownsListData:
         """获取城镇列表.
 
@@ -39,6 +43,7 @@ class TownService:
             search: 搜索关键词
             min_level: 最小等级
             max_level: 最大等级
+            decode_mode: 响应解码模式，None表示使用客户端配置
 
         Returns:
             城镇列表数据
@@ -60,6 +65,44 @@ class TownService:
             "/api/v1/towns",
             params=params,
             response_model=TownsListData,
+            decode_mode=decode_mode,
+        )
+
+    def iter_towns(
+        self,
+        search: Optional[str] = None,
+        min_level: Optional[int] = None,
+        max_level: Optional[int] = None,
+        *,
+        page_size: int = 100,
+        prefetch: int = 2,
+        decode_mode: Optional[DecodeMode] = None,
+    ) -> AsyncIterator[Town]:
+        """遍历全部城镇（自动翻页并预取后续页，按ID去重）.
+
+        Args:
+            search: 搜索关键词
+            min_level: 最小等级
+            max_level: 最大等级
+            page_size: 每页大小
+            prefetch: 预取的页数
+            decode_mode: 响应解码模式，None表示使用客户端配置
+
+        Returns:
+            城镇异步迭代器
+        """
+        return iterate_items(
+            lambda page, size: self.list_towns(
+                page=page,
+                page_size=size,
+                search=search,
+                min_level=min_level,
+                max_level=max_level,
+                decode_mode=decode_mode,
+            ),
+            key="id",
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
     async def create_town(
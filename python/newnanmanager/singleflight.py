@@ -0,0 +1,92 @@
+"""Single-flight request coalescing for NewNanManager SDK."""
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """合并相同键的并发调用，使其共享同一次执行结果.
+
+    第一个调用者启动实际任务，之后在任务完成前到达的相同键调用直接等待该任务。
+    所有调用者拿到的是同一个结果对象，调用方应将其视为只读。
+    :meth:`forget` 使之后的调用不再加入已在执行的任务，
+    用于写操作后避免拿到写入前的结果。
+    """
+
+    def __init__(self) -> None:
+        """初始化合并器."""
+        self._calls: Dict[Hashable, "asyncio.Future[T]"] = {}
+        self._paths: Dict[Hashable, str] = {}  # 合并键 -> 关联的资源路径
+        self.calls = 0  # 实际发起的执行次数
+        self.shared = 0  # 被合并（未实际执行）的调用次数
+
+    def __len__(self) -> int:
+        """当前正在执行的键数量."""
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[T]],
+        path: Optional[str] = None,
+    ) -> T:
+        """执行或加入一次调用.
+
+        Args:
+            key: 合并键
+            func: 实际执行的协程工厂
+            path: 调用关联的资源路径，供 :meth:`forget` 匹配
+
+        Returns:
+            调用结果
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            if path is not None:
+                self._paths[key] = path
+            self.calls += 1
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.shared += 1
+
+        # shield: 单个调用者被取消时不影响其他等待同一结果的调用者
+        return await asyncio.shield(task)
+
+    def forget(self, predicate: Callable[[str], bool]) -> int:
+        """使关联路径匹配的调用不再被合并.
+
+        已在执行的任务继续运行并把结果交给已加入的调用者，之后到达的相同键调用会重新执行。
+
+        Args:
+            predicate: 参数为资源路径的判断函数
+
+        Returns:
+            不再合并的键数量
+        """
+        keys = [key for key, path in self._paths.items() if predicate(path)]
+        for key in keys:
+            del self._calls[key]
+            del self._paths[key]
+        return len(keys)
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """任务完成后移除键."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            self._paths.pop(key, None)
+        if not task.cancelled():
+            # 所有调用者都已取消时避免 "exception was never retrieved" 警告
+            task.exception()
@@ -0,0 +1,192 @@
+"""Slow request logging for NewNanManager SDK."""
+
+import logging
+import os
+import random
+import time
+from typing import Dict, List, Optional
+
+from .hooks import CallSite, HookEvent, Hooks, RequestInfo
+from .metrics import PHASES
+
+logger = logging.getLogger("newnanmanager.slow")
+
+
+def format_call_site(call_site: Optional[CallSite]) -> str:
+    """将调用栈格式化为单行文本.
+
+    Args:
+        call_site: 调用栈帧列表（由近及远）
+
+    Returns:
+        形如 ``bot.py:42 in on_join <- main.py:10 in run`` 的文本
+    """
+    if not call_site:
+        return "<unknown>"
+    return " <- ".join(
+        f"{os.path.basename(filename)}:{lineno} in {func}"
+        for filename, lineno, func in call_site
+    )
+
+
+class SlowRequestLog:
+    """记录超过耗时阈值的请求.
+
+    作为请求钩子安装到 :class:`Hooks`，对超过阈值的尝试（含超时）输出一条 WARNING 日志，
+    包括端点模板、状态码、总耗时及DNS、建连、首字节、读取、解码各阶段耗时、
+    请求和响应体大小，以及SDK外部发起调用的代码位置。
+    只检查按 ``sample_rate`` 采样的调用，未被采样的调用也不捕获调用栈；
+    日志另按令牌桶限速，被抑制的条数会在下一条日志中报告。
+    """
+
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        thresholds: Optional[Dict[str, float]] = None,
+        stack_depth: int = 3,
+        max_per_minute: int = 60,
+        log: Optional[logging.Logger] = None,
+        sample_rate: float = 1.0,
+    ) -> None:
+        """初始化慢请求日志.
+
+        Args:
+            threshold: 默认耗时阈值（秒）
+            thresholds: 按端点模板覆盖的阈值，如 ``{"/api/v1/players/{id}": 0.2}``
+            stack_depth: 记录的调用栈帧数，0表示不捕获调用位置
+            max_per_minute: 每分钟最多输出的日志条数
+            log: 输出日志的logger，默认为 ``newnanmanager.slow``
+            sample_rate: 检查的调用比例（0~1）
+        """
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+        self.stack_depth = stack_depth
+        self.max_per_minute = max_per_minute
+        self.sample_rate = sample_rate
+        self._logger = log or logger
+        self._tokens = float(max_per_minute)
+        self._refilled_at = time.monotonic()
+        self._hooks: List[Hooks] = []
+        self.logged = 0  # 输出的日志条数
+        self.suppressed = 0  # 因限速未输出的慢请求数
+        self._suppressed_since_last = 0
+
+    def install(self, hooks: Hooks) -> "SlowRequestLog":
+        """安装到钩子注册表.
+
+        Args:
+            hooks: 钩子注册表
+
+        Returns:
+            自身（便于链式调用）
+        """
+        hooks.register(HookEvent.AFTER_RESPONSE, self._on_response)
+        hooks.register(HookEvent.ON_RETRY, self._on_failure)
+        hooks.register(HookEvent.ON_ERROR, self._on_failure)
+        if self.stack_depth:
+            if not hooks.call_site_depth:
+                hooks.call_site_sample_rate = self.sample_rate
+            else:
+                hooks.call_site_sample_rate = max(
+                    hooks.call_site_sample_rate, self.sample_rate
+                )
+            hooks.call_site_depth = max(hooks.call_site_depth, self.stack_depth)
+        self._hooks.append(hooks)
+        return self
+
+    def uninstall(self, hooks: Hooks) -> None:
+        """从钩子注册表卸载.
+
+        Args:
+            hooks: 钩子注册表
+
+        Raises:
+            ValueError: 未安装到该注册表
+        """
+        self._hooks.remove(hooks)
+        hooks.unregister(HookEvent.AFTER_RESPONSE, self._on_response)
+        hooks.unregister(HookEvent.ON_RETRY, self._on_failure)
+        hooks.unregister(HookEvent.ON_ERROR, self._on_failure)
+        if self.stack_depth and hooks.call_site_depth == self.stack_depth:
+            hooks.call_site_depth = 0
+            hooks.call_site_sample_rate = 1.0
+
+    def threshold_for(self, template: str) -> float:
+        """端点模板对应的耗时阈值（秒）."""
+        return self.thresholds.get(template, self.threshold)
+
+    def _on_response(self, info: RequestInfo) -> None:
+        self._check(info)
+
+    def _on_failure(self, info: RequestInfo) -> None:
+        # 收到响应的尝试已在 after_response 中检查，这里只处理超时等没有响应的情况
+        if info.status == 0:
+            self._check(info)
+
+    def _sampled(self, info: RequestInfo) -> bool:
+        """调用是否被采样."""
+        if self.sample_rate >= 1.0:
+            return True
+        if self.stack_depth:
+            # 采样在发起调用时决定：只有被采样的调用捕获了调用栈
+            return info.call_site is not None
+        return random.random() < self.sample_rate
+
+    def _check(self, info: RequestInfo) -> None:
+        elapsed = info.elapsed
+        if elapsed is None or elapsed < self.threshold_for(info.template):
+            return
+        if not self._sampled(info):
+            return
+        if not self._acquire():
+            self.suppressed += 1
+            self._suppressed_since_last += 1
+            return
+        self.logged += 1
+        self._logger.warning(self.format(info))
+
+    def _acquire(self) -> bool:
+        """按令牌桶限速."""
+        now = time.monotonic()
+        rate = self.max_per_minute / 60.0
+        self._tokens = min(
+            float(self.max_per_minute), self._tokens + (now - self._refilled_at) * rate
+        )
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def format(self, info: RequestInfo) -> str:
+        """生成一条慢请求日志.
+
+        Args:
+            info: 请求信息
+
+        Returns:
+            日志文本
+        """
+        timing = info.timing
+        status = str(info.status) if info.status else "no response"
+        if timing.timed_out:
+            status = "timeout"
+        phases = ", ".join(
+            f"{phase}={getattr(timing, phase) * 1000:.1f}ms"
+            for phase in PHASES
+            if getattr(timing, phase) is not None
+        )
+        response_bytes = (
+            f"{info.response_bytes} B" if info.response_bytes is not None else "-"
+        )
+        message = (
+            f"Slow request: {info.method} {info.template} -> {status} "
+            f"in {info.elapsed or 0.0:.3f}s (attempt {info.attempt}"
+            f"{', ' + phases if phases else ''}; "
+            f"sent {info.request_bytes} B, received {response_bytes}) "
+            f"called from {format_call_site(info.call_site)}"
+        )
+        if self._suppressed_since_last:
+            message += f" [{self._suppressed_since_last} similar suppressed]"
+            self._suppressed_since_last = 0
+        return message
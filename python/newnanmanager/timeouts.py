@@ -0,0 +1,113 @@
+"""Per-call deadlines and timeout profiles for NewNanManager SDK."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+import aiohttp
+
+from .config import ClientConfig, TimeoutProfile
+
+# 当前调用链的绝对期限（time.monotonic）
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    "newnanmanager_deadline", default=None
+)
+# 当前调用链强制使用的超时配置档名称
+_profile: ContextVar[Optional[str]] = ContextVar(
+    "newnanmanager_timeout_profile", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """为代码块内的所有SDK调用设置整体期限（包括全部重试和退避）.
+
+    可以嵌套，内层期限不会晚于外层期限。期限到达时调用抛出 TimeoutException。
+
+    Args:
+        seconds: 从现在起的期限（秒）
+    """
+    at = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(at if outer is None else min(at, outer))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def timeout_profile(name: str) -> Iterator[None]:
+    """代码块内的所有SDK调用使用指定的超时配置档.
+
+    Args:
+        name: ``ClientConfig.timeout_profiles`` 中的配置档名称
+    """
+    token = _profile.set(name)
+    try:
+        yield
+    finally:
+        _profile.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """当前调用链的绝对期限（time.monotonic），未设置时返回None."""
+    return _deadline.get()
+
+
+def resolve_profile(
+    config: ClientConfig, method: str, template: str
+) -> Optional[TimeoutProfile]:
+    """查找请求适用的超时配置档.
+
+    优先级：:func:`timeout_profile` > ``endpoint_timeouts`` 中的 "方法 端点模板" >
+    端点模板 > 名为 default 的配置档。
+
+    Args:
+        config: 客户端配置
+        method: HTTP方法
+        template: 端点模板
+
+    Returns:
+        超时配置档，没有适用的配置档时返回None
+
+    Raises:
+        KeyError: 配置档名称不存在
+    """
+    name = _profile.get()
+    if name is None:
+        name = config.endpoint_timeouts.get(f"{method} {template}")
+    if name is None:
+        name = config.endpoint_timeouts.get(template)
+    if name is None:
+        return config.timeout_profiles.get("default")
+    return config.timeout_profiles[name]
+
+
+def attempt_timeout(
+    config: ClientConfig,
+    profile: Optional[TimeoutProfile],
+    remaining: Optional[float],
+) -> Optional[aiohttp.ClientTimeout]:
+    """计算单次尝试的超时.
+
+    Args:
+        config: 客户端配置
+        profile: 超时配置档
+        remaining: 距离整体期限的剩余时间（秒），None表示没有期限
+
+    Returns:
+        aiohttp 超时设置，None表示使用会话的默认超时
+    """
+    if profile is None and remaining is None:
+        return None
+    total = config.timeout
+    connect = read = None
+    if profile is not None:
+        if profile.total is not None:
+            total = profile.total
+        connect, read = profile.connect, profile.read
+    if remaining is not None:
+        total = min(total, remaining)
+    return aiohttp.ClientTimeout(total=total, connect=connect, sock_read=read)
@@ -0,0 +1,116 @@
+"""Connector construction and transport tuning for NewNanManager SDK."""
+
+import inspect
+import socket
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+import aiohttp
+
+from .config import ClientConfig, TransportConfig
+
+# 当前 aiohttp 版本的 TCPConnector 支持的参数（happy_eyeballs_delay、interleave
+# 需要 aiohttp 3.10+，socket_factory 需要 3.12+）
+_CONNECTOR_PARAMS = frozenset(inspect.signature(aiohttp.TCPConnector).parameters)
+
+_FAMILIES = {4: socket.AF_INET, 6: socket.AF_INET6}
+
+SocketOption = Tuple[int, int, int]
+
+
+def _socket_factory(options: Sequence[SocketOption]) -> Callable[[Any], socket.socket]:
+    """创建设置了套接字选项的 socket_factory."""
+
+    def factory(addr_info: Any) -> socket.socket:
+        family, type_, proto, _, _ = addr_info
+        sock = socket.socket(family=family, type=type_, proto=proto)
+        try:
+            for level, option, value in options:
+                sock.setsockopt(level, option, value)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    return factory
+
+
+def socket_options(transport: TransportConfig) -> Tuple[SocketOption, ...]:
+    """连接使用的全部套接字选项.
+
+    Args:
+        transport: 连接器配置
+
+    Returns:
+        (level, option, value) 列表
+    """
+    options = tuple(transport.socket_options)
+    if transport.tcp_keepalive:
+        options = ((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),) + options
+    return options
+
+
+def connector_kwargs(config: ClientConfig) -> Dict[str, Any]:
+    """根据客户端配置生成 aiohttp.TCPConnector 的参数.
+
+    与默认值相同的版本相关参数不会传入，旧版本 aiohttp 仍可使用默认配置。
+
+    Args:
+        config: 客户端配置
+
+    Returns:
+        TCPConnector 的关键字参数
+
+    Raises:
+        ValueError: 配置无效，或需要的参数不被当前 aiohttp 版本支持
+    """
+    transport = config.transport
+    kwargs: Dict[str, Any] = {
+        "limit": config.connection_pool_size,
+        "limit_per_host": config.connection_pool_size_per_host,
+        "verify_ssl": config.verify_ssl,
+        "use_dns_cache": transport.use_dns_cache,
+        "ttl_dns_cache": transport.ttl_dns_cache,
+        "keepalive_timeout": (
+            None if transport.force_close else transport.keepalive_timeout
+        ),
+        "force_close": transport.force_close,
+        "enable_cleanup_closed": transport.enable_cleanup_closed,
+        "local_addr": transport.local_addr,
+    }
+    if transport.ip_version is not None:
+        family = _FAMILIES.get(transport.ip_version)
+        if family is None:
+            raise ValueError(
+                f"Unsupported IP version {transport.ip_version}, expected 4 or 6"
+            )
+        kwargs["family"] = family
+
+    defaults = TransportConfig()
+    optional: Dict[str, Any] = {
+        "happy_eyeballs_delay": transport.happy_eyeballs_delay,
+        "interleave": transport.interleave,
+    }
+    options = socket_options(transport)
+    if options:
+        optional["socket_factory"] = _socket_factory(options)
+    for name, value in optional.items():
+        if name in _CONNECTOR_PARAMS:
+            kwargs[name] = value
+        elif name == "socket_factory" or value != getattr(defaults, name):
+            raise ValueError(
+                f"TransportConfig option '{name}' requires a newer aiohttp version "
+                f"(installed: {aiohttp.__version__})"
+            )
+    return kwargs
+
+
+def build_connector(config: ClientConfig) -> aiohttp.TCPConnector:
+    """根据客户端配置创建连接器.
+
+    Args:
+        config: 客户端配置
+
+    Returns:
+        TCPConnector
+    """
+    return aiohttp.TCPConnector(**connector_kwargs(config))
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from functools import lru_cache
 from typing import Callable, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -94,3 +95,26 @@ def format_duration(seconds: float) -> str:
         minutes = int(seconds // 60)
         remaining_seconds = seconds % 60
         return f"{minutes}m{remaining_seconds:.1f}s"
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """将具体端点路径归一化为模板，用于按端点聚合策略和统计.
+
+    例如 ``/api/v1/players/123`` -> ``/api/v1/players/{id}``，
+    ``/api/v1/ips/1.2.3.4`` -> ``/api/v1/ips/{ip}``。
+
+    Args:
+        endpoint: API端点（可包含查询参数）
+
+    Returns:
+        端点模板
+    """
+    path = endpoint.split("?", 1)[0]
+    segments = path.split("/")
+    for i, segment in enumerate(segments):
+        if segment.isdigit():
+            segments[i] = "{id}"
+        elif "." in segment or ":" in segment:
+            segments[i] = "{ip}"
+    return "/".join(segments)